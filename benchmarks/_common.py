@@ -0,0 +1,15 @@
+# -*- coding: utf-8 -*-
+"""
+Kıyaslama betikleri için ortak yardımcılar.
+
+Betikler depo kökünden çalıştırılır:  python3 benchmarks/bench_startup.py
+"""
+
+import os
+import sys
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'filenamefixer.3.0.0', 'usr', 'share', 'filenamefixer')
+
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
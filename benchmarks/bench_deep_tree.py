@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Derin bir ağaçta tarama ve adlandırmanın çekirdeğe çözdürdüğü yol
+bileşeni sayısını ölçer.
+
+Tam yollarla çalışan eski yöntem (dizin başına os.scandir(yol), öğe başına
+os.path.exists + os.rename(tam yol, tam yol)) ile dizin tanımlayıcılarına
+göreli çalışan fixcore.scan_tree + apply_renames karşılaştırılır. Her
+çağrıda yol argümanının bileşen sayısı toplanır: mutlak bir yol bütün
+bileşenleri, dir_fd'ye göreli bir ad tek bileşeni, tanımlayıcı hiçbirini
+çözdürür (renameat2 çağrıları da sayılır). NFS gibi ağ dosya
+sistemlerinde her bileşen bir önbellek yoklaması ya da gidiş-dönüştür.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from _common import PACKAGE_DIR  # noqa: F401  (sys.path ayarı)
+from fixcore import NameRules, apply_renames, plan_directory, plan_renames, renamer, scan_tree
+from fixcore.scanner import list_dir
+
+DEPTH = 40
+FILES_PER_DIR = 50
+MAX_LEN = 40
+
+def build_tree(root):
+    directory = root
+    for level in range(DEPTH):
+        directory = os.path.join(directory, f"seviye_{level:02d}")
+        os.mkdir(directory)
+        for f in range(FILES_PER_DIR):
+            name = f"rapor:{f}?.txt" if f % 5 == 0 else f"dosya_{f}.txt"
+            open(os.path.join(directory, name), 'w').close()
+
+class LookupCounter:
+    """os çağrılarını sarar; yol argümanlarının bileşenlerini sayar."""
+
+    NAMES = ('open', 'scandir', 'stat', 'lstat', 'rename')
+
+    def __init__(self):
+        self.calls = 0
+        self.components = 0
+        self._saved = {}
+
+    def __enter__(self):
+        for name in self.NAMES:
+            original = getattr(os, name)
+            self._saved[name] = original
+            setattr(os, name, self._wrap(original))
+        # Adlandırmalar os.rename yerine ctypes üzerinden renameat2 ile yapılabilir
+        self._renameat2 = renamer._load_renameat2()
+        if self._renameat2:
+            func, get_errno = self._renameat2
+
+            def counted(src_fd, src, dst_fd, dst, flags):
+                self.calls += 1
+                self.components += 2
+                return func(src_fd, src, dst_fd, dst, flags)
+            renamer._renameat2 = (counted, get_errno)
+        return self
+
+    def __exit__(self, *exc):
+        for name, original in self._saved.items():
+            setattr(os, name, original)
+        if self._renameat2:
+            renamer._renameat2 = self._renameat2
+
+    def _count(self, path, dir_fd):
+        if isinstance(path, int):
+            return 0
+        path = os.fspath(path)
+        if dir_fd is None and not os.path.isabs(path):
+            path = os.path.join(os.getcwd(), path)
+        return len([part for part in path.split(os.sep) if part])
+
+    def _wrap(self, original):
+        def counted(*args, **kwargs):
+            self.calls += 1
+            # os.rename'in iki yolu vardır
+            self.components += self._count(args[0], kwargs.get('dir_fd', kwargs.get('src_dir_fd')))
+            if len(args) > 1 and not isinstance(args[1], int):
+                self.components += self._count(args[1], kwargs.get('dst_dir_fd'))
+            return original(*args, **kwargs)
+        return counted
+
+def legacy_scan(start_path):
+    """Tam yollarla tarama (dizin başına os.scandir(yol))."""
+    rules = NameRules(MAX_LEN)
+    stack = [(start_path, 0)]
+    while stack:
+        root, depth = stack.pop()
+        dirs, files = list_dir(root)
+        yield from plan_directory(dirs, files, rules, depth=depth)
+        stack.extend((entry.path, depth + 1) for entry in reversed(dirs) if not entry.is_symlink())
+
+def legacy_apply(items):
+    """Tam yollarla adlandırma (öğe başına os.path.exists + os.rename)."""
+    for full_path, new_full_path in plan_renames(items):
+        if os.path.exists(full_path):
+            os.rename(full_path, new_full_path)
+
+def measure(label, scan, apply, root):
+    with LookupCounter() as counter:
+        start = time.perf_counter()
+        items = list(scan(root))
+        scanned = counter.components
+        apply(items)
+        elapsed = time.perf_counter() - start
+    print(f"{label:8s}: {len(items):5d} findings, {counter.calls:6d} calls, "
+          f"{scanned:7d} + {counter.components - scanned:7d} path components "
+          f"(scan + apply), {elapsed * 1000:.1f} ms")
+    return counter.components
+
+def main():
+    parent = tempfile.mkdtemp(prefix='fnf_bench_')
+    try:
+        results = []
+        for label, scan, apply in (('paths', legacy_scan, legacy_apply),
+                                   ('dir_fd', lambda r: scan_tree(r, max_len=MAX_LEN), apply_renames)):
+            root = os.path.join(parent, label)
+            os.mkdir(root)
+            build_tree(root)
+            results.append(measure(label, scan, apply, root))
+        print(f"path components resolved: {results[1] / results[0]:.1%} of the path-based walk")
+    finally:
+        shutil.rmtree(parent)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
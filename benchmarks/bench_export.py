@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bulguların akış halinde dışa aktarılmasının hızını ve bellek kullanımını ölçer.
+
+Sentetik bulgular (dosya sistemine dokunmadan) her biçimde dosyaya yazılır;
+tracemalloc ile ölçülen en yüksek bellek bulgu sayısından bağımsız
+kalmalıdır. Süreye bulguları üreten üretecin maliyeti de dahildir. Bulgu
+sayısı ilk argümanla verilir (varsayılan 1.000.000).
+
+    python3 benchmarks/bench_export.py [BULGU_SAYISI]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from _common import PACKAGE_DIR  # noqa: F401  (sys.path ayarı)
+from fixcore import TYPE_FILE, export_findings
+
+def findings(count):
+    for i in range(count):
+        directory = f"/srv/paylaşım/klasör_{i // 1000:05d}"
+        name = f"rapor:{i}?.txt"
+        yield f"{directory}/{name}", name, f"rapor{i}.txt", TYPE_FILE, 2
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    base = tempfile.mkdtemp(prefix='fnf_bench_')
+    try:
+        for file_name in ('findings.jsonl', 'findings.csv', 'findings.jsonl.gz', 'findings.csv.gz'):
+            path = os.path.join(base, file_name)
+            start = time.perf_counter()
+            written = export_findings(findings(count), path)
+            elapsed = time.perf_counter() - start
+            # tracemalloc yazmayı çok yavaşlatır; bellek ayrı bir geçişte ölçülür
+            tracemalloc.start()
+            export_findings(findings(count), path)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{file_name:18s}: {elapsed:6.2f} s, {written / elapsed:9.0f} findings/s, "
+                  f"{os.path.getsize(path) / 2**20:7.1f} MiB, peak memory {peak / 2**20:5.1f} MiB")
+    finally:
+        shutil.rmtree(base)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Sonuç tablosunun modelini çok sayıda bulguyla ölçer (PyQt6 gerekir).
+
+gui.ResultTableModel bir fixcore.ResultStore üzerinde kurulur ve ekranda
+gösterilmeyen bir QTableView'a bağlanır. Bulgular tarayıcının teslim
+ettiği gibi gui.RESULT_BATCH_SIZE'lık gruplar halinde eklenir; ardından
+rowCount, her sütuna göre sıralama, süzme (süzgeç etkinken ekleme dahil)
+ve süzgecin kaldırılması ayrı ayrı ölçülür. Ekran gerekmez.
+
+    python3 benchmarks/bench_gui_results.py [BULGU_SAYISI]
+"""
+
+import os
+import sys
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+from _common import PACKAGE_DIR  # noqa: F401  (sys.path ayarı)
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication, QTableView
+
+from fixcore import TYPE_DIR, TYPE_FILE, ResultStore
+import gui
+
+FILES_PER_DIR = 1000
+ROOT = '/srv/arsiv/projeler/2024/musteri_dosyalari'
+ROW_COUNT_CALLS = 100_000
+
+def findings(start, count):
+    """bench_store_memory ile aynı biçimde bulgular üretir."""
+    for i in range(start, start + count):
+        parent = os.path.join(ROOT, f"klasör_{i // FILES_PER_DIR:05d}", "alt klasör")
+        name = f"toplantı notları: {i}?.docx"
+        item_type = TYPE_DIR if i % 50 == 0 else TYPE_FILE
+        yield os.path.join(parent, name), name, f"toplantı notları {i}.docx", item_type, 6
+
+def append_all(model, start, count):
+    batch = gui.RESULT_BATCH_SIZE
+    for offset in range(start, start + count, batch):
+        model.append_items(list(findings(offset, min(batch, start + count - offset))))
+
+def timed(label, func, rows=None):
+    begin = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - begin
+    suffix = f", {rows:,} rows" if rows is not None else ""
+    print(f"{label:22s}: {elapsed * 1000:9.1f} ms{suffix}")
+    return elapsed
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    app = QApplication(sys.argv)  # noqa: F841
+    store = ResultStore()
+    model = gui.ResultTableModel(store)
+    view = QTableView()
+    view.setModel(model)
+
+    timed("append", lambda: append_all(model, 0, count), count)
+    ok = model.rowCount() == count
+
+    def row_counts():
+        for _ in range(ROW_COUNT_CALLS):
+            model.rowCount()
+
+    elapsed = timed(f"rowCount x{ROW_COUNT_CALLS:,}", row_counts)
+    print(f"{'':22s}  {elapsed / ROW_COUNT_CALLS * 1e6:9.3f} µs/call")
+
+    for column, header in enumerate(gui.ResultTableModel.HEADERS['en']):
+        timed(f"sort {header}", lambda: model.sort(column, Qt.SortOrder.AscendingOrder), count)
+    timed("sort Full Path (desc)", lambda: model.sort(3, Qt.SortOrder.DescendingOrder), count)
+    ok = ok and model.rowCount() == count
+
+    # Tek bir klasörün bulguları: FILES_PER_DIR satır
+    needle = f"klasör_{(count // FILES_PER_DIR) // 2:05d}"
+    timed("filter", lambda: model.set_filter(needle), model.rowCount())
+    ok = ok and model.rowCount() == min(FILES_PER_DIR, count)
+    extra = max(count // 10, 1)
+    timed("append while filtered", lambda: append_all(model, count, extra), extra)
+    timed("clear filter", lambda: model.set_filter(''), count + extra)
+    ok = ok and model.rowCount() == count + extra
+    return 0 if ok else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
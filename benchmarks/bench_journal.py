@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Geri alma günlüğünün yeniden adlandırmaya eklediği süreyi ölçer.
+
+Aynı sentetik ağaç iki kez oluşturulur; biri günlüksüz, biri günlükle
+apply_renames'ten geçirilir. Ardından günlükle yapılan adlandırmalar
+undo_renames ile geri alınır ve ağacın eski haline döndüğü denetlenir.
+Dosya sayısı ilk argümanla verilir (varsayılan 100.000).
+
+    python3 benchmarks/bench_journal.py [DOSYA_SAYISI]
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from _common import PACKAGE_DIR  # noqa: F401  (sys.path ayarı)
+from fixcore import RenameJournal, apply_renames, scan_tree, undo_renames
+
+FILES_PER_DIR = 1000
+
+def build_tree(root, count):
+    for i in range(count):
+        if i % FILES_PER_DIR == 0:
+            sub = os.path.join(root, f"klasör:{i // FILES_PER_DIR:04d}")
+            os.mkdir(sub)
+        open(os.path.join(sub, f"rapor:{i}?.txt"), 'w').close()
+
+def listing(root):
+    return sorted(os.path.relpath(os.path.join(parent, name), root)
+                  for parent, dirs, files in os.walk(root) for name in dirs + files)
+
+def timed_apply(root, journal=None):
+    items = list(scan_tree(root))
+    start = time.perf_counter()
+    fixed, failed = apply_renames(items, journal=journal)
+    return time.perf_counter() - start, fixed, failed
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    base = tempfile.mkdtemp(prefix='fnf_bench_')
+    try:
+        plain_root = os.path.join(base, 'plain')
+        journal_root = os.path.join(base, 'journal')
+        for root in (plain_root, journal_root):
+            os.mkdir(root)
+            build_tree(root, count)
+        original = listing(journal_root)
+
+        plain, fixed, _ = timed_apply(plain_root)
+        print(f"no journal  : {plain:7.2f} s, {fixed} renames")
+        journal_path = os.path.join(base, 'undo.jsonl')
+        with RenameJournal(journal_path) as journal:
+            journaled, fixed, _ = timed_apply(journal_root, journal)
+        print(f"journal     : {journaled:7.2f} s, {fixed} renames "
+              f"({(journaled / plain - 1) * 100:+.1f}%, "
+              f"{os.path.getsize(journal_path) / fixed:.0f} bytes/rename)")
+
+        start = time.perf_counter()
+        restored, failed = undo_renames(journal_path)
+        print(f"undo        : {time.perf_counter() - start:7.2f} s, {restored} restored, {failed} failed")
+        if listing(journal_root) != original:
+            print("HATA: geri alma ağacı eski haline döndürmedi", file=sys.stderr)
+            return 1
+    finally:
+        shutil.rmtree(base)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Ad kurallarının saniyede işlediği ad sayısını ölçer.
+
+Eski yol (her çağrıda ham desenle re.sub/re.search) ile tarama başına bir
+kez derlenen fixcore.NameRules karşılaştırılır. Derlem boyutu ilk
+argümanla verilir (varsayılan 1.000.000 ad).
+
+    python3 benchmarks/bench_rules.py [AD_SAYISI]
+"""
+
+import os
+import re
+import sys
+import time
+
+from _common import PACKAGE_DIR  # noqa: F401  (sys.path ayarı)
+from fixcore import INVALID_WINDOWS_CHARS, NameRules
+
+MAX_LEN = 100
+MISSING_DIR = '/nonexistent-fnf-bench'
+
+def make_corpus(count):
+    samples = [
+        "IMG_{:07d}.jpg",
+        "rapor_{:07d}.pdf",
+        "Şirket Sunumu {:07d}.pptx",
+        "müşteri listesi {:07d}.xlsx",
+        "tatil 😀 {:07d}.mp4",
+        "toplantı: notlar? {:07d}.txt",
+        "son hali. {:07d}",
+        "çok_uzun_" * 15 + "{:07d}.log",
+    ]
+    weights = [40, 30, 10, 10, 3, 3, 2, 2]
+    pattern = [s for s, w in zip(samples, weights) for _ in range(w)]
+    return [pattern[i % len(pattern)].format(i) for i in range(count)]
+
+# --- Eski uygulama (karşılaştırma için, fixcore'dan önceki hali) ---
+
+def legacy_clean_filename(filename):
+    base, ext = os.path.splitext(filename)
+    pattern = r'[^a-zA-Z0-9.\-_çÇğĞıİöÖşŞüÜ\s]'
+    cleaned_base = re.sub(pattern, '', base)
+    cleaned_base = cleaned_base.strip(' .')
+    if not cleaned_base:
+        cleaned_base = "unnamed"
+    return f"{cleaned_base}{ext}"
+
+def legacy_shorten(name, max_len):
+    cleaned_name = legacy_clean_filename(name)
+    cleaned_base, ext = os.path.splitext(cleaned_name)
+    if len(cleaned_base) <= max_len:
+        return cleaned_name
+    shortened_base = cleaned_base[:max_len]
+    new_name = f"{shortened_base}{ext}"
+    counter = 1
+    original_shortened_name = new_name
+    while os.path.exists(os.path.join(MISSING_DIR, new_name)) and new_name != name:
+        new_name = f"{shortened_base}_{counter}{ext}"
+        counter += 1
+        if counter > 999:
+            return original_shortened_name
+    return new_name
+
+def legacy(corpus):
+    found = 0
+    for name in corpus:
+        proposed = legacy_shorten(name, MAX_LEN)
+        if proposed != name or len(name) > MAX_LEN or \
+           re.search(INVALID_WINDOWS_CHARS, name) or \
+           name.endswith(' ') or name.endswith('.'):
+            found += 1
+    return found
+
+def compiled(corpus):
+    rules = NameRules(MAX_LEN)
+    propose = rules.propose
+    needs_fix = rules.needs_fix
+    found = 0
+    for name in corpus:
+        if needs_fix(name, propose(name, False, None, MISSING_DIR)):
+            found += 1
+    return found
+
+def fast_path(corpus):
+    rules = NameRules(MAX_LEN)
+    is_clean = rules.is_clean
+    propose = rules.propose
+    needs_fix = rules.needs_fix
+    found = 0
+    for name in corpus:
+        if is_clean(name):
+            continue
+        if needs_fix(name, propose(name, False, None, MISSING_DIR)):
+            found += 1
+    return found
+
+def run(label, func, corpus):
+    start = time.perf_counter()
+    found = func(corpus)
+    elapsed = time.perf_counter() - start
+    print(f"{label:9s}: {len(corpus) / elapsed:12,.0f} names/s  ({elapsed:.2f} s, {found} findings)")
+    return found
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    corpus = make_corpus(count)
+    before = run('legacy', legacy, corpus)
+    after = run('NameRules', compiled, corpus)
+    fast = run('is_clean', fast_path, corpus)
+    # NFC normalleştirmesi yüzünden sayılar yalnızca ayrışık adlarda farklılaşır
+    return 0 if before == after == fast else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Önbellekli yeniden taramanın kazancını ölçer.
+
+Sentetik ağaç önbelleksiz, ardından boş önbellekle (kayıtlar yazılırken)
+ve dolu önbellekle taranır; son olarak tek bir dizin değiştirilip yeniden
+taranır. Tüm taramaların bulguları aynı olmalıdır.
+
+    python3 benchmarks/bench_scan_cache.py
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from _common import PACKAGE_DIR  # noqa: F401  (sys.path ayarı)
+from fixcore import ScanCache, ScanStats, scan_tree
+
+DIRS = 200
+FILES_PER_DIR = 500
+
+def build_tree(root):
+    # mtime'lar önbelleğin bekleme süresinden eski olsun
+    old = time.time() - 3600
+    for d in range(DIRS):
+        sub = os.path.join(root, f"klasör_{d // 20:02d}", f"alt:{d:03d}")
+        os.makedirs(sub, exist_ok=True)
+        for f in range(FILES_PER_DIR):
+            name = f"rapor:{f}?.txt" if f % 10 == 0 else f"dosya_{f}.txt"
+            open(os.path.join(sub, name), 'w').close()
+    for parent, _dirs, _files in os.walk(root):
+        os.utime(parent, (old, old))
+
+def measure(label, root, cache=None):
+    stats = ScanStats()
+    start = time.perf_counter()
+    found = list(scan_tree(root, stats=stats, cache=cache))
+    elapsed = time.perf_counter() - start
+    print(f"{label:14s}: {elapsed * 1000:8.1f} ms, {len(found)} findings, "
+          f"{stats.cached}/{stats.directories} directories from cache")
+    return found
+
+def main():
+    base = tempfile.mkdtemp(prefix='fnf_bench_')
+    try:
+        root = os.path.join(base, 'tree')
+        build_tree(root)
+        expected = measure('no cache', root)
+        with ScanCache(os.path.join(base, 'cache.sqlite3')) as cache:
+            results = [measure('cold cache', root, cache), measure('warm cache', root, cache)]
+            changed = os.path.join(root, 'klasör_00', 'alt:000')
+            removed = os.path.join(changed, 'rapor:0?.txt')
+            os.remove(removed)
+            os.utime(changed, (time.time() - 60,) * 2)
+            expected, *results = [[item for item in found if item[0] != removed]
+                                  for found in [expected] + results]
+            results.append(measure('one changed', root, cache))
+        if any(result != expected for result in results):
+            print("HATA: önbellekli tarama farklı bulgular üretti", file=sys.stderr)
+            return 1
+    finally:
+        shutil.rmtree(base)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
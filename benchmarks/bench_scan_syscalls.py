@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Tarama sırasında öğe başına yapılan dosya sistemi çağrılarını sayar.
+
+Sentetik bir ağaç oluşturulur ve eski os.walk + os.path.isdir döngüsü ile
+fixcore.scan_tree karşılaştırılır. os.stat, os.lstat, os.scandir, os.open
+ve os.close çağrıları Python düzeyinde sayılır (os.path.isdir/exists de
+os.stat kullanır; scan_tree dizinleri os.open ile açıp os.close ile
+kapatır). Sonda iki yolun toplamları yan yana yazılır.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from _common import PACKAGE_DIR  # noqa: F401  (sys.path ayarı)
+from fixcore import TYPE_DIR, TYPE_FILE, scan_tree, shorten_filename, needs_fix
+
+DIRS = 50
+FILES_PER_DIR = 200
+MAX_LEN = 40
+
+def build_tree(root):
+    for d in range(DIRS):
+        sub = os.path.join(root, f"klasör_{d:03d}")
+        os.mkdir(sub)
+        for f in range(FILES_PER_DIR):
+            if f % 20 == 0:
+                name = f"{'uzun_ad_' * 8}{f}.txt"
+            elif f % 20 == 1:
+                name = f"rapor:{f}?.txt"
+            else:
+                name = f"dosya_{f}.txt"
+            open(os.path.join(sub, name), 'w').close()
+
+def legacy_scan(start_path, max_len):
+    """Eski FileScannerThread.run döngüsü."""
+    for root, dirs, files in os.walk(start_path):
+        for dirname in dirs:
+            full_path = os.path.join(root, dirname)
+            proposed_new_name = shorten_filename(full_path, max_len)
+            if needs_fix(dirname, proposed_new_name, max_len):
+                yield full_path, dirname, proposed_new_name, TYPE_DIR
+        for filename in files:
+            full_path = os.path.join(root, filename)
+            proposed_new_name = shorten_filename(full_path, max_len)
+            if needs_fix(filename, proposed_new_name, max_len):
+                yield full_path, filename, proposed_new_name, TYPE_FILE
+
+class SyscallCounter:
+    NAMES = ('stat', 'lstat', 'scandir', 'open', 'close')
+
+    def __init__(self):
+        self.counts = dict.fromkeys(self.NAMES, 0)
+        self._saved = {}
+
+    def __enter__(self):
+        for name in self.NAMES:
+            original = getattr(os, name)
+            self._saved[name] = original
+            setattr(os, name, self._wrap(name, original))
+        return self
+
+    def __exit__(self, *exc):
+        for name, original in self._saved.items():
+            setattr(os, name, original)
+
+    def _wrap(self, name, original):
+        def counted(*args, **kwargs):
+            self.counts[name] += 1
+            return original(*args, **kwargs)
+        return counted
+
+    @property
+    def total(self):
+        return sum(self.counts.values())
+
+def measure(label, scan, root, entries):
+    with SyscallCounter() as counter:
+        start = time.perf_counter()
+        found = list(scan(root, MAX_LEN))
+        elapsed = time.perf_counter() - start
+    print(f"{label:8s}: {len(found):5d} findings, {counter.total:6d} calls "
+          f"({counter.total / entries:.3f}/entry) {counter.counts}, {elapsed * 1000:.1f} ms")
+    return found, counter.total
+
+def main():
+    root = tempfile.mkdtemp(prefix='fnf_bench_')
+    try:
+        build_tree(root)
+        entries = DIRS + DIRS * FILES_PER_DIR
+        old, old_total = measure('os.walk', legacy_scan, root, entries)
+        new, new_total = measure('scandir', lambda r, m: scan_tree(r, True, m), root, entries)
+        print(f"total calls: {old_total} -> {new_total} ({new_total / old_total:.1%})")
+        # Önerilen adlar çakışma çözümüne göre değişebilir; bulunan yollar aynı olmalı
+        if [item[0] for item in old] != [item[0] for item in new]:
+            print("HATA: bulunan öğeler farklı", file=sys.stderr)
+            return 1
+    finally:
+        shutil.rmtree(root)
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
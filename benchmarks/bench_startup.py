@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+fixcore paketinin içe aktarma süresini ölçer.
+
+Her deneme ayrı bir yorumlayıcıda yapılır; boş bir yorumlayıcının açılış
+süresi çıkarılarak yalnızca "import fixcore" maliyeti raporlanır.
+Qt'nin hiç yüklenmediği de doğrulanır.
+"""
+
+import statistics
+import subprocess
+import sys
+import time
+
+from _common import PACKAGE_DIR
+
+RUNS = 20
+LIMIT_MS = 50.0
+
+CHECK = (
+    "import sys, fixcore\n"
+    "assert not any(m.startswith('PyQt') for m in sys.modules), 'Qt yüklendi'\n"
+)
+
+def _time_interpreter(code):
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, '-c', code], cwd=PACKAGE_DIR, check=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def main():
+    baseline = _time_interpreter("pass")
+    with_core = _time_interpreter(CHECK)
+    cost = max(with_core - baseline, 0.0)
+    print(f"empty interpreter   : {baseline:7.2f} ms")
+    print(f"with import fixcore : {with_core:7.2f} ms")
+    print(f"fixcore import cost : {cost:7.2f} ms (limit {LIMIT_MS:.0f} ms)")
+    return 0 if cost < LIMIT_MS else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Bulgu başına bellek kullanımını ölçer.
+
+Aynı bulgular demet listesi olarak (eski anomalous_items biçimi) ve
+fixcore.ResultStore içinde tutulur; tracemalloc ile kalıcı bellek ölçülür.
+Bulgu sayısı ilk argümanla verilir (varsayılan 1.000.000).
+
+    python3 benchmarks/bench_store_memory.py [BULGU_SAYISI]
+"""
+
+import gc
+import os
+import sys
+import tracemalloc
+
+from _common import PACKAGE_DIR  # noqa: F401  (sys.path ayarı)
+from fixcore import TYPE_DIR, TYPE_FILE, ResultStore
+
+FILES_PER_DIR = 1000
+ROOT = '/srv/arsiv/projeler/2024/musteri_dosyalari'
+
+def findings(count):
+    """Tarayıcının ürettiği gibi her bulgu için yeni dizgiler üretir."""
+    for i in range(count):
+        parent = os.path.join(ROOT, f"klasör_{i // FILES_PER_DIR:05d}", "alt klasör")
+        name = f"toplantı notları: {i}?.docx"
+        item_type = TYPE_DIR if i % 50 == 0 else TYPE_FILE
+        yield os.path.join(parent, name), name, f"toplantı notları {i}.docx", item_type, 6
+
+def measure(label, build, count):
+    gc.collect()
+    tracemalloc.start()
+    container = build(findings(count))
+    gc.collect()
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:12s}: {current / 2**20:8.1f} MiB, {current / count:6.1f} bytes/finding")
+    return container
+
+def build_store(items):
+    store = ResultStore()
+    store.extend(items)
+    return store
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    legacy = measure('tuple list', list, count)
+    del legacy
+    store = measure('ResultStore', build_store, count)
+    return 0 if len(store) == count else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
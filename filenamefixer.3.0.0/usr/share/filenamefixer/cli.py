@@ -0,0 +1,541 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+FileName Fixer komut satırı aracı.
+
+Grafik arayüzle aynı çekirdeği (fixcore) kullanır ama Qt yüklemez;
+bu sayede ekransız sunucularda ve cron içinde çalışabilir.
+
+Kullanım:
+    filenamefixer scan    DİZİN [SEÇENEKLER] [--output DOSYA [--format jsonl|csv] [--gzip]]
+    filenamefixer dry-run DİZİN [SEÇENEKLER]
+    filenamefixer apply   DİZİN [SEÇENEKLER] [--rename-workers N] [--error-report DOSYA]
+                          [--journal DOSYA | --no-journal] [--yes]
+    filenamefixer undo    GÜNLÜK [--rename-workers N] [--error-report DOSYA] [--progress] [--yes]
+    filenamefixer watch   DİZİN [--max-len N] [--max-path N] [--max-bytes N] [--profile P] [--no-dirs]
+                          [--apply [--journal DOSYA | --no-journal]] [--debounce SN] [--max-delay SN]
+
+SEÇENEKLER: [--max-len N] [--max-path N] [--max-bytes N] [--profile P] [--no-dirs] [--workers N [--processes]]
+            [--progress [--count-first]] [--cache [DOSYA]]
+"""
+
+import argparse
+import itertools
+import os
+import sys
+import time
+
+from fixcore import (
+    VERSION, NAME_MAX_BYTES, WINDOWS_MAX_PATH, DEFAULT_PROFILE, PROFILES, PROGRESS_INTERVAL, NameRules, ScanStats, RenameErrors, count_entries,
+    format_duration, scan_tree, plan_renames, apply_renames, undo_renames
+)
+# Ayrıştırıcı dışa aktarma biçimlerini ve izleme varsayılanlarını bu
+# modüllerden alır; günlük ve önbellek yalnızca kullanan alt komutlarda yüklenir
+from fixcore.export import EXPORT_FORMATS
+from fixcore.watcher import DEBOUNCE, MAX_DELAY, watch_tree
+
+LANG = 'tr' if os.environ.get('LANG', '').startswith('tr') else 'en'
+
+def _t(tr_text, en_text):
+    return tr_text if LANG == 'tr' else en_text
+
+def _max_len(value):
+    max_len = int(value)
+    if not (1 <= max_len <= 255):
+        raise argparse.ArgumentTypeError(
+            _t("Maksimum ad uzunluğu 1 ile 255 arasında bir sayı olmalıdır.",
+               "Maximum name length must be a number between 1 and 255."))
+    return max_len
+
+def _max_path(value):
+    max_path = int(value)
+    if max_path < 1:
+        raise argparse.ArgumentTypeError(
+            _t("Maksimum yol uzunluğu pozitif bir sayı olmalıdır.",
+               "Maximum path length must be a positive number."))
+    return max_path
+
+def _max_bytes(value):
+    max_bytes = int(value)
+    if not (1 <= max_bytes <= NAME_MAX_BYTES):
+        raise argparse.ArgumentTypeError(
+            _t(f"Maksimum ad bayt sayısı 1 ile {NAME_MAX_BYTES} arasında olmalıdır.",
+               f"Maximum name size must be between 1 and {NAME_MAX_BYTES} bytes."))
+    return max_bytes
+
+def _workers(value):
+    workers = int(value)
+    if workers < 1:
+        raise argparse.ArgumentTypeError(
+            _t("İş parçacığı sayısı en az 1 olmalıdır.", "Worker count must be at least 1."))
+    return workers
+
+def _seconds(value):
+    seconds = float(value)
+    if seconds < 0:
+        raise argparse.ArgumentTypeError(
+            _t("Süre negatif olamaz.", "Duration cannot be negative."))
+    return seconds
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="filenamefixer",
+        description=_t("Dosya ve klasör adlarını Windows uyumlu hale getirir.",
+                       "Makes file and folder names Windows compatible."))
+    parser.add_argument('--version', action='version', version=f"%(prog)s {VERSION}")
+
+    # Ad kuralları: taramayla çalışan alt komutlar ve watch aynı seçenekleri alır
+    rule_options = argparse.ArgumentParser(add_help=False)
+    rule_options.add_argument('directory')
+    rule_options.add_argument('--max-len', type=_max_len, default=200,
+                              help=_t("Maksimum ad uzunluğu (varsayılan: 200)",
+                                      "Maximum name length (default: 200)"))
+    rule_options.add_argument('--max-path', type=_max_path, metavar='N',
+                              help=_t(f"Adları tam yol bu uzunluğa sığacak şekilde de kısalt "
+                                      f"(Windows için {WINDOWS_MAX_PATH})",
+                                      f"Also shorten names so that the full path fits in this length "
+                                      f"({WINDOWS_MAX_PATH} for Windows)"))
+    rule_options.add_argument('--max-bytes', type=_max_bytes, nargs='?', const=NAME_MAX_BYTES,
+                              metavar='N',
+                              help=_t(f"Adları UTF-8 olarak bu kadar bayta da sığdır (değer verilmezse "
+                                      f"{NAME_MAX_BYTES}; ext4 ve SMB sınırı)",
+                                      f"Also fit names into this many UTF-8 bytes ({NAME_MAX_BYTES} if no "
+                                      f"value is given; the ext4 and SMB limit)"))
+    rule_options.add_argument('--profile', choices=PROFILES, default=DEFAULT_PROFILE,
+                              help=_t("Hedef dosya sistemi profili (varsayılan: default; ntfs, exfat, "
+                                      "fat32 ve smb yalnızca Windows'un yasakladığı karakterleri ve "
+                                      "aygıt adlarını düzeltir)",
+                                      "Target file system profile (default: default; ntfs, exfat, fat32 "
+                                      "and smb only fix the characters and device names Windows forbids)"))
+    rule_options.add_argument('--no-dirs', dest='include_dirs', action='store_false',
+                              help=_t("Klasör adlarını tarama", "Do not scan folder names"))
+
+    common = argparse.ArgumentParser(add_help=False, parents=[rule_options])
+    common.add_argument('--workers', '-j', type=_workers, default=1,
+                        help=_t("Alt dizinleri paralel tarayan iş parçacığı sayısı (varsayılan: 1)",
+                                "Number of workers scanning subdirectories in parallel (default: 1)"))
+    common.add_argument('--processes', dest='use_processes', action='store_true',
+                        help=_t("İş parçacığı yerine süreç havuzu kullan (her alt ağacın "
+                                "bulguları bitene kadar bellekte tutulur)",
+                                "Use a process pool instead of threads (each subtree's "
+                                "findings are kept in memory until it finishes)"))
+    common.add_argument('--progress', action='store_true',
+                        help=_t("Tarama ilerlemesini standart hataya yaz",
+                                "Print scan progress to standard error"))
+    common.add_argument('--count-first', action='store_true',
+                        help=_t("Kalan süre tahmini için önce öğeleri hızlıca say",
+                                "Quickly count entries first to estimate the remaining time"))
+    # Değer verilmezse '' gelir; varsayılan yol _scan'de çözülür
+    common.add_argument('--cache', nargs='?', const='', metavar='FILE',
+                        help=_t("Değişmeyen dizinleri bu önbellekten yanıtla (varsayılan: "
+                                "~/.cache/filenamefixer/scan-cache.sqlite3)",
+                                "Answer unchanged directories from this cache (default: "
+                                "~/.cache/filenamefixer/scan-cache.sqlite3)"))
+
+    sub = parser.add_subparsers(dest='command', required=True)
+    scan_parser = sub.add_parser('scan', parents=[common],
+                                 help=_t("Sorunlu adları listeler", "List problematic names"))
+    scan_parser.add_argument('--output', '-o', metavar='FILE',
+                             help=_t("Bulguları tarama sürerken bu dosyaya yaz (JSONL ya da CSV; "
+                                     "biçim uzantıdan anlaşılır, .gz ile sıkıştırılır)",
+                                     "Stream the findings to this file while scanning (JSONL or CSV; "
+                                     "the format follows the extension, .gz compresses)"))
+    scan_parser.add_argument('--format', choices=EXPORT_FORMATS,
+                             help=_t("--output dosyasının biçimi", "Format of the --output file"))
+    scan_parser.add_argument('--gzip', action='store_true', default=None,
+                             help=_t("--output dosyasını gzip ile sıkıştır",
+                                     "Compress the --output file with gzip"))
+    sub.add_parser('dry-run', parents=[common],
+                   help=_t("Yapılacak adlandırmaları gösterir, dokunmaz",
+                           "Show the renames without touching anything"))
+    apply_parser = sub.add_parser('apply', parents=[common],
+                                  help=_t("Adları düzeltir", "Fix the names"))
+    apply_parser.add_argument('--yes', '-y', action='store_true',
+                              help=_t("Onay sormadan uygula", "Do not ask for confirmation"))
+
+    watch_parser = sub.add_parser('watch', parents=[rule_options],
+                                  help=_t("Dizine yeni gelen adları izler ve bildirir ya da düzeltir",
+                                          "Watch a directory and report or fix names as they appear"))
+    watch_parser.add_argument('--apply', action='store_true',
+                              help=_t("Bulunan adları hemen düzelt (varsayılan: yalnızca listele)",
+                                      "Fix the names right away (default: only list them)"))
+    watch_parser.add_argument('--debounce', type=_seconds, default=DEBOUNCE, metavar='SECONDS',
+                              help=_t(f"Son olaydan sonra toplu işin beklediği süre (varsayılan: {DEBOUNCE:g})",
+                                      f"Quiet time after the last event before a batch is processed "
+                                      f"(default: {DEBOUNCE:g})"))
+    watch_parser.add_argument('--max-delay', type=_seconds, default=MAX_DELAY, metavar='SECONDS',
+                              help=_t(f"Olaylar kesilmese de toplu işin en geç işleneceği süre "
+                                      f"(varsayılan: {MAX_DELAY:g})",
+                                      f"Process a batch at the latest after this long even if events "
+                                      f"keep coming (default: {MAX_DELAY:g})"))
+
+    for journal_parser in (apply_parser, watch_parser):
+        journal_group = journal_parser.add_mutually_exclusive_group()
+        journal_group.add_argument('--journal', metavar='FILE',
+                                   help=_t("Geri alma günlüğünün yolu (varsayılan: "
+                                           "~/.local/share/filenamefixer/journals altında yeni bir dosya)",
+                                           "Path of the undo journal (default: a new file under "
+                                           "~/.local/share/filenamefixer/journals)"))
+        journal_group.add_argument('--no-journal', action='store_true',
+                                   help=_t("Geri alma günlüğü yazma", "Do not write an undo journal"))
+
+    undo_parser = sub.add_parser('undo', help=_t("Bir apply günlüğündeki adlandırmaları geri alır",
+                                                 "Revert the renames recorded in an apply journal"))
+    undo_parser.add_argument('journal')
+    undo_parser.add_argument('--progress', action='store_true',
+                             help=_t("İlerlemeyi standart hataya yaz",
+                                     "Print progress to standard error"))
+    undo_parser.add_argument('--yes', '-y', action='store_true',
+                             help=_t("Onay sormadan uygula", "Do not ask for confirmation"))
+
+    for rename_parser in (apply_parser, undo_parser):
+        rename_parser.add_argument('--rename-workers', type=_workers, default=1,
+                                   help=_t("Eşzamanlı yeniden adlandırma sayısı; ağ paylaşımlarında "
+                                           "artırın (varsayılan: 1)",
+                                           "Number of concurrent renames; raise it on network shares "
+                                           "(default: 1)"))
+        rename_parser.add_argument('--error-report', metavar='FILE',
+                                   help=_t("Başarısız adlandırmaları CSV olarak bu dosyaya yaz",
+                                           "Write failed renames to this file as CSV"))
+    return parser
+
+# Terminal değilse (ör. günlük dosyası) satırlar daha seyrek yazılır
+PROGRESS_INTERVAL_TTY = PROGRESS_INTERVAL
+PROGRESS_INTERVAL_LOG = 5.0
+
+def _format_progress(stats):
+    text = _t(f"{stats.directories} dizin, {stats.entries} öğe, {stats.findings} bulgu, "
+              f"{stats.rate():.0f} öğe/sn",
+              f"{stats.directories} dirs, {stats.entries} entries, {stats.findings} findings, "
+              f"{stats.rate():.0f} entries/s")
+    fraction = stats.fraction()
+    if fraction is not None:
+        text += f" | %{fraction * 100:.0f}" if LANG == 'tr' else f" | {fraction * 100:.0f}%"
+        eta = stats.eta()
+        if eta is not None:
+            text += _t(f", kalan ~{format_duration(eta)}", f", ~{format_duration(eta)} left")
+    return f"{text} | {stats.current_path}"
+
+class _ProgressPrinter:
+    """Tarama ilerlemesini standart hataya yazar; terminalde tek satırı günceller."""
+
+    def __init__(self, stream=sys.stderr):
+        self.stream = stream
+        self.tty = stream.isatty()
+        self.interval = PROGRESS_INTERVAL_TTY if self.tty else PROGRESS_INTERVAL_LOG
+        self._width = 0
+
+    def __call__(self, stats):
+        line = _format_progress(stats)
+        if self.tty:
+            # Önceki satırdan kalanları boşlukla sil
+            self.stream.write('\r' + line.ljust(self._width))
+            self._width = len(line)
+        else:
+            self.stream.write(line + '\n')
+        self.stream.flush()
+
+    def finish(self):
+        if self.tty and self._width:
+            self.stream.write('\n')
+            self.stream.flush()
+
+def _scan(args, stats):
+    cache = None
+    if args.cache is not None:
+        from fixcore.cache import ScanCache, default_cache_path
+        cache = ScanCache(args.cache or default_cache_path())
+    try:
+        if not args.progress:
+            yield from scan_tree(args.directory, args.include_dirs, args.max_len, stats=stats,
+                                 workers=args.workers, use_processes=args.use_processes,
+                                 cache=cache, max_path=args.max_path,
+                                 max_bytes=args.max_bytes, profile=args.profile)
+            return
+
+        if args.count_first:
+            print(_t("Öğeler sayılıyor...", "Counting entries..."), file=sys.stderr)
+            stats.total = count_entries(args.directory, args.include_dirs)
+            # Hız ve kalan süre sayımdan değil taramadan hesaplansın
+            stats.started = time.monotonic()
+        printer = _ProgressPrinter()
+        try:
+            yield from scan_tree(args.directory, args.include_dirs, args.max_len, stats=stats,
+                                 workers=args.workers, use_processes=args.use_processes,
+                                 on_progress=printer, progress_interval=printer.interval,
+                                 cache=cache, max_path=args.max_path,
+                                 max_bytes=args.max_bytes, profile=args.profile)
+        finally:
+            printer.finish()
+    finally:
+        if cache:
+            cache.close()
+
+def _rules(args):
+    """Taramanın kuralları; adlandırmada eklenen sonekli adlar da bunlara sığar."""
+    return NameRules(args.max_len, args.max_path, max_bytes=args.max_bytes, profile=args.profile)
+
+def _report_stats(stats):
+    print(_t(f"{stats.directories} dizin, {stats.entries} öğe incelendi; "
+             f"{stats.fast_path} öğe zaten temizdi (hızlı yol).",
+             f"{stats.directories} directories, {stats.entries} entries examined; "
+             f"{stats.fast_path} entries were already clean (fast path)."), file=sys.stderr)
+    if stats.cached:
+        print(_t(f"{stats.cached} dizin değişmediği için önbellekten yanıtlandı.",
+                 f"{stats.cached} unchanged directories were answered from the cache."),
+              file=sys.stderr)
+    if stats.too_long:
+        # Üst dizinler kısaltılmadığı için yola sığmayan adlar ayrı bildirilir
+        print(_t(f"{stats.too_long} öğe önerilen adıyla da sınırı aşıyor; bunların ya da "
+                 f"üst dizinlerinin elle kısaltılması gerekir:",
+                 f"{stats.too_long} items still exceed the limit with their proposed names; "
+                 f"they or their parent directories need manual shortening:"), file=sys.stderr)
+        for path in stats.too_long_paths:
+            print(f"  {path}", file=sys.stderr)
+        more = stats.too_long - len(stats.too_long_paths)
+        if more:
+            print(_t(f"  ... ve {more} öğe daha", f"  ... and {more} more"), file=sys.stderr)
+
+# Hata raporu dosyası istenmediğinde ekrana yazılan en fazla kayıt
+ERROR_PRINT_LIMIT = 20
+
+def _report_errors(errors, report_path):
+    for code, message, count in errors.summary():
+        suffix = f" (errno {code})" if code is not None else ""
+        print(f"  {count} × {message}{suffix}", file=sys.stderr)
+
+    if report_path:
+        try:
+            errors.export(report_path)
+        except OSError as e:
+            print(_t(f"Hata raporu yazılamadı: {e}", f"Could not write the error report: {e}"),
+                  file=sys.stderr)
+        else:
+            print(_t(f"Hata raporu yazıldı: {report_path}", f"Error report written: {report_path}"),
+                  file=sys.stderr)
+        return
+
+    for full_path, _code, message in itertools.islice(errors, ERROR_PRINT_LIMIT):
+        print(f"  {full_path}: {message}", file=sys.stderr)
+    if len(errors) > ERROR_PRINT_LIMIT:
+        print(_t(f"  ... ve {len(errors) - ERROR_PRINT_LIMIT} hata daha (tümü için --error-report)",
+                 f"  ... and {len(errors) - ERROR_PRINT_LIMIT} more errors (use --error-report for all)"),
+              file=sys.stderr)
+
+def cmd_scan(args):
+    stats = ScanStats()
+    if args.output:
+        return _export_scan(args, stats)
+    count = 0
+    for full_path, _original_name, proposed_new_name, item_type, _depth in _scan(args, stats):
+        print(f"{item_type}\t{full_path}\t{proposed_new_name}")
+        count += 1
+    _report_stats(stats)
+    print(_t(f"{count} anormal öğe bulundu.", f"{count} anomalous items found."), file=sys.stderr)
+    return 0
+
+def _export_scan(args, stats):
+    from fixcore.export import FindingsWriter
+    try:
+        writer = FindingsWriter(args.output, args.format, args.gzip)
+    except ValueError:
+        print(_t(f"Biçim dosya adından anlaşılamadı, --format verin: {args.output}",
+                 f"Cannot tell the format from the file name, use --format: {args.output}"),
+              file=sys.stderr)
+        return 2
+    except OSError as e:
+        print(_t(f"Çıktı dosyası açılamadı: {e}", f"Could not open the output file: {e}"), file=sys.stderr)
+        return 1
+    if args.workers > 1 and args.use_processes:
+        print(_t("Uyarı: --processes ile her alt ağacın bulguları o alt ağaç bitene kadar "
+                 "bellekte toplanır; akış için iş parçacıklarını kullanın.",
+                 "Warning: with --processes each subtree's findings are collected in memory "
+                 "until that subtree finishes; use threads to stream them."), file=sys.stderr)
+    # Bulgular biriktirilmeden yazılır; bellek kullanımı ağacın boyutuna bağlı değildir
+    with writer:
+        for item in _scan(args, stats):
+            writer.write(item)
+    _report_stats(stats)
+    print(_t(f"{writer.count} anormal öğe bulundu ve {args.output} dosyasına yazıldı.",
+             f"{writer.count} anomalous items found and written to {args.output}."), file=sys.stderr)
+    return 0
+
+def cmd_dry_run(args):
+    stats = ScanStats()
+    items = list(_scan(args, stats))
+    _report_stats(stats)
+    count = 0
+    for full_path, new_full_path in plan_renames(items):
+        if full_path != new_full_path:
+            print(f"{full_path} -> {new_full_path}")
+            count += 1
+    print(_t(f"{count} öğe yeniden adlandırılacak.", f"{count} items would be renamed."), file=sys.stderr)
+    return 0
+
+def cmd_apply(args):
+    stats = ScanStats()
+    # Yol bütçesine sığdırılamayıp adı değişmeyen öğeler yalnızca listelenir
+    items = [item for item in _scan(args, stats) if item[2] != item[1]]
+    _report_stats(stats)
+    if not items:
+        print(_t("Düzeltilecek öğe yok.", "No items to fix."), file=sys.stderr)
+        return 0
+
+    if not args.yes:
+        if args.no_journal:
+            question = _t(f"{len(items)} öğe düzeltilecek. Günlük yazılmayacağı için bu işlem geri alınamaz! Devam edilsin mi? [e/H] ",
+                          f"{len(items)} items will be fixed. Without a journal this action cannot be undone! Continue? [y/N] ")
+        else:
+            question = _t(f"{len(items)} öğe düzeltilecek. Devam edilsin mi? [e/H] ",
+                          f"{len(items)} items will be fixed. Continue? [y/N] ")
+        if not _confirm(question):
+            return 1
+
+    journal = None
+    if not args.no_journal:
+        from fixcore.journal import RenameJournal, default_journal_path
+        try:
+            journal = RenameJournal(args.journal or default_journal_path())
+        except OSError as e:
+            print(_t(f"Geri alma günlüğü açılamadı: {e}", f"Could not open the undo journal: {e}"),
+                  file=sys.stderr)
+            return 1
+
+    errors = RenameErrors()
+    try:
+        fixed_count, failed_count = apply_renames(items, on_error=errors.add,
+                                                  workers=args.rename_workers,
+                                                  on_progress=_rename_progress(args),
+                                                  progress_interval=PROGRESS_INTERVAL_LOG,
+                                                  journal=journal, rules=_rules(args))
+    finally:
+        if journal:
+            journal.close()
+            print(_t(f"Geri alma günlüğü: {journal.path}\n"
+                     f"Geri almak için: filenamefixer undo '{journal.path}'",
+                     f"Undo journal: {journal.path}\n"
+                     f"To undo: filenamefixer undo '{journal.path}'"), file=sys.stderr)
+    print(_t(f"{fixed_count} öğe başarıyla düzeltildi, {failed_count} öğe düzeltilemedi.",
+             f"{fixed_count} items fixed successfully, {failed_count} items failed to be fixed."),
+          file=sys.stderr)
+    if errors:
+        _report_errors(errors, args.error_report)
+    return 1 if failed_count else 0
+
+def cmd_undo(args):
+    if not args.yes and not _confirm(
+            _t(f"'{args.journal}' günlüğündeki adlandırmalar geri alınacak. Devam edilsin mi? [e/H] ",
+               f"The renames in '{args.journal}' will be reverted. Continue? [y/N] ")):
+        return 1
+
+    errors = RenameErrors()
+    try:
+        restored_count, failed_count = undo_renames(args.journal, on_error=errors.add,
+                                                    workers=args.rename_workers,
+                                                    on_progress=_rename_progress(args),
+                                                    progress_interval=PROGRESS_INTERVAL_LOG)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    print(_t(f"{restored_count} öğe eski adına döndürüldü, {failed_count} öğe döndürülemedi.",
+             f"{restored_count} items restored, {failed_count} items could not be restored."),
+          file=sys.stderr)
+    if errors:
+        _report_errors(errors, args.error_report)
+    return 1 if failed_count else 0
+
+def cmd_watch(args):
+    journal = None
+    if args.apply and not args.no_journal:
+        from fixcore.journal import RenameJournal, default_journal_path
+        try:
+            journal = RenameJournal(args.journal or default_journal_path())
+        except OSError as e:
+            print(_t(f"Geri alma günlüğü açılamadı: {e}", f"Could not open the undo journal: {e}"),
+                  file=sys.stderr)
+            return 1
+        print(_t(f"Geri alma günlüğü: {journal.path}", f"Undo journal: {journal.path}"), file=sys.stderr)
+
+    rules = _rules(args)
+
+    def on_findings(items):
+        if not args.apply:
+            for full_path, _original_name, proposed_new_name, item_type, _depth in items:
+                print(f"{item_type}\t{full_path}\t{proposed_new_name}")
+            sys.stdout.flush()
+            return
+        errors = RenameErrors()
+        fixed_count, failed_count = apply_renames(
+            items, on_error=errors.add, journal=journal, rules=rules,
+            on_rename=lambda full_path, new_full_path: print(f"{full_path} -> {new_full_path}"))
+        sys.stdout.flush()
+        if failed_count:
+            print(_t(f"{failed_count} öğe düzeltilemedi:", f"{failed_count} items failed to be fixed:"),
+                  file=sys.stderr)
+            _report_errors(errors, None)
+
+    print(_t(f"İzleniyor: {args.directory} (durdurmak için Ctrl+C)",
+             f"Watching: {args.directory} (press Ctrl+C to stop)"), file=sys.stderr)
+    try:
+        watch_tree(args.directory, on_findings, args.include_dirs, args.max_len,
+                   debounce=args.debounce, max_delay=args.max_delay, max_path=args.max_path,
+                   max_bytes=args.max_bytes, profile=args.profile)
+    except OSError as e:
+        print(_t(f"İzleme başlatılamadı: {e}", f"Could not watch the directory: {e}"), file=sys.stderr)
+        return 1
+    finally:
+        if journal:
+            journal.close()
+            print(_t(f"Geri almak için: filenamefixer undo '{journal.path}'",
+                     f"To undo: filenamefixer undo '{journal.path}'"), file=sys.stderr)
+    return 0
+
+def _confirm(question):
+    """Soruyu sorar; yanıt okunamazsa (girdi kapalı, Ctrl+C) hayır sayılır."""
+    try:
+        answer = input(question)
+    except (EOFError, KeyboardInterrupt):
+        print(file=sys.stderr)
+        print(_t("Onay okunamadı, işlem yapılmadı. Sormadan çalıştırmak için --yes verin.",
+                 "Could not read a confirmation, nothing was done. Use --yes to run without asking."),
+              file=sys.stderr)
+        return False
+    return answer.strip().lower() in ('e', 'evet', 'y', 'yes')
+
+def _rename_progress(args):
+    if not args.progress:
+        return None
+
+    def on_progress(done, total):
+        print(_t(f"{done}/{total} öğe işlendi", f"{done}/{total} items processed"), file=sys.stderr)
+    return on_progress
+
+COMMANDS = {
+    'scan': cmd_scan,
+    'dry-run': cmd_dry_run,
+    'apply': cmd_apply,
+    'undo': cmd_undo,
+    'watch': cmd_watch,
+}
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.command == 'undo':
+        if not os.path.isfile(args.journal):
+            print(_t(f"Günlük bulunamadı: {args.journal}", f"Journal not found: {args.journal}"),
+                  file=sys.stderr)
+            return 2
+    elif not os.path.isdir(args.directory):
+        print(_t(f"Dizin bulunamadı: {args.directory}", f"Directory not found: {args.directory}"),
+              file=sys.stderr)
+        return 2
+    else:
+        # Günlüğe mutlak yollar yazılsın; undo başka bir dizinden de çalışır
+        args.directory = os.path.abspath(args.directory)
+    try:
+        return COMMANDS[args.command](args)
+    except KeyboardInterrupt:
+        return 130
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+FileName Fixer çekirdeği.
+
+Bu paket Qt içe aktarmaz; hem grafik arayüz hem de komut satırı aracı
+aynı kuralları buradan kullanır. Yalnızca standart kütüphaneye dayanır,
+böylece içe aktarılması ucuzdur.
+"""
+
+from .rules import (
+    INVALID_WINDOWS_CHARS, TYPE_DIR, TYPE_FILE, NAME_MAX_BYTES, WINDOWS_MAX_PATH, NameRules,
+    clean_filename, shorten_filename, collision_key, needs_fix, truncate_utf8,
+)
+from .profiles import DEFAULT_PROFILE, PROFILES, Profile, get_profile
+from .scanner import PROGRESS_INTERVAL, ScanStats, ResultBatcher, count_entries, format_duration, scan_tree
+from .planner import SiblingIndex, plan_directory, plan_rename_buckets, plan_renames
+from .renamer import RenameErrors, apply_renames, undo_renames
+from .store import ResultStore
+
+VERSION = "3.0.0"
+
+# Bu modüller (ve çektikleri json) açılışta yüklenmez; adları ilk
+# erişildiğinde içe aktarılır. Komut satırı aracı bunları yalnızca kullanan
+# alt komutlarda alt modüllerinden alır.
+_LAZY = {
+    'RenameJournal': 'journal', 'default_journal_path': 'journal',
+    'ScanCache': 'cache', 'default_cache_path': 'cache',
+    'TreeWatcher': 'watcher', 'watch_tree': 'watcher',
+    'EXPORT_FORMATS': 'export', 'FindingsWriter': 'export', 'export_findings': 'export',
+}
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(f'.{module}', __name__), name)
+    globals()[name] = value
+    return value
+
+__all__ = [
+    'VERSION', 'INVALID_WINDOWS_CHARS', 'TYPE_DIR', 'TYPE_FILE', 'NAME_MAX_BYTES', 'WINDOWS_MAX_PATH',
+    'NameRules', 'clean_filename', 'shorten_filename', 'collision_key', 'needs_fix', 'truncate_utf8',
+    'DEFAULT_PROFILE', 'PROFILES', 'Profile', 'get_profile',
+    'PROGRESS_INTERVAL', 'ScanStats', 'ResultBatcher', 'count_entries', 'format_duration', 'scan_tree',
+    'SiblingIndex', 'plan_directory', 'plan_rename_buckets', 'plan_renames',
+    'RenameErrors', 'apply_renames', 'undo_renames', 'RenameJournal', 'default_journal_path',
+    'ResultStore', 'ScanCache', 'default_cache_path', 'TreeWatcher', 'watch_tree',
+    'EXPORT_FORMATS', 'FindingsWriter', 'export_findings',
+]
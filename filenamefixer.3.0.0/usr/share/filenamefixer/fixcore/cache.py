@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Artımlı yeniden tarama için kalıcı dizin önbelleği (SQLite).
+
+Bir dizinin bulguları yalnızca o dizindeki adlara bağlıdır; ad eklenince,
+silinince ya da değişince dizinin mtime'ı da değişir. Bu yüzden her dizin
+için (aygıt, inode, mtime_ns) ile birlikte bulgular, girilecek alt
+dizinler ve sayaçlar saklanır. Sonraki taramada durumu aynı kalan dizin
+okunmaz ve kurallardan geçirilmez; tek bir stat yeterlidir. Alt dizinlere
+yine inilir, çünkü bir torundaki değişiklik üst dizinin mtime'ını
+değiştirmez.
+
+Kayıtlar kuralların imzasıyla (NameRules.signature) ve include_dirs ile
+anahtarlanır; farklı ayarlarla yapılan taramalar birbirinin kaydını
+kullanmaz.
+"""
+
+import json
+import os
+import time
+
+# Saklanan kayıtların biçimi değişirse artırılır; eski önbellek silinir
+CACHE_FORMAT = 1
+
+# Bu kadar yeni mtime'lı dizinler saklanmaz: aynı saat adımında yapılan
+# bir değişiklik mtime'ı değiştirmeyebilir
+MTIME_GRACE = 2.0
+
+# Bu kadar kayıtta bir işlem kalıcı hale getirilir
+COMMIT_EVERY = 1000
+
+def default_cache_path():
+    """Önbelleğin varsayılan yolu ($XDG_CACHE_HOME/filenamefixer/scan-cache.sqlite3)."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'filenamefixer', 'scan-cache.sqlite3')
+
+def _signed(value):
+    # SQLite tamsayıları işaretli 64 bittir; bazı dosya sistemlerinde inode 2**63'ü aşar
+    return value - (1 << 64) if value >= 1 << 63 else value
+
+class ScanCache:
+    """
+    Dizin başına tarama sonuçlarını tutan SQLite önbelleği.
+
+    Aynı nesne birden çok tarama iş parçacığından kullanılabilir; erişimler
+    tek bir kilitle sıralanır. Bağlam yöneticisi olarak kullanılabilir.
+    """
+
+    def __init__(self, path=None):
+        # sqlite3 pahalıdır; fixcore'un açılış süresine eklenmesin
+        import sqlite3
+        import threading
+
+        self.path = path or default_cache_path()
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._db = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'format'").fetchone()
+        if row is None or row[0] != str(CACHE_FORMAT):
+            self._db.execute('DROP TABLE IF EXISTS dirs')
+            self._db.execute("INSERT OR REPLACE INTO meta VALUES ('format', ?)", (str(CACHE_FORMAT),))
+        self._db.execute('''
+            CREATE TABLE IF NOT EXISTS dirs (
+                path BLOB NOT NULL,
+                config TEXT NOT NULL,
+                dev INTEGER NOT NULL,
+                ino INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                entries INTEGER NOT NULL,
+                fast INTEGER NOT NULL,
+                subdirs TEXT NOT NULL,
+                findings TEXT NOT NULL,
+                PRIMARY KEY (path, config)
+            ) WITHOUT ROWID''')
+        self._db.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @staticmethod
+    def state(path, fd=None):
+        """
+        Dizinin (dev, ino, mtime_ns) durumu; okunamıyorsa None. fd verilirse
+        durum yol çözülmeden açık tanımlayıcıdan alınır.
+        """
+        try:
+            st = os.stat(path) if fd is None else os.fstat(fd)
+        except OSError:
+            return None
+        return st.st_dev, st.st_ino, st.st_mtime_ns
+
+    def get(self, path, config, state):
+        """
+        Durumu değişmemiş dizinin kaydını döndürür:
+        ([(name, proposed_new_name, is_dir), ...], [alt dizin adları], entries, fast).
+        Kayıt yoksa ya da dizin değişmişse None döner.
+        """
+        with self._lock:
+            row = self._db.execute(
+                'SELECT dev, ino, mtime_ns, entries, fast, subdirs, findings FROM dirs '
+                'WHERE path = ? AND config = ?', (os.fsencode(path), config)).fetchone()
+        if row is None:
+            return None
+        dev, ino, mtime_ns = state
+        if row[0] != _signed(dev) or row[1] != _signed(ino) or row[2] != mtime_ns:
+            return None
+        return json.loads(row[6]), json.loads(row[5]), row[3], row[4]
+
+    def put(self, path, config, state, findings, subdirs, entries, fast):
+        """Dizinin kaydını yazar; mtime'ı çok yeni olan dizinler atlanır."""
+        dev, ino, mtime_ns = state
+        if time.time() - mtime_ns / 1e9 < MTIME_GRACE:
+            return
+        # Adlar ASCII'ye kaçışlı yazılır; UTF-8 olmayan adlar da kayıpsız saklanır
+        record = (os.fsencode(path), config, _signed(dev), _signed(ino), mtime_ns, entries, fast,
+                  json.dumps(subdirs), json.dumps(findings))
+        with self._lock:
+            self._db.execute('INSERT OR REPLACE INTO dirs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', record)
+            self._pending += 1
+            if self._pending >= COMMIT_EVERY:
+                self._db.commit()
+                self._pending = 0
+
+    def clear(self):
+        with self._lock:
+            self._db.execute('DELETE FROM dirs')
+            self._db.commit()
+            self._pending = 0
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.commit()
+                self._db.close()
+                self._db = None
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+"""
+Tarama bulgularını JSONL ya da CSV olarak (isteğe bağlı gzip ile) akış
+halinde dosyaya yazar.
+
+Bulgular scan_tree'den geldikçe tek tek yazılır, hiçbir yerde biriktirilmez;
+bellek kullanımı taranan ağacın boyutundan bağımsızdır. Yazmalar büyük bir
+tampondan geçer, böylece milyonlarca satır için milyonlarca sistem çağrısı
+yapılmaz.
+
+JSONL satırları {"path", "name", "proposed", "type", "depth"} nesneleridir
+ve ASCII'ye kaçışlı yazılır; CSV aynı sütunları başlık satırıyla birlikte
+UTF-8 olarak yazar. UTF-8 olmayan adlar her iki biçimde de kayıpsız saklanır
+(JSONL'de vekil karakter kaçışları, CSV'de özgün baytlar).
+"""
+
+import io
+import os
+
+EXPORT_FORMATS = ('jsonl', 'csv')
+
+COLUMNS = ('path', 'name', 'proposed', 'type', 'depth')
+
+# Dosyaya yazmadan önce biriktirilen bayt sayısı
+WRITE_BUFFER = 1 << 20
+
+# gzip sıkıştırma düzeyi; 9'a göre çok daha hızlı, boyut farkı küçüktür
+GZIP_LEVEL = 6
+
+def export_format(path):
+    """
+    Dosya adından (format, compress) çıkarır: "bulgular.csv.gz" için
+    ('csv', True). Uzantı tanınmazsa format None döner.
+    """
+    name = os.path.basename(path).lower()
+    compress = name.endswith('.gz')
+    if compress:
+        name = name[:-3]
+    extension = os.path.splitext(name)[1].lstrip('.')
+    if extension == 'json':
+        extension = 'jsonl'
+    return (extension if extension in EXPORT_FORMATS else None), compress
+
+class FindingsWriter:
+    """
+    Bulguları tek tek dosyaya yazan akış yazıcısı.
+
+    format verilmezse dosya adından çıkarılır; compress verilmezse ad .gz
+    ile bitiyorsa gzip kullanılır. Bağlam yöneticisi olarak kullanılabilir;
+    count yazılan bulgu sayısıdır.
+    """
+
+    def __init__(self, path, format=None, compress=None):
+        guessed_format, guessed_compress = export_format(path)
+        self.format = format or guessed_format
+        if self.format not in EXPORT_FORMATS:
+            raise ValueError(f"Desteklenmeyen dışa aktarma biçimi: {path}")
+        if compress is None:
+            compress = guessed_compress
+        self.path = path
+        self.count = 0
+
+        if compress:
+            # gzip yalnızca istendiğinde yüklenir
+            import gzip
+            self._file = open(path, 'wb')
+            compressed = gzip.GzipFile(fileobj=self._file, mode='wb', compresslevel=GZIP_LEVEL)
+            binary = io.BufferedWriter(compressed, WRITE_BUFFER)
+        else:
+            self._file = None
+            binary = open(path, 'wb', buffering=WRITE_BUFFER)
+        # Kodlama hatası olamaz: JSONL ASCII'dir, CSV'de UTF-8 olmayan adların
+        # vekil karakterleri özgün baytlarına geri yazılır
+        self._stream = io.TextIOWrapper(binary, encoding='utf-8', errors='surrogateescape',
+                                        newline='')
+        if self.format == 'csv':
+            import csv
+            self._csv = csv.writer(self._stream)
+            self._csv.writerow(COLUMNS)
+            self.write = self._write_csv
+        else:
+            # JSON kodlayıcısı yalnızca JSONL yazılırken yüklenir
+            from json.encoder import encode_basestring_ascii
+            self._encode = encode_basestring_ascii
+            self.write = self._write_jsonl
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _write_jsonl(self, item):
+        full_path, original_name, proposed_new_name, item_type, depth = item
+        encode = self._encode
+        self._stream.write(f'{{"path": {encode(full_path)}, "name": {encode(original_name)}, '
+                           f'"proposed": {encode(proposed_new_name)}, "type": {encode(item_type)}, '
+                           f'"depth": {depth}}}\n')
+        self.count += 1
+
+    def _write_csv(self, item):
+        self._csv.writerow(item)
+        self.count += 1
+
+    def close(self):
+        if self._stream.closed:
+            return
+        try:
+            # Akış kapanınca gzip de kapanır ve sonunu yazar; alttaki dosya ayrıca kapatılır
+            self._stream.close()
+        finally:
+            if self._file is not None:
+                self._file.close()
+
+def export_findings(items, path, format=None, compress=None):
+    """items'taki bulguları path'e akış halinde yazar ve yazılan sayıyı döndürür."""
+    with FindingsWriter(path, format, compress) as writer:
+        for item in items:
+            writer.write(item)
+    return writer.count
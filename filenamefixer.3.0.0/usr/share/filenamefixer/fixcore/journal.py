@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+"""
+Geri alma günlüğü: yapılan yeniden adlandırmaların yalnızca sona eklenen kaydı.
+
+Günlük, adlandırmalardan önce yazılır (write-ahead): apply_renames her
+JOURNAL_BATCH adlandırmalık parçayı önce günlüğe yazıp fsync eder, sonra
+uygular. Böylece çökmede bile diske işlenmiş her adlandırma günlükte
+bulunur; fsync adlandırma başına değil parça başına bir kez yapılır.
+
+Biçim satır başına bir JSON değeridir:
+  * ilk satır başlıktır: {"journal": 1, "created": "..."},
+  * {"bucket": n} bir derinlik grubunun başlangıcını işaretler,
+  * ["eski/yol", "yeni/yol"] bir adlandırmadır. Hedef ad adlandırma
+    sırasında başkasınca alınmış çıkarsa öğe sonekli bir ada taşınır; bu
+    ad da önce aynı eski yolla yeni bir kayıt olarak yazılır ve gruptaki
+    en son kayıt öncekilerin yerine geçer.
+
+renamer.undo_renames günlüğü read_journal_buckets ile sondan başa, bloklar
+halinde okur (bellek kullanımı günlük boyutuna bağlı değildir) ve grupları
+ters sırada, her grubu paralel çalıştırılabilir olarak geri uygular.
+"""
+
+import json
+import os
+import time
+from json.encoder import encode_basestring_ascii
+
+# Bir fsync ile kalıcı hale getirilen en fazla kayıt sayısı
+JOURNAL_BATCH = 1000
+
+JOURNAL_VERSION = 1
+
+# Günlük sondan okunurken kullanılan blok boyu
+_READ_BLOCK = 1 << 20
+
+def default_journal_dir():
+    """Günlüklerin varsayılan dizini ($XDG_DATA_HOME/filenamefixer/journals)."""
+    data_home = os.environ.get('XDG_DATA_HOME') or os.path.join(os.path.expanduser('~'), '.local', 'share')
+    return os.path.join(data_home, 'filenamefixer', 'journals')
+
+def default_journal_path():
+    """Varsayılan dizinde zaman damgalı yeni bir günlük yolu döndürür."""
+    return os.path.join(default_journal_dir(),
+                        time.strftime('%Y%m%d-%H%M%S') + f'-{os.getpid()}.jsonl')
+
+class RenameJournal:
+    """
+    Yeniden adlandırmaları sona ekleyerek kaydeden günlük dosyası.
+
+    Bağlam yöneticisi olarak kullanılabilir. record, verilen adlandırmaları
+    tek yazma ve tek fsync ile kalıcı hale getirir; adlandırma iş
+    parçacıklarından da çağrılabilir.
+    """
+
+    __slots__ = ('path', '_stream', '_bucket', '_bucket_written', '_lock')
+
+    def __init__(self, path):
+        import threading
+
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self._stream = open(path, 'ab')
+        self._bucket = 0
+        self._bucket_written = True
+        if self._stream.tell() == 0:
+            header = {'journal': JOURNAL_VERSION,
+                      'created': time.strftime('%Y-%m-%dT%H:%M:%S%z')}
+            self._write([json.dumps(header)])
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def begin_bucket(self):
+        """Yeni bir derinlik grubu başlatır; işaret ilk kayıtla birlikte yazılır."""
+        self._bucket += 1
+        self._bucket_written = False
+
+    def record(self, pairs):
+        """
+        (old_path, new_path) çiftlerini yazar ve diske işler. Göreli yollar
+        o anki dizine göre mutlak yazılır; günlük her dizinden geri alınabilir.
+        """
+        # json.dumps'ın genel yolu yerine dizgi kodlayıcı doğrudan çağrılır;
+        # milyonlarca kayıtta günlüğün maliyetinin çoğu buradadır
+        encode = encode_basestring_ascii
+        cwd = None
+        lines = []
+        for old_path, new_path in pairs:
+            if old_path == new_path:
+                continue
+            if not os.path.isabs(old_path):
+                if cwd is None:
+                    cwd = os.getcwd()
+                old_path = os.path.join(cwd, old_path)
+                new_path = os.path.join(cwd, new_path)
+            lines.append(f'[{encode(old_path)}, {encode(new_path)}]')
+        if not lines:
+            return
+        with self._lock:
+            if not self._bucket_written:
+                lines.insert(0, json.dumps({'bucket': self._bucket}))
+                self._bucket_written = True
+            self._write(lines)
+
+    def _write(self, lines):
+        # Kayıtlar ASCII'ye kaçışlı yazılır; UTF-8 olmayan adların vekil
+        # karakterleri de kayıpsız geri okunur
+        self._stream.write(('\n'.join(lines) + '\n').encode('ascii'))
+        self._stream.flush()
+        os.fsync(self._stream.fileno())
+
+    def close(self):
+        if not self._stream.closed:
+            self._stream.close()
+
+def _lines_reversed(stream):
+    """Dosyanın satırlarını sondan başa, bloklar halinde okuyarak üretir."""
+    stream.seek(0, os.SEEK_END)
+    position = stream.tell()
+    tail = b''
+    while position > 0:
+        size = min(_READ_BLOCK, position)
+        position -= size
+        stream.seek(position)
+        lines = (stream.read(size) + tail).split(b'\n')
+        # İlk parça bir önceki bloktaki satırın devamı olabilir
+        tail = lines.pop(0)
+        for line in reversed(lines):
+            if line:
+                yield line
+    if tail:
+        yield tail
+
+def read_journal_buckets(path):
+    """
+    Günlükteki adlandırmaları geri alma sırasıyla gruplar halinde üretir:
+    son gruptan başlayarak [(new_path, old_path), ...] listeleri.
+
+    Yazılırken kesilmiş son satır (çökme) yok sayılır; böyle bir kaydın
+    adlandırması hiç yapılmamıştır. Bir grupta aynı eski yolun birden çok
+    kaydı varsa yalnızca en sonuncusu (sonekli hedef) geri alınır.
+    """
+    bucket = []
+    seen = set()
+    with open(path, 'rb') as stream:
+        for index, line in enumerate(_lines_reversed(stream)):
+            try:
+                value = json.loads(line)
+            except ValueError:
+                if index == 0:
+                    continue
+                raise ValueError(f"Bozuk günlük satırı: {path}: {line[:80]!r}")
+            if isinstance(value, list):
+                old_path, new_path = value
+                if old_path not in seen:
+                    seen.add(old_path)
+                    bucket.append((new_path, old_path))
+            elif 'bucket' in value:
+                if bucket:
+                    yield bucket
+                bucket = []
+                seen = set()
+            elif value.get('journal') != JOURNAL_VERSION:
+                raise ValueError(f"Desteklenmeyen günlük sürümü: {path}")
+    if bucket:
+        yield bucket
+
+def count_journal_records(path):
+    """
+    Günlükteki adlandırma kaydı sayısı (ilerleme için hızlı ön sayım);
+    sonekli hedef kayıtları da sayıldığından bir üst sınırdır.
+    """
+    with open(path, 'rb') as stream:
+        return sum(1 for line in stream if line.startswith(b'['))
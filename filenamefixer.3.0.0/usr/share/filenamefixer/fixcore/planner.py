@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+Yeniden adlandırma planı: bir dizindeki tüm öneriler birlikte çözülür.
+
+Tarayıcı her dizini bir kez okur ve plan_directory'ye verir. Aynı dizindeki
+iki öğe asla aynı hedef ada yönlendirilmez; uygulama aşaması da planı
+olduğu gibi kullanır, adları yeniden hesaplamaz.
+
+Her bulgu, taramada bilinen derinliğini (başlangıç dizininin doğrudan
+içindeki öğeler için 0) taşır. Uygulama planı bu derinliğe göre
+gruplanır: bir gruptaki öğelerin hiçbiri diğerinin atası olamayacağından
+grup içi adlandırmalar güvenle eşzamanlı yapılabilir.
+"""
+
+import os
+
+from .rules import TYPE_DIR, TYPE_FILE, collision_key, truncate_utf8, utf8_len
+
+MAX_SUFFIX = 999
+
+def suffixed_name(base, ext, counter, limit=None, max_bytes=None):
+    """
+    base + ext'in counter'ıncı sonekli hali ("rapor", ".txt", 1 ->
+    "rapor_1.txt"). Sonekli ad limit (karakter) ya da max_bytes (UTF-8 bayt)
+    sınırını aşacaksa base'in sonundan kısaltılır; aşmıyorsa base kalır.
+    """
+    suffix = f"_{counter}"
+    full_base = base
+    if limit is not None and len(base) + len(suffix) + len(ext) > limit:
+        base = base[:max(limit - len(suffix) - len(ext), 1)]
+    if max_bytes is not None:
+        base = truncate_utf8(base, max_bytes - len(suffix) - utf8_len(ext)) or base[:1]
+    if base != full_base:
+        # Kesimin sonda bıraktığı nokta ve boşluklar atılır ("rapor ._1" olmaz)
+        base = base.rstrip(' .') or base[:1]
+    return f"{base}{suffix}{ext}"
+
+class SiblingIndex:
+    """
+    Bir dizindeki mevcut ve önerilmiş adların rezervasyon tablosu.
+
+    Anahtar hedef adın rules.collision_key biçimi (NFC + büyük harf), değer o
+    adı tutan öğenin şu anki adıdır; böylece "Rapor.txt" ile "rapor.txt"
+    Windows'ta olduğu gibi çakışır. Anahtarlar dizin başına bir kez
+    hesaplanır. Diskteki adlar kendilerine ayrılmış olarak başlar (aynı
+    anahtara düşen adlardan ilki kazanır); her öneri ayrılırken tabloya
+    eklenir. Benzersiz sonek (_1, _2, ...) arama diske sormak yerine sözlük
+    aramasıyla yapılır ve her önek için son kullanılan sayaç saklanır,
+    böylece aynı öneke kısalan her dosyada sayım 1'den başlamaz.
+    """
+
+    __slots__ = ('owners', 'contested', '_next_suffix')
+
+    def __init__(self, names=()):
+        self.owners = {}
+        # Anahtarı başka bir mevcut ada ait olan adlar (ör. ikinci "rapor.txt")
+        self.contested = set()
+        owners = self.owners
+        for name in names:
+            if owners.setdefault(collision_key(name), name) != name:
+                self.contested.add(name)
+        self._next_suffix = {}
+
+    def _claim(self, name, current_name):
+        """Ad boşsa (ya da zaten current_name'in ise) ayırır ve True döner."""
+        key = collision_key(name)
+        owner = self.owners.get(key)
+        if owner is None or owner == current_name:
+            self.owners[key] = current_name
+            return True
+        return False
+
+    def allocate(self, base, ext, current_name, limit=None, max_bytes=None):
+        """
+        base + ext için boş bir ad bulur, current_name adına ayırır ve döndürür.
+
+        Öğenin kendi adı çakışma sayılmaz. MAX_SUFFIX denemede boş ad
+        bulunamazsa sonek eklenmemiş ad döner. limit (karakter) ya da
+        max_bytes (UTF-8 bayt) verilirse sonekli adlar bu sınırları aşmasın
+        diye base'in sonundan kısaltılır.
+        """
+        new_name = f"{base}{ext}"
+        if self._claim(new_name, current_name):
+            return new_name
+
+        key = (base, ext)
+        counter = self._next_suffix.get(key, 1)
+        while counter <= MAX_SUFFIX:
+            candidate = suffixed_name(base, ext, counter, limit, max_bytes)
+            counter += 1
+            if self._claim(candidate, current_name):
+                self._next_suffix[key] = counter
+                return candidate
+
+        self._next_suffix[key] = counter
+        return new_name
+
+def plan_directory(dirs, files, rules, include_dirs=True, stats=None, depth=0, only=None, root=None):
+    """
+    Bir dizinin DirEntry listelerinden sorunlu öğeleri ve önerilerini üretir:
+    (full_path, original_name, proposed_new_name, item_type, depth).
+    depth, bu dizindeki öğelerin başlangıç dizinine göre derinliğidir.
+    only bir ad kümesiyse yalnızca bu adlar incelenir; diğer adlar yine de
+    kardeş olarak ayrılır, öneriler onlarla çakışmaz.
+    root verilirse tam yollar DirEntry.path yerine root'tan kurulur (dizin
+    açık tanımlayıcısından okunduysa DirEntry.path yalnızca addır).
+
+    rules, tarama başında bir kez derlenen rules.NameRules nesnesidir.
+    Tüm öneriler tek bir SiblingIndex üzerinden ayrılır, bu yüzden sonuç
+    kendi içinde ve diskteki kardeşlerle çakışmasızdır. Zaten temiz olan
+    adlar rules.is_clean ile tam yoldan geçmeden atlanır; stats verilirse
+    incelenen, hızlı yoldan geçen ve sorunlu bulunan öğe sayıları ile
+    önerilen adı da rules.fit_len'e sığmayan (elle kısaltılması gereken)
+    bulgular ona eklenir.
+    """
+    propose = rules.propose
+    needs_fix = rules.needs_fix
+    is_clean = rules.is_clean
+    fit_len = rules.fit_len
+
+    # Dizinler önce eklenir: büyük/küçük harf çakışmasında dizin adını korur
+    siblings = SiblingIndex(entry.name for entries in (dirs, files) for entry in entries)
+    contested = siblings.contested
+
+    groups = ((dirs, True, TYPE_DIR), (files, False, TYPE_FILE)) if include_dirs else \
+             ((files, False, TYPE_FILE),)
+    examined = 0
+    fast = 0
+    found = 0
+    too_long = []
+    try:
+        for entries, is_directory, item_type in groups:
+            for entry in entries:
+                name = entry.name
+                if only is not None and name not in only:
+                    continue
+                examined += 1
+                if is_clean(name) and name not in contested:
+                    fast += 1
+                    continue
+                proposed_new_name = propose(name, is_directory, siblings)
+                if needs_fix(name, proposed_new_name):
+                    found += 1
+                    full_path = entry.path if root is None else os.path.join(root, name)
+                    if len(proposed_new_name) > fit_len:
+                        too_long.append(full_path)
+                    yield full_path, name, proposed_new_name, item_type, depth
+    finally:
+        if stats is not None:
+            stats.entries += examined
+            stats.fast_path += fast
+            stats.findings += found
+            for full_path in too_long:
+                stats.add_too_long(full_path)
+
+def plan_rename_buckets(items):
+    """
+    Taranan öğeleri derinliklerine göre gruplar ve en derin gruptan
+    başlayarak [(full_path, new_full_path), ...] listeleri üretir.
+
+    Öğeler tek geçişte gruplara dağıtılır; yalnızca farklı derinlik
+    değerleri sıralanır. Böylece alt öğeler üst dizinlerinden önce
+    adlandırılır. Hedef adlar taramada çakışmasız olarak belirlendiği için
+    yeniden hesaplanmaz. Yeni adı eskisiyle aynı olan öğeler (yol
+    bütçesine sığdırılamayıp yalnızca listelenenler) atlanır.
+    """
+    buckets = {}
+    join = os.path.join
+    dirname = os.path.dirname
+    for full_path, original_name, proposed_new_name, _item_type, depth in items:
+        if proposed_new_name == original_name:
+            continue
+        bucket = buckets.get(depth)
+        if bucket is None:
+            bucket = buckets[depth] = []
+        bucket.append((full_path, join(dirname(full_path), proposed_new_name)))
+    for depth in sorted(buckets, reverse=True):
+        yield buckets.pop(depth)
+
+def plan_renames(items):
+    """
+    Taranan öğeler için (full_path, new_full_path) çiftlerini en derin
+    öğelerden başlayarak üretir (bkz. plan_rename_buckets).
+    """
+    for bucket in plan_rename_buckets(items):
+        yield from bucket
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+Hedef profilleri: adların hangi dosya sistemine uygun hale getirileceği.
+
+Bir profil yalnızca kuralları tanımlar (izin verilen ya da yasak
+karakterler, ayrılmış aygıt adları, ad sınırları); kurallar NameRules
+kurulurken tek bir temizleme ifadesine ve tek bir "zaten temiz mi"
+ifadesine derlenir. Profile kural eklemek ad başına yeni bir geçiş
+eklemez, yalnızca derlenen ifadeyi genişletir.
+
+Hiçbir profil büyük/küçük harf duyarlı değildir: Windows'un gördüğü bütün
+hedeflerde "Rapor.txt" ile "rapor.txt" aynı addır (bkz. rules.collision_key).
+"""
+
+# İzin verilen karakterler:
+# a-zA-Z0-9 : Standart Latin harfleri ve rakamlar.
+# . \- _ : Nokta, tire ve alt tire.
+# çÇğĞıİöÖşŞüÜ : Türkçe karakterler.
+# \s : Boşluk karakteri.
+ALLOWED_CHARS = r'a-zA-Z0-9.\-_çÇğĞıİöÖşŞüÜ\s'
+
+INVALID_WINDOWS_CHARS = r'[<>:"/\\|?*]'
+
+# Win32 katmanının hiçbir dosya sisteminde kullandırmadığı karakterler
+# (yukarıdakiler ve 0-31 denetim karakterleri)
+WINDOWS_FORBIDDEN_CHARS = r'<>:"/\\|?*\x00-\x1f'
+
+# Win32'nin aygıt adları; uzantılı halleri ("NUL.txt") de ayrılmıştır
+WINDOWS_RESERVED_NAMES = (
+    'CON', 'PRN', 'AUX', 'NUL',
+    *(f'COM{n}' for n in '123456789¹²³'),
+    *(f'LPT{n}' for n in '123456789¹²³'),
+)
+
+# NTFS, exFAT ve FAT32 (uzun adlar) bir adı en fazla 255 karakter tutar
+WINDOWS_NAME_MAX = 255
+
+class Profile:
+    """
+    Bir hedef dosya sisteminin ad kuralları.
+
+    allowed bir karakter sınıfı içeriğiyse yalnızca o karakterler kalır
+    (beyaz liste); None ise forbidden karakterleri silinir (kara liste).
+    reserved adları (uzantıdan önceki kısım, büyük/küçük harf duyarsız)
+    sonlarına "_" eklenerek değiştirilir. max_len ve max_bytes hedefin
+    kesin sınırlarıdır; kullanıcının verdiği daha dar sınırlar geçerli kalır.
+
+    trim_dots True ise gövdenin başındaki ve uzantıdan önceki nokta ve
+    boşluklar da silinir (uygulamanın kendi kuralı). False ise yalnızca
+    Windows'un yasakladığı, adın sonundaki nokta ve boşluklar silinir;
+    ".git" ve ".bashrc" gibi adlar olduğu gibi kalır.
+    """
+
+    __slots__ = ('name', 'allowed', 'forbidden', 'reserved', 'max_len', 'max_bytes', 'trim_dots')
+
+    def __init__(self, name, allowed=None, forbidden=WINDOWS_FORBIDDEN_CHARS, reserved=(),
+                 max_len=WINDOWS_NAME_MAX, max_bytes=None, trim_dots=False):
+        self.name = name
+        self.allowed = allowed
+        self.forbidden = forbidden
+        self.reserved = tuple(reserved)
+        self.max_len = max_len
+        self.max_bytes = max_bytes
+        self.trim_dots = trim_dots
+
+    def __repr__(self):
+        return f"Profile({self.name!r})"
+
+DEFAULT_PROFILE = 'default'
+
+PROFILES = {
+    # Uygulamanın asıl kuralı: Türkçe harfler ve güvenli ASCII dışındaki her şey silinir
+    'default': Profile('default', allowed=ALLOWED_CHARS, trim_dots=True),
+    # Win32 katmanı üç dosya sisteminde de aynı kuralları uygular; ayrı adlar
+    # hedefi açıkça seçmek ve ileride ayrışabilmeleri içindir
+    'ntfs': Profile('ntfs', reserved=WINDOWS_RESERVED_NAMES),
+    'exfat': Profile('exfat', reserved=WINDOWS_RESERVED_NAMES),
+    'fat32': Profile('fat32', reserved=WINDOWS_RESERVED_NAMES),
+    # Windows istemcileri Windows kurallarını uygular; Linux sunucusundaki
+    # ext4 ise adı 255 bayta sınırlar
+    'smb': Profile('smb', reserved=WINDOWS_RESERVED_NAMES, max_bytes=255),
+}
+
+def get_profile(profile=None):
+    """Adı ya da kendisi verilen profili döndürür; None varsayılan profildir."""
+    if isinstance(profile, Profile):
+        return profile
+    try:
+        return PROFILES[profile or DEFAULT_PROFILE]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen profil: {profile} "
+                         f"(seçenekler: {', '.join(PROFILES)})") from None
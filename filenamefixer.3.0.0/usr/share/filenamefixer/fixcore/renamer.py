@@ -0,0 +1,441 @@
+# -*- coding: utf-8 -*-
+"""
+Plandaki yeniden adlandırmaları diske uygular.
+
+workers > 1 verildiğinde adlandırmalar sınırlı bir iş parçacığı havuzunda
+eşzamanlı yapılır; ağ paylaşımlarında her os.rename bir gidiş-dönüş
+olduğundan kazanç büyüktür. Plan derinlik gruplarından oluşur (bkz.
+planner.plan_rename_buckets): bir gruptaki adlandırmalar aynı anda
+yapılır, sonraki (daha sığ) gruba ancak grup tamamen bitince geçilir.
+
+Başarısız adlandırmalar RenameErrors'ta toplanır; uygulama hiçbir hatada
+durup beklemez, rapor sonunda bir kez gösterilir ya da dışa aktarılır.
+Bir journal.RenameJournal verilirse adlandırmalar önce ona yazılır ve
+undo_renames aynı yürütücüyle onları ters sırada geri alır.
+
+Adlandırmalar tam yollarla değil, öğenin bulunduğu dizinin açık
+tanımlayıcısına göreli (renameat) yapılır: her dizin ilk adlandırmasında
+bir kez açılır ve çekirdek derin yolları öğe başına yeniden çözmez.
+
+Hiçbir adlandırma var olan bir adın üzerine yazmaz. Linux'ta her
+adlandırma renameat2(RENAME_NOREPLACE) ile tek ve atomik bir çağrıdır;
+hedef ad taramadan sonra başkasınca alınmışsa EEXIST döner ve sıradaki
+sonekli ad denenir. renameat2'yi desteklemeyen sistemlerde ve dosya
+sistemlerinde (ör. NFS) hedef önce yoklanır; yoklama ile adlandırma
+arasında küçük bir yarış penceresi kalır.
+"""
+
+import errno
+import functools
+import os
+import time
+
+from .planner import MAX_SUFFIX, plan_rename_buckets, suffixed_name
+from .rules import collision_key
+from .scanner import DIR_FLAGS, PROGRESS_INTERVAL
+
+# Havuz başına aynı anda bekleyebilecek adlandırma sayısı çarpanı
+IN_FLIGHT_PER_WORKER = 4
+
+# Adlandırmalar arasında açık tutulan, o an kullanılmayan dizin tanımlayıcısı sayısı
+DIR_FD_CACHE = 64
+
+# renameat2 bayrağı (<linux/fs.h>)
+RENAME_NOREPLACE = 1
+
+# (renameat2, get_errno); yüklenmediyse None, kullanılamıyorsa False
+_renameat2 = None
+
+def _load_renameat2():
+    """libc'deki renameat2'yi ctypes ile ilk adlandırmada bir kez yükler."""
+    global _renameat2
+    if _renameat2 is None:
+        import ctypes
+
+        try:
+            # Süreç zaten libc'ye bağlıdır; find_library'nin ldconfig çağrısı gerekmez
+            func = ctypes.CDLL(None, use_errno=True).renameat2
+        except (OSError, AttributeError):
+            _renameat2 = False
+        else:
+            func.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p,
+                             ctypes.c_uint)
+            func.restype = ctypes.c_int
+            _renameat2 = (func, ctypes.get_errno)
+    return _renameat2
+
+class RenameErrors:
+    """
+    Başarısız adlandırmaların (full_path, errno, message) kayıtları.
+
+    add, apply_renames'in on_error geri çağırması olarak verilebilir.
+    """
+
+    __slots__ = ('entries',)
+
+    def __init__(self):
+        self.entries = []
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.entries)
+
+    def add(self, full_path, exc):
+        code = getattr(exc, 'errno', None)
+        message = getattr(exc, 'strerror', None) or str(exc)
+        self.entries.append((full_path, code, message))
+
+    def summary(self):
+        """
+        Hataları errno'ya göre gruplar; çoktan aza sıralı
+        (errno, message, count) listesi döndürür.
+        """
+        groups = {}
+        for _path, code, message in self.entries:
+            group = groups.get(code)
+            if group is None:
+                groups[code] = [message, 1]
+            else:
+                group[1] += 1
+        return sorted(((code, message, count) for code, (message, count) in groups.items()),
+                      key=lambda group: -group[2])
+
+    def write_csv(self, stream):
+        """Raporu path,errno,code,message sütunlarıyla CSV olarak yazar."""
+        import csv
+
+        writer = csv.writer(stream)
+        writer.writerow(('path', 'errno', 'code', 'message'))
+        for full_path, code, message in self.entries:
+            writer.writerow((full_path, '' if code is None else code,
+                             errno.errorcode.get(code, ''), message))
+
+    def export(self, path):
+        with open(path, 'w', encoding='utf-8', newline='') as stream:
+            self.write_csv(stream)
+
+class _DirFds:
+    """
+    Adlandırmaların yapıldığı dizinlerin açık tanımlayıcıları.
+
+    Bir dizin içindeki ilk adlandırmada bir kez açılır, sonrakiler ona
+    göreli yapılır. Tarama sırası bir dizinin öğelerini art arda getirdiği
+    için küçük bir önbellek yeter; kullanımda olmayanların sayısı limit'i
+    aşınca en eskileri kapatılır. Birden çok iş parçacığından kullanılabilir.
+    """
+
+    def __init__(self, limit=DIR_FD_CACHE):
+        import threading
+
+        self._lock = threading.Lock()
+        self._limit = limit
+        self._entries = {}      # dizin yolu -> [fd, kullanan sayısı]
+        # Dosya sistemi RENAME_NOREPLACE'i reddederse çalıştırmanın geri
+        # kalanında boşuna denenmez
+        self.noreplace = True
+
+    def acquire(self, directory):
+        with self._lock:
+            entry = self._entries.get(directory)
+            if entry is not None:
+                entry[1] += 1
+                return entry[0]
+        # Açma (ağ paylaşımlarında bir gidiş-dönüş) kilit dışında yapılır
+        fd = os.open(directory or os.curdir, DIR_FLAGS)
+        with self._lock:
+            entry = self._entries.get(directory)
+            if entry is None:
+                self._entries[directory] = [fd, 1]
+                return fd
+            # Başka bir iş parçacığı aynı dizini bu arada açmış
+            entry[1] += 1
+        os.close(fd)
+        return entry[0]
+
+    def release(self, directory):
+        with self._lock:
+            self._entries[directory][1] -= 1
+            excess = len(self._entries) - self._limit
+            if excess > 0:
+                idle = [path for path, (_fd, users) in self._entries.items() if not users]
+                for path in idle[:excess]:
+                    os.close(self._entries.pop(path)[0])
+
+    def close(self):
+        """Bütün tanımlayıcıları kapatır; kullanımda olan kalmamalıdır."""
+        with self._lock:
+            for fd, _users in self._entries.values():
+                os.close(fd)
+            self._entries.clear()
+
+def _lexists(name, dir_fd):
+    try:
+        os.stat(name, dir_fd=dir_fd, follow_symlinks=False)
+    except OSError:
+        return False
+    return True
+
+def _rename_noreplace(name, new_name, dir_fd, dir_fds):
+    """
+    dir_fd dizinindeki name'i new_name'e taşır; new_name varsa üzerine
+    yazmaz, FileExistsError verir.
+    """
+    renameat2 = dir_fds.noreplace and _load_renameat2()
+    if renameat2:
+        func, get_errno = renameat2
+        if func(dir_fd, os.fsencode(name), dir_fd, os.fsencode(new_name), RENAME_NOREPLACE) == 0:
+            return
+        code = get_errno()
+        if code not in (errno.EINVAL, errno.ENOSYS):
+            raise OSError(code, os.strerror(code), name, None, new_name)
+        dir_fds.noreplace = False
+    if _lexists(new_name, dir_fd):
+        raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), new_name)
+    os.rename(name, new_name, src_dir_fd=dir_fd, dst_dir_fd=dir_fd)
+
+def _same_entry(name, new_name, dir_fd):
+    """
+    İki ad, harf duyarsız bir dosya sisteminde aynı öğeyi mi gösteriyor
+    (yalnızca büyük/küçük harfi değişen ad kendisiyle çakışır).
+    """
+    if collision_key(name) != collision_key(new_name):
+        return False
+    try:
+        return os.path.samestat(os.stat(name, dir_fd=dir_fd, follow_symlinks=False),
+                                os.stat(new_name, dir_fd=dir_fd, follow_symlinks=False))
+    except OSError:
+        return False
+
+def _suffixed(name, counter, directory, rules=None):
+    """
+    name'in counter'ıncı sonekli hali ("rapor.txt" -> "rapor_1.txt"). rules
+    verilirse gövde, taramadaki SiblingIndex.allocate gibi yalnızca sonekli
+    ad kuralların karakter, bayt ya da tam yol sınırını aşarsa kısaltılır.
+    """
+    base, ext = os.path.splitext(name)
+    limit = max_bytes = None
+    if rules is not None:
+        # Üst dizinler henüz eski adlarındadır; bütçe taramadakinden dar olabilir
+        rules = rules.for_parent(len(os.path.abspath(directory)))
+        limit = rules.max_len if rules.count_ext else None
+        max_bytes = rules.max_bytes
+    return suffixed_name(base, ext, counter, limit, max_bytes)
+
+def _rename(full_path, new_full_path, dir_fds, journal=None, rules=None):
+    """
+    Öğeyi aynı dizindeki yeni adına taşır ve vardığı yolu döndürür; öğe
+    taramadan sonra silinmişse FileNotFoundError verir.
+
+    Hedef ad bu arada başkasınca alınmışsa üzerine yazılmaz, sıradaki
+    sonekli ad denenir (bkz. _suffixed). Günlük verilirse her yeni hedef,
+    adlandırmadan önce önceki kaydın yerine geçen bir kayıt olarak yazılır.
+    """
+    directory, name = os.path.split(full_path)
+    planned_name = new_name = os.path.basename(new_full_path)
+    fd = dir_fds.acquire(directory)
+    try:
+        counter = 0
+        while True:
+            try:
+                _rename_noreplace(name, new_name, fd, dir_fds)
+                break
+            except FileExistsError:
+                if counter == 0 and _same_entry(name, new_name, fd):
+                    # Aynı öğe; üzerine yazılacak başka bir veri yoktur
+                    os.rename(name, new_name, src_dir_fd=fd, dst_dir_fd=fd)
+                    break
+                counter += 1
+                if counter > MAX_SUFFIX:
+                    raise
+                new_name = _suffixed(planned_name, counter, directory, rules)
+                if journal is not None:
+                    journal.record([(full_path, os.path.join(directory, new_name))])
+    finally:
+        dir_fds.release(directory)
+    return os.path.join(directory, new_name)
+
+def _restore(new_path, old_path, dir_fds, journal=None):
+    """
+    Günlükteki bir adlandırmayı geri alır ve eski yolu döndürür. Eski ad
+    zaten yerindeyse ve yeni ad yoksa (adlandırma hiç yapılmamış ya da zaten
+    geri alınmış) None döner. Eski adı bu arada başka bir öğe almışsa onun
+    üzerine yazılmaz, FileExistsError verir.
+    """
+    directory, new_name = os.path.split(new_path)
+    old_name = os.path.basename(old_path)
+    fd = dir_fds.acquire(directory)
+    try:
+        _rename_noreplace(new_name, old_name, fd, dir_fds)
+    except FileNotFoundError:
+        if _lexists(old_name, fd):
+            return None
+        raise
+    except FileExistsError:
+        if not _lexists(new_name, fd):
+            return None
+        if not _same_entry(new_name, old_name, fd):
+            raise FileExistsError(errno.EEXIST, os.strerror(errno.EEXIST), old_path) from None
+        os.rename(new_name, old_name, src_dir_fd=fd, dst_dir_fd=fd)
+    finally:
+        dir_fds.release(directory)
+    return old_path
+
+def apply_renames(items, on_error=None, on_rename=None, workers=1, should_stop=None,
+                  on_progress=None, progress_interval=PROGRESS_INTERVAL, journal=None, rules=None):
+    """
+    Öğeleri taramada önerilen adlarla yeniden adlandırır ve
+    (fixed_count, failed_count) döndürür.
+
+    on_error(full_path, exc) her başarısız adlandırmada (taramadan sonra
+    silinmiş öğeler dahil; ör. RenameErrors.add),
+    on_rename(full_path, new_full_path) her başarılı adlandırmada çağrılır;
+    hedef ad taramadan sonra başkasınca alındıysa new_full_path öğenin
+    sonek eklenmiş gerçek yoludur.
+    Geri çağırmaların hepsi apply_renames'i çağıran iş parçacığında çalışır.
+
+    should_stop verilirse her adlandırmadan önce çağrılır; True dönerse yeni
+    adlandırma başlatılmaz, havuzda sürenler bitirilip sayılar döndürülür.
+    on_progress(done, total) en fazla progress_interval saniyede bir ve
+    sonunda bir kez çağrılır.
+
+    journal bir journal.RenameJournal ise adlandırmalar yapılmadan önce
+    parça parça ona yazılır; undo_renames ile geri alınabilir.
+
+    rules, öğeleri tarayan NameRules'tur; hedef ad bu arada alındığında
+    eklenen sonekli adlar onun sınırlarına sığdırılır. Verilmezse sonekli
+    adlar kısaltılmaz.
+    """
+    # Adı değişen her öğe bir adlandırmadır; toplam için gruplar önceden açılmaz
+    if not hasattr(items, '__len__'):
+        items = list(items)
+    total = sum(1 for item in items if item[2] != item[1])
+    operation = _rename if rules is None else functools.partial(_rename, rules=rules)
+    return _run_buckets(plan_rename_buckets(items), total, operation, on_error, on_rename,
+                        workers, should_stop, on_progress, progress_interval, journal)
+
+def undo_renames(journal_path, on_error=None, on_rename=None, workers=1, should_stop=None,
+                 on_progress=None, progress_interval=PROGRESS_INTERVAL):
+    """
+    Günlükteki adlandırmaları ters sırada geri alır ve
+    (restored_count, failed_count) döndürür.
+
+    Geri çağırmalar apply_renames'tekiyle aynıdır; yolların ilki öğenin
+    şu anki (yeni) yolu, ikincisi geri verilen eski yoludur. Hiç yapılmamış
+    ya da zaten geri alınmış adlandırmalar atlanır, bu yüzden yarıda kalan
+    bir geri alma yeniden çalıştırılabilir.
+    """
+    from .journal import count_journal_records, read_journal_buckets
+    total = count_journal_records(journal_path)
+    return _run_buckets(read_journal_buckets(journal_path), total, _restore, on_error, on_rename,
+                        workers, should_stop, on_progress, progress_interval)
+
+def _journaled(bucket, journal):
+    """Grubun çiftlerini, her parçayı önce günlüğe yazarak üretir."""
+    if journal is None:
+        yield from bucket
+        return
+    from .journal import JOURNAL_BATCH
+    journal.begin_bucket()
+    for start in range(0, len(bucket), JOURNAL_BATCH):
+        chunk = bucket[start:start + JOURNAL_BATCH]
+        journal.record(chunk)
+        yield from chunk
+
+def _run_buckets(buckets, total, operation, on_error, on_rename, workers, should_stop,
+                 on_progress, progress_interval, journal=None):
+    """
+    Grupları sırayla işler; operation(src, dst, dir_fds, journal) yapılan
+    adlandırmada öğenin vardığı yolu (sonek eklendiyse dst'den farklıdır),
+    atlananda None döndürür ya da hata verir.
+
+    Dizin tanımlayıcıları her grubun sonunda kapatılır: sonraki (daha sığ)
+    grup bu dizinlerin kendilerini adlandırır, yolları artık geçerli değildir.
+    """
+    counts = [0, 0, 0]      # fixed, failed, done
+    last_report = 0.0
+
+    def settle(full_path, new_full_path=None, error=None):
+        nonlocal last_report
+        if error is not None:
+            counts[1] += 1
+            if on_error:
+                on_error(full_path, error)
+        elif new_full_path is not None:
+            counts[0] += 1
+            if on_rename:
+                on_rename(full_path, new_full_path)
+        counts[2] += 1
+        if on_progress:
+            now = time.monotonic()
+            if now - last_report >= progress_interval:
+                last_report = now
+                on_progress(counts[2], total)
+
+    dir_fds = _DirFds()
+    try:
+        if workers > 1 and total > 1:
+            _run_parallel(buckets, operation, settle, workers, should_stop, journal, dir_fds)
+        else:
+            _run_serial(buckets, operation, settle, should_stop, journal, dir_fds)
+    finally:
+        dir_fds.close()
+
+    if on_progress:
+        on_progress(counts[2], total)
+    return counts[0], counts[1]
+
+def _run_serial(buckets, operation, settle, should_stop, journal, dir_fds):
+    """Derinlik gruplarını sırayla, adlandırmaları tek tek uygular."""
+    for bucket in buckets:
+        for full_path, new_full_path in _journaled(bucket, journal):
+            if should_stop and should_stop():
+                return
+            if full_path == new_full_path:
+                settle(full_path)
+                continue
+            try:
+                result = operation(full_path, new_full_path, dir_fds, journal)
+            except Exception as e:
+                settle(full_path, error=e)
+            else:
+                settle(full_path, result)
+        dir_fds.close()
+
+def _run_parallel(buckets, operation, settle, workers, should_stop, journal, dir_fds):
+    """
+    Derinlik gruplarını sırayla, her grubu sınırlı bir havuzda uygular;
+    sonuçlar settle ile çağıran iş parçacığında işlenir.
+    """
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    in_flight = {}      # future -> full_path
+    limit = workers * IN_FLIGHT_PER_WORKER
+
+    def collect(done):
+        for future in done:
+            full_path = in_flight.pop(future)
+            error = future.exception()
+            settle(full_path, None if error else future.result(), error)
+
+    with ThreadPoolExecutor(workers, thread_name_prefix='fnf-rename') as executor:
+        try:
+            for bucket in buckets:
+                for full_path, new_full_path in _journaled(bucket, journal):
+                    if should_stop and should_stop():
+                        return
+                    if full_path == new_full_path:
+                        settle(full_path)
+                        continue
+                    while len(in_flight) >= limit:
+                        collect(wait(in_flight, return_when=FIRST_COMPLETED).done)
+                    future = executor.submit(operation, full_path, new_full_path, dir_fds, journal)
+                    in_flight[future] = full_path
+                # Üst dizinler, alt öğelerinin hepsi bitmeden adlandırılmasın
+                collect(wait(in_flight).done)
+                dir_fds.close()
+        finally:
+            # Durdurulsa da başlatılmış adlandırmaların sonucu kaybolmasın
+            if in_flight:
+                collect(wait(in_flight).done)
@@ -0,0 +1,366 @@
+# -*- coding: utf-8 -*-
+"""
+Ad kuralları: geçersiz karakter temizleme, kısaltma ve sorun tespiti.
+
+Kurallar NameRules nesnesinde bir kez derlenir; tarayıcı her tarama için
+bir tane oluşturur ve her ad için aynı derlenmiş ifadeleri kullanır.
+clean_filename/shorten_filename/needs_fix eski arayüzü korur.
+"""
+
+import functools
+import os
+import re
+import unicodedata
+
+from .profiles import DEFAULT_PROFILE, INVALID_WINDOWS_CHARS, get_profile
+
+# Sonuç türleri (arayüzde ve CLI çıktısında bu değerler kullanılır)
+TYPE_DIR = 'Dizin'
+TYPE_FILE = 'Dosya'
+
+# Windows'un klasik tam yol sınırı (MAX_PATH, sondaki NUL hariç)
+WINDOWS_MAX_PATH = 260
+
+# ext4, btrfs ve çoğu SMB sunucusunda bir adın en fazla bayt sayısı (NAME_MAX)
+NAME_MAX_BYTES = 255
+
+# Tam yol bütçesi dolmuş dizinlerde bile adlar bundan kısa kesilmez;
+# yol bütçeyi aşmaya devam eder (öğe yine bildirilir) ama ad okunur kalır
+MIN_NAME_LEN = 8
+
+def utf8_len(name):
+    """Adın UTF-8 bayt uzunluğu; ASCII adlarda kodlama yapılmaz."""
+    if name.isascii():
+        return len(name)
+    return len(name.encode('utf-8', 'surrogateescape'))
+
+def _char_start(data, index):
+    # Devam baytlarının (10xxxxxx) üstünden karakterin ilk baytına geri gidilir
+    while index > 0 and data[index] & 0xC0 == 0x80:
+        index -= 1
+    return index
+
+def _is_mark_at(data, index):
+    lead = data[index]
+    size = 1 if lead < 0xC0 else 2 if lead < 0xE0 else 3 if lead < 0xF0 else 4
+    char = data[index:index + size].decode('utf-8', 'surrogateescape')[:1]
+    return unicodedata.category(char)[0] == 'M'
+
+def truncate_utf8(text, max_bytes):
+    """
+    text'i UTF-8 kodlaması max_bytes bayta sığacak şekilde sondan keser.
+
+    Ad bir kez kodlanır ve kesim noktası baytlar üzerinde bulunur: önce
+    çok baytlı bir dizinin ortasından karakter başına geri gidilir, kesilen
+    ilk karakter birleşik bir işaretse (ör. ayrışık yazılmış bir aksan)
+    taşıyıcı harfi de atılır; böylece harf işaretsiz kalmaz.
+    """
+    data = text.encode('utf-8', 'surrogateescape')
+    if len(data) <= max_bytes:
+        return text
+    cut = _char_start(data, max(max_bytes, 0))
+    while cut > 0 and _is_mark_at(data, cut):
+        cut = _char_start(data, cut - 1)
+    return data[:cut].decode('utf-8', 'surrogateescape')
+
+class NameRules:
+    """
+    Bir tarama için bir kez derlenen temizleme/kısaltma kuralları.
+
+    Düzenli ifadeler ve max_len kurulumda hazırlanır; clean, propose ve
+    needs_fix her ad için yalnızca bu hazır nesneleri kullanır.
+
+    max_path verilirse adlar ayrıca tam yol bütçesine sığdırılır: tarayıcı
+    her dizinin (önerilen adlarla) yol uzunluğunu üst dizininden taşır ve
+    for_parent ile o dizindeki adlar için daraltılmış kuralları alır.
+    count_ext True ise max_len uzantı dahil bütün ada uygulanır (yol
+    bütçesi için daraltılan kurallar böyledir). fit_len max_len'den küçükse
+    bu uzunluğu aşan adlar, daha fazla kısaltılamasalar da sorunlu sayılır.
+
+    max_bytes verilirse adlar (uzantı dahil) UTF-8 olarak bu kadar bayta da
+    sığdırılır; Türkçe harfler ikişer bayt tutar, bu yüzden karakter
+    sınırına uyan bir ad bayt sınırını aşabilir (bkz. truncate_utf8).
+
+    profile bir profiles.Profile ya da adıdır (varsayılan: 'default').
+    Profilin karakter kuralı, ayrılmış adları ve baş/son nokta-boşluk
+    kuralı is_clean için tek bir ifadeye derlenir; profilin kesin sınırları
+    max_len ve max_bytes'ı ayrıca daraltır.
+    """
+
+    def __init__(self, max_len=200, max_path=None, count_ext=False, fit_len=None, max_bytes=None,
+                 profile=None):
+        profile = get_profile(profile)
+        self.profile = profile
+        max_len = min(max_len, profile.max_len)
+        if profile.max_bytes is not None:
+            max_bytes = profile.max_bytes if max_bytes is None else min(max_bytes, profile.max_bytes)
+        self.max_len = max_len
+        self.max_path = max_path
+        self.count_ext = count_ext
+        self.fit_len = max_len if fit_len is None else min(fit_len, max_len)
+        self.max_bytes = max_bytes
+        self._limited = {}
+
+        if profile.allowed is not None:
+            disallowed, allowed = f'[^{profile.allowed}]', f'[{profile.allowed}]'
+            invalid = INVALID_WINDOWS_CHARS
+        else:
+            disallowed, allowed = f'[{profile.forbidden}]', f'[^{profile.forbidden}]'
+            invalid = disallowed
+        self._normalize = profile.allowed is not None
+        self._trim_dots = profile.trim_dots
+        self._remove_disallowed = functools.partial(re.compile(disallowed).sub, '')
+        self._find_invalid = re.compile(invalid).search
+        self._reserved = frozenset(name.upper() for name in profile.reserved)
+        reserved = ''
+        if profile.reserved:
+            # Uzantıdan (ilk noktadan) önceki kısım bir aygıt adıysa ad temiz değildir
+            names = '|'.join(re.escape(name) for name in profile.reserved)
+            reserved = f'(?!(?i:{names}) *(?:\\.|$))'
+        dots = ''
+        if profile.trim_dots:
+            # Baş nokta/boşluk değil, son noktadan (uzantıdan) önce nokta/boşluk yok
+            dots = '(?![ .])(?!.*[ .]\\.[^.]*$)'
+        # Bütün ad kuralları tek ifadede: ayrılmış ad yok, profilin nokta kuralları,
+        # her karakter izinli, son karakter nokta/boşluk değil
+        self._clean_match = re.compile(
+            f'{reserved}{dots}{allowed}*(?<![ .])', re.S).fullmatch
+
+    def signature(self):
+        """
+        Kuralların sonucunu belirleyen ayarların metni; önbellek kayıtları
+        bununla anahtarlanır. Kurallara yeni bir ayar eklenirse buraya da
+        eklenmelidir.
+        """
+        signature = f"max_len={self.max_len}"
+        if self.max_path is not None:
+            signature += f",max_path={self.max_path}"
+        if self.count_ext:
+            signature += ",count_ext"
+        if self.fit_len != self.max_len:
+            signature += f",fit_len={self.fit_len}"
+        if self.max_bytes is not None:
+            signature += f",max_bytes={self.max_bytes}"
+        if self.profile.name != DEFAULT_PROFILE:
+            signature += f",profile={self.profile.name}"
+        return signature
+
+    def for_parent(self, parent_len):
+        """
+        Yol uzunluğu parent_len olan bir dizindeki adlar için geçerli
+        kuralları döndürür. Bütçe adı max_len'den fazla kısıtlamıyorsa
+        kuralların kendisi döner; kısıtlıyorsa ad sınırı bütçeye indirilmiş
+        (ve sınır başına bir kez derlenmiş) kurallar döner.
+
+        Bütçe MIN_NAME_LEN'den azsa kısaltma yolu sığdıramaz; adlar yol için
+        kısaltılmaz, yalnızca fit_len'i aştıkları için sorunlu sayılırlar.
+        """
+        if self.max_path is None or parent_len is None:
+            return self
+        # Ayırıcı için bir karakter
+        fit_len = self.max_path - parent_len - 1
+        if fit_len >= self.max_len:
+            return self
+        rules = self._limited.get(fit_len)
+        if rules is None:
+            if fit_len < MIN_NAME_LEN:
+                rules = NameRules(self.max_len, count_ext=self.count_ext, fit_len=fit_len,
+                                  max_bytes=self.max_bytes, profile=self.profile)
+            else:
+                rules = NameRules(fit_len, count_ext=True, max_bytes=self.max_bytes,
+                                  profile=self.profile)
+            self._limited[fit_len] = rules
+        return rules
+
+    def is_clean(self, name):
+        """
+        Adın temizleme ve kısaltmadan değişmeden çıkacağını ucuzca söyler.
+
+        True dönerse propose(name) == name ve needs_fix False'tur (kardeş
+        çakışmaları hariç; onları SiblingIndex.contested söyler). False
+        dönmesi adın sorunlu olduğu anlamına gelmez, yalnızca tam yoldan
+        geçmesi gerekir.
+        """
+        if len(name) > self.fit_len or self._clean_match(name) is None:
+            return False
+        return self.max_bytes is None or utf8_len(name) <= self.max_bytes
+
+    def clean_parts(self, filename):
+        """
+        Temizlenmiş (base, ext) çiftini döndürür; clean ile aynı kuralları
+        uygular ama sonucu yeniden bölmek gerekmez.
+        """
+        if not self._trim_dots:
+            # Windows yalnızca sondaki nokta ve boşlukları yasaklar; ad bütün
+            # olarak temizlenip yeniden bölünür, uzantıdaki yasaklı karakterler
+            # de gider
+            cleaned = self._remove_disallowed(filename).rstrip(' .') or "unnamed"
+            cleaned_base, ext = os.path.splitext(cleaned)
+            if self._reserved:
+                cleaned_base = self._unreserve(cleaned_base)
+            return cleaned_base, ext
+
+        base, ext = os.path.splitext(filename)
+
+        # macOS'tan gelen ayrışık (NFD) adlarda "ş" = "s" + birleşik çengel olur;
+        # çengel beyaz listede olmadığından silinmesin diye önce NFC'ye çevrilir.
+        # Kara liste profilleri çengeli zaten korur; ad olduğu gibi kalır.
+        if self._normalize and not base.isascii():
+            base = unicodedata.normalize('NFC', base)
+
+        # Belirtilenler dışındaki her şeyi (emojiler dahil) sil, sonra
+        # sondaki/baştaki nokta ve boşlukları temizle (Windows sevmez)
+        cleaned_base = self._remove_disallowed(base).strip(' .') or "unnamed"
+
+        if self._reserved:
+            cleaned_base = self._unreserve(cleaned_base)
+
+        return cleaned_base, ext
+
+    def _unreserve(self, base, max_len=None, max_bytes=None):
+        """
+        İlk noktadan önceki kısmı bir aygıt adıysa ("CON", "nul.txt") base'i
+        kullanılabilir kılar: o kısmın sonuna "_" eklenir, ek max_len ya da
+        max_bytes sınırına sığmıyorsa son harfi "_" ile değiştirilir.
+        """
+        stem = base.split('.', 1)[0].rstrip(' ')
+        if stem.upper() not in self._reserved:
+            return base
+        rest = base[len(stem):]
+        if (max_len is None or len(base) < max_len) and \
+           (max_bytes is None or utf8_len(base) < max_bytes):
+            return f"{stem}_{rest}"
+        return f"{stem[:-1]}_{rest}"
+
+    def clean(self, filename):
+        """
+        Windows yasaklı karakterlerini, emojileri ve sembolleri temizler.
+        Türkçe karakterleri (ğ, ü, ş, ı, ö, ç) ve standart ASCII karakterleri korur.
+        """
+        cleaned_base, ext = self.clean_parts(filename)
+        return cleaned_base + ext
+
+    def propose(self, name, is_directory, siblings=None, directory=None):
+        """
+        Ad için önerilen yeni adı döndürür (gerekirse kısaltılmış ve benzersiz).
+
+        siblings bir planner.SiblingIndex ise çakışmalar bu dizinden çözülür;
+        verilmezse kısaltılan adlar için directory içinde diske sorulur.
+        """
+        cleaned_base, ext = self.clean_parts(name)
+        if is_directory:
+            # Klasörlerde uzantı yoktur, tüm ad kısaltmaya tabidir
+            cleaned_base += ext
+            ext = ''
+
+        max_len = self.max_len
+        limit = None
+        if self.count_ext:
+            # Sınır bütün ada uygulanır; sonekler de sınırın içinde kalmalı
+            limit = max_len
+            max_len = max(max_len - len(ext), 1)
+        max_bytes = self.max_bytes
+        base_bytes = None
+        full_base = cleaned_base
+        if max_bytes is not None:
+            # Uzantı korunur; kesim yalnızca gövdeden yapılır
+            base_bytes = max(max_bytes - utf8_len(ext), 1)
+            if len(cleaned_base) > max_len:
+                cleaned_base = cleaned_base[:max_len]
+            cleaned_base = truncate_utf8(cleaned_base, base_bytes) or cleaned_base[:1]
+        shortened = len(cleaned_base) > max_len
+        shortened_base = cleaned_base[:max_len] if shortened else cleaned_base
+        if shortened_base != full_base:
+            # Kesim sonda nokta ya da boşluk bırakmış olabilir; Windows bunları
+            # atar ve ad yine değişirdi
+            keep = max_len if base_bytes is None else min(max_len, base_bytes)
+            shortened_base = shortened_base.rstrip(' .') or "unnamed"[:keep]
+            if is_directory and self._trim_dots:
+                # Kesik klasör adında son nokta değişmiş olabilir; uygulamanın
+                # kuralı onun önünde de nokta ve boşluk bırakmaz ("a..b" -> "a.b")
+                stem, dot_ext = os.path.splitext(shortened_base)
+                shortened_base = stem.rstrip(' .') + dot_ext
+        # Kısaltma bir aygıt adı bırakmış olabilir ("CONSOLE" -> "CON"); sonekler
+        # ("_1") aygıt adı oluşturmadığından bu denetim kısaltmadan sonra yeterlidir
+        if self._reserved:
+            shortened_base = self._unreserve(shortened_base, max_len, base_bytes)
+        if not shortened:
+            if siblings is not None:
+                return siblings.allocate(shortened_base, ext, name, limit, max_bytes)
+            return shortened_base + ext
+
+        if siblings is not None:
+            return siblings.allocate(shortened_base, ext, name, limit, max_bytes)
+
+        new_name = f"{shortened_base}{ext}"
+
+        counter = 1
+        original_shortened_name = new_name
+        while new_name != name and os.path.exists(os.path.join(directory, new_name)):
+            new_name = f"{shortened_base}_{counter}{ext}"
+            counter += 1
+            if counter > 999:
+                return original_shortened_name
+
+        return new_name
+
+    def needs_fix(self, original_name, proposed_new_name):
+        """Adın Windows'ta sorun çıkarıp çıkarmayacağını söyler."""
+        return proposed_new_name != original_name or len(original_name) > self.fit_len or \
+               self._find_invalid(original_name) is not None or \
+               original_name.endswith((' ', '.')) or \
+               (self.max_bytes is not None and utf8_len(original_name) > self.max_bytes)
+
+@functools.lru_cache(maxsize=None)
+def get_rules(max_len):
+    """Eski fonksiyon arayüzü için max_len başına paylaşılan NameRules."""
+    return NameRules(max_len)
+
+def clean_filename(filename):
+    """
+    Windows yasaklı karakterlerini, emojileri ve sembolleri temizler.
+    Türkçe karakterleri (ğ, ü, ş, ı, ö, ç) ve standart ASCII karakterleri korur.
+    """
+    # Temizleme max_len'e bağlı değildir
+    return get_rules(200).clean(filename)
+
+def shorten_filename(filepath, max_len, is_directory=None, siblings=None):
+    """
+    Dosya/klasör adını (uzantı hariç) belirtilen maksimum uzunluğa kadar kısaltır ve
+    gerekirse çakışmaları önlemek için sayı ekler.
+
+    Öğenin türü zaten biliniyorsa (ör. DirEntry.is_dir()) is_directory ile
+    verilmelidir; verilmezse os.path.isdir ile diskten sorulur.
+
+    siblings, aynı dizindeki adları tutan bir planner.SiblingIndex ise
+    çakışmalar diske sorulmadan bu dizinden çözülür; kısaltılmayan adlar da
+    kardeşleriyle çakışmayacak şekilde ayrılır.
+    """
+    directory, name = os.path.split(filepath)
+    if is_directory is None:
+        is_directory = os.path.isdir(filepath)
+    return get_rules(max_len).propose(name, is_directory, siblings, directory)
+
+def collision_key(name):
+    """
+    Windows'ta aynı sayılan adlar için ortak anahtar üretir.
+
+    NTFS büyük/küçük harf duyarsızdır ve NFC/NFD biçimlerini ayrı tutsa da
+    kopyalama araçları çoğunlukla normalleştirir; bu yüzden "Rapor.txt",
+    "rapor.txt" ve ayrışık yazılmış eşdeğerleri aynı anahtara düşer.
+
+    NTFS adları harf başına tek karakterlik bir büyük harf tablosuyla
+    karşılaştırır; casefold ya da str.upper'ın genişleyen eşlemeleri
+    ("ß" -> "ss"/"SS") uygulanmaz, "Straße.txt" ile "Strasse.txt" ayrıdır.
+    """
+    if not name.isascii():
+        name = unicodedata.normalize('NFC', name)
+    key = name.upper()
+    if len(key) != len(name):
+        # Genişleyen harfler olduğu gibi kalır
+        key = ''.join(char if len(char.upper()) != 1 else char.upper() for char in name)
+    return key
+
+def needs_fix(original_name, proposed_new_name, max_len):
+    """Adın Windows'ta sorun çıkarıp çıkarmayacağını söyler."""
+    return get_rules(max_len).needs_fix(original_name, proposed_new_name)
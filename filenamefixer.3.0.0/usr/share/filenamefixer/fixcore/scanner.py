@@ -0,0 +1,615 @@
+# -*- coding: utf-8 -*-
+"""
+Dizin ağacını dolaşıp sorunlu adları bulan tarayıcı.
+
+os.walk yerine doğrudan os.scandir kullanılır: DirEntry nesneleri türü
+(dizin/dosya/bağlantı) dizin okunurken öğrenir, bu bilgi kurallara kadar
+taşınır ve öğe başına ek stat çağrısı yapılmaz. Aynı okuma, dizinin tüm
+önerilerini birlikte çözen planner.plan_directory'yi de besler.
+
+workers > 1 verildiğinde başlangıç dizininin her alt ağacı bir iş
+parçacığı (ya da use_processes ile süreç) havuzunda taranır; sonuçlar
+alt dizin sırasıyla birleştirildiği için çıktı seri taramayla aynıdır.
+İş parçacıkları bulguları alt ağaç başına sınırlı bir kuyruktan parça
+parça aktarır; sırası gelmemiş alt ağaçlar kuyrukları dolunca bekler,
+böylece bellek kullanımı ağacın boyutuna bağlı kalmaz. Süreç havuzunda
+ise her alt ağacın bulguları o alt ağaç bitince topluca gelir.
+
+on_progress verilirse tarama sayaçlarının bir kopyası en fazla
+progress_interval saniyede bir ona iletilir; count_entries ile önceden
+yapılan hızlı sayım, kalan süre tahmini için ScanStats.total'a yazılabilir.
+
+cache bir cache.ScanCache ise durumu (inode, mtime) değişmemiş dizinler
+okunmadan önbellekten yanıtlanır.
+
+Dizinler yol yerine açık tanımlayıcılarıyla okunur: her dizin bir kez, üst
+dizinine göreli (openat) açılır; okuma, durum sorgusu ve alt dizinlerin
+açılması bu tanımlayıcıya göreli yapılır. Böylece çekirdek derin ağaçlarda
+(özellikle NFS'te) her çağrıda tam yolu baştan çözmez. Açık kalan
+tanımlayıcı sayısı en fazla ağacın derinliği kadardır.
+"""
+
+import os
+import time
+
+from .rules import TYPE_DIR, TYPE_FILE, NameRules
+from .planner import plan_directory
+
+# İlerleme bildirimleri arasındaki en kısa süre (saniye); adlandırma ve
+# arayüzler de aynı aralığı kullanır
+PROGRESS_INTERVAL = 0.25
+
+# Dizin tanımlayıcıları (tarama ve adlandırmada) bu bayraklarla açılır
+DIR_FLAGS = os.O_RDONLY | os.O_DIRECTORY | os.O_CLOEXEC
+
+# ScanStats'in sınıra sığmayan bulgulardan sakladığı en fazla yol
+TOO_LONG_SAMPLE = 20
+
+class ScanStats:
+    """
+    Tarama sayaçları; scan_tree'ye verilirse tarama ilerledikçe güncellenir.
+
+    total, count_entries ile önceden sayılmış öğe sayısıdır (bilinmiyorsa
+    None); verilirse fraction ve eta hesaplanabilir.
+
+    too_long, önerilen adıyla da ad ya da yol sınırını aşan bulguların
+    sayısıdır (uzantı çok uzunsa ya da üst dizinler yola yer bırakmamışsa);
+    bunların elle kısaltılması gerekir. too_long_paths ilk TOO_LONG_SAMPLE
+    tanesinin yollarıdır.
+    """
+
+    __slots__ = ('directories', 'entries', 'fast_path', 'findings', 'cached', 'too_long',
+                 'too_long_paths', 'current_path', 'total', 'started')
+
+    def __init__(self, total=None):
+        self.directories = 0
+        self.entries = 0
+        self.fast_path = 0
+        self.findings = 0
+        self.cached = 0         # önbellekten yanıtlanan dizinler
+        self.too_long = 0
+        self.too_long_paths = []
+        self.current_path = ''
+        self.total = total
+        self.started = time.monotonic()
+
+    def merge(self, other):
+        self.directories += other.directories
+        self.entries += other.entries
+        self.fast_path += other.fast_path
+        self.findings += other.findings
+        self.cached += other.cached
+        self.too_long += other.too_long
+        room = TOO_LONG_SAMPLE - len(self.too_long_paths)
+        if room > 0:
+            self.too_long_paths.extend(other.too_long_paths[:room])
+
+    def add_too_long(self, path):
+        """Sınıra sığdırılamayan bir bulguyu sayar."""
+        self.too_long += 1
+        if len(self.too_long_paths) < TOO_LONG_SAMPLE:
+            self.too_long_paths.append(path)
+
+    def copy(self):
+        snapshot = ScanStats(self.total)
+        snapshot.merge(self)
+        snapshot.current_path = self.current_path
+        snapshot.started = self.started
+        return snapshot
+
+    def elapsed(self):
+        return time.monotonic() - self.started
+
+    def rate(self):
+        """Saniyede incelenen öğe sayısı."""
+        elapsed = self.elapsed()
+        return self.entries / elapsed if elapsed > 0 else 0.0
+
+    def fraction(self):
+        """Tamamlanan oran (0..1); toplam bilinmiyorsa None."""
+        if not self.total:
+            return None
+        return min(1.0, self.entries / self.total)
+
+    def eta(self):
+        """Kalan süre tahmini (saniye); toplam ya da hız bilinmiyorsa None."""
+        rate = self.rate()
+        if self.total is None or rate <= 0:
+            return None
+        return max(0.0, (self.total - self.entries) / rate)
+
+def format_duration(seconds):
+    """Süreyi "dd:ss" ya da bir saati aşıyorsa "s:dd:ss" olarak yazar."""
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}" if hours else f"{minutes:02d}:{seconds:02d}"
+
+class _ProgressThrottle:
+    """on_progress'i en fazla interval saniyede bir, sayaçların kopyasıyla çağırır."""
+
+    __slots__ = ('_callback', '_interval', '_snapshot', '_last')
+
+    def __init__(self, callback, interval, snapshot):
+        self._callback = callback
+        self._interval = interval
+        self._snapshot = snapshot
+        self._last = 0.0
+
+    def __call__(self, force=False):
+        now = time.monotonic()
+        if force or now - self._last >= self._interval:
+            self._last = now
+            self._callback(self._snapshot())
+
+class ResultBatcher:
+    """
+    Bulguları biriktirip toplu olarak teslim eder.
+
+    Her bulgu için ayrı bildirim (ör. Qt sinyali) göndermek yerine, size
+    kadar bulgu biriktiğinde ya da son teslimden bu yana interval saniye
+    geçtiğinde flush(liste) bir kez çağrılır. Bulgu gelmeyen uzun
+    aralıklarda da bekleyenler gecikmesin diye poll() periyodik olarak
+    (ör. should_stop içinden) çağrılabilir.
+    """
+
+    __slots__ = ('_flush', '_size', '_interval', '_pending', '_last_flush')
+
+    def __init__(self, flush, size=500, interval=0.1):
+        self._flush = flush
+        self._size = size
+        self._interval = interval
+        self._pending = []
+        self._last_flush = time.monotonic()
+
+    def add(self, item):
+        self._pending.append(item)
+        if len(self._pending) >= self._size:
+            self.flush()
+        else:
+            self.poll()
+
+    def poll(self):
+        if self._pending and time.monotonic() - self._last_flush >= self._interval:
+            self.flush()
+
+    def flush(self):
+        self._last_flush = time.monotonic()
+        if self._pending:
+            pending = self._pending
+            self._pending = []
+            self._flush(pending)
+
+class _OpenDir:
+    """
+    Taranan bir dizinin açık tanımlayıcısı. Alt dizinleri buna göreli
+    açılır; pending alt dizinin sonuncusu açılınca kendiliğinden kapanır.
+    """
+
+    __slots__ = ('fd', 'pending')
+
+    def __init__(self, fd):
+        self.fd = fd
+        self.pending = 0
+
+    @classmethod
+    def open(cls, path, parent=None):
+        """
+        Dizini açar; parent verilirse yalnızca son bileşen ona göreli çözülür
+        ve bu arada sembolik bağlantıya dönüşmüş dizinlere girilmez.
+        Açılamazsa fd None olur.
+        """
+        try:
+            if parent is None:
+                fd = os.open(path, DIR_FLAGS)
+            else:
+                fd = os.open(os.path.basename(path), DIR_FLAGS | os.O_NOFOLLOW, dir_fd=parent.fd)
+        except OSError:
+            fd = None
+        finally:
+            if parent is not None:
+                parent.release()
+        return cls(fd)
+
+    def release(self):
+        self.pending -= 1
+        if self.pending <= 0:
+            self.close()
+
+    def close(self):
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
+
+def _close_dirs(current, stack):
+    """Erken çıkışta açık kalan dizin tanımlayıcılarını kapatır."""
+    if current is not None:
+        current.close()
+    for entry in stack:
+        if entry[-1] is not None:
+            entry[-1].close()
+
+def list_dir(path, fd=None):
+    """
+    Dizini bir kez okur ve (dirs, files) DirEntry listeleri döndürür.
+    fd verilirse dizin açık tanımlayıcısından okunur; o zaman DirEntry.path
+    yalnızca addır.
+
+    Açılamayan dizinlerde os.walk gibi sessizce boş liste döner.
+    """
+    dirs = []
+    files = []
+    try:
+        with os.scandir(path if fd is None else fd) as it:
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    dirs.append(entry)
+                else:
+                    files.append(entry)
+    except OSError:
+        pass
+    return dirs, files
+
+def count_entries(start_path, include_dirs=True, should_stop=None):
+    """
+    Taramanın inceleyeceği öğe sayısını kuralları uygulamadan hızlıca sayar.
+
+    Dizinler scan_tree ile aynı şekilde dolaşılır (sembolik bağlantılı
+    dizinlere girilmez); include_dirs False ise dizinler sayılmaz.
+    should_stop True dönerse o ana kadarki sayı döner.
+    """
+    count = 0
+    stack = [(start_path, None)]
+    directory = None
+    try:
+        while stack:
+            if should_stop and should_stop():
+                break
+            path, parent = stack.pop()
+            directory = _OpenDir.open(path, parent)
+            if directory.fd is None:
+                continue
+            dirs, files = list_dir(path, directory.fd)
+            count += len(files) + (len(dirs) if include_dirs else 0)
+            subdirs = [entry.name for entry in dirs if not entry.is_symlink()]
+            directory.pending = len(subdirs)
+            if not subdirs:
+                directory.close()
+            stack.extend((os.path.join(path, name), directory) for name in subdirs)
+    finally:
+        _close_dirs(directory, stack)
+    return count
+
+def _read_directory(root, depth, rules, include_dirs, stats, cache, path_len=None, fd=None):
+    """
+    Bir dizinin bulgularını ve girilecek alt dizinlerini döndürür.
+    path_len, tam yol bütçesi varsa dizinin önerilen adlarla yol uzunluğudur.
+    fd verilirse dizin yolu yerine bu açık tanımlayıcıdan okunur.
+
+    Önbellek yoksa bulgular plan_directory'den tembel olarak gelir. Varsa
+    dizin durumu değişmemişse kayıt kullanılır, değişmişse dizin okunup
+    kaydı yenilenir.
+    """
+    # Bütçeye göre daraltılmış kuralların imzası da sınırı içerir; önbellek
+    # kaydı yalnızca aynı sınırla taranan dizinlerce kullanılır
+    rules = rules.for_parent(path_len)
+    if cache is None:
+        dirs, files = list_dir(root, fd)
+        if stats is not None:
+            stats.directories += 1
+        # Sembolik bağlantı olan dizinlere os.walk gibi girilmez
+        subdirs = [os.path.join(root, entry.name) for entry in dirs if not entry.is_symlink()]
+        return plan_directory(dirs, files, rules, include_dirs, stats, depth, root=root), subdirs
+
+    config = f"{include_dirs:d}:{rules.signature()}"
+    join = os.path.join
+    # Durum dizin okunmadan önce alınır; okuma sırasında gelen bir değişiklik
+    # mtime'ı değiştirir ve sonraki taramada kayıt kullanılmaz
+    state = cache.state(root, fd)
+    cached = cache.get(root, config, state) if state else None
+    if cached is not None:
+        findings, subdir_names, entries, fast = cached
+        if stats is not None:
+            stats.directories += 1
+            stats.cached += 1
+            stats.entries += entries
+            stats.fast_path += fast
+            stats.findings += len(findings)
+            for name, proposed_new_name, _is_dir in findings:
+                if len(proposed_new_name) > rules.fit_len:
+                    stats.add_too_long(join(root, name))
+        items = [(join(root, name), name, proposed_new_name, TYPE_DIR if is_dir else TYPE_FILE, depth)
+                 for name, proposed_new_name, is_dir in findings]
+        return items, [join(root, name) for name in subdir_names]
+
+    dirs, files = list_dir(root, fd)
+    local = ScanStats()
+    local.directories = 1
+    items = list(plan_directory(dirs, files, rules, include_dirs, local, depth, root=root))
+    subdir_names = [entry.name for entry in dirs if not entry.is_symlink()]
+    if state:
+        cache.put(root, config, state,
+                  [(name, proposed_new_name, item_type == TYPE_DIR)
+                   for _path, name, proposed_new_name, item_type, _depth in items],
+                  subdir_names, local.entries, local.fast_path)
+    if stats is not None:
+        stats.merge(local)
+    return items, [join(root, name) for name in subdir_names]
+
+def scan_tree(start_path, include_dirs=True, max_len=200, should_stop=None, stats=None,
+              workers=1, use_processes=False, on_progress=None,
+              progress_interval=PROGRESS_INTERVAL, start_depth=0, cache=None, max_path=None,
+              start_path_len=None, max_bytes=None, rules=None, profile=None):
+    """
+    Dizin ağacını dolaşır ve sorunlu her öğe için
+    (full_path, original_name, proposed_new_name, item_type, depth) üretir.
+    depth, öğenin bulunduğu dizinin start_path'e göre derinliğidir
+    (start_path'in doğrudan içindekiler için start_depth).
+
+    should_stop verilirse her dizinden ve her bulgudan önce çağrılır; True
+    dönerse tarama biter.
+    stats bir ScanStats ise okunan dizin, incelenen öğe ve bulgu sayıları ile
+    o an okunan dizin ona yazılır.
+    on_progress verilirse sayaçların kopyasıyla en fazla progress_interval
+    saniyede bir ve tarama biterken bir kez daha çağrılır.
+    Sıralama os.walk ile aynıdır: önce dizinin kendi öğeleri, sonra alt dizinler.
+    cache verilirse değişmemiş dizinler önbellekten yanıtlanır ve değişenlerin
+    kaydı yenilenir.
+    max_path verilirse adlar, önerilen adlarla oluşan tam yol max_path'e
+    sığacak şekilde kısaltılır. Her dizinin yol uzunluğu üst dizininkinden
+    hesaplanıp aşağı taşınır; start_path_len verilmezse start_path'in mutlak
+    yolunun uzunluğudur.
+    max_bytes verilirse adlar UTF-8 olarak bu kadar bayta da sığdırılır.
+    profile hedef dosya sisteminin profilidir (bkz. profiles.PROFILES).
+    rules önceden derlenmiş bir NameRules ise max_len, max_path, max_bytes
+    ve profile yerine o kullanılır.
+
+    workers > 1 ise alt ağaçlar paralel taranır (bkz. modül açıklaması);
+    süreç havuzunda önbellek yalnızca başlangıç dizini için kullanılır.
+    """
+    if stats is None and on_progress is not None:
+        stats = ScanStats()
+    if rules is None:
+        rules = NameRules(max_len, max_path, max_bytes=max_bytes, profile=profile)
+    if workers > 1:
+        yield from _scan_parallel(start_path, include_dirs, rules, should_stop, stats,
+                                  workers, use_processes, on_progress, progress_interval, cache)
+        return
+
+    report = _ProgressThrottle(on_progress, progress_interval, stats.copy) if on_progress else None
+    if rules.max_path is not None and start_path_len is None:
+        start_path_len = len(os.path.abspath(start_path))
+    stack = [(start_path, start_depth, start_path_len, None)]
+    directory = None
+    try:
+        while stack:
+            if should_stop and should_stop():
+                return
+            root, depth, path_len, parent = stack.pop()
+            if stats is not None:
+                stats.current_path = root
+            directory = _OpenDir.open(root, parent)
+            if directory.fd is None:
+                # Açılamayan dizinler os.walk gibi sessizce atlanır
+                if stats is not None:
+                    stats.directories += 1
+                continue
+            items, subdirs = _read_directory(root, depth, rules, include_dirs, stats, cache, path_len,
+                                             directory.fd)
+            # Alt dizin yoksa tanımlayıcı bulgular beklenmeden bırakılır
+            directory.pending = len(subdirs)
+            if not subdirs:
+                directory.close()
+
+            renamed = {} if path_len is not None else None
+            for item in items:
+                if should_stop and should_stop():
+                    return
+                yield item
+                if renamed is not None and item[3] == TYPE_DIR:
+                    renamed[item[0]] = item[2]
+                if report:
+                    report()
+
+            if report:
+                report()
+            stack.extend((path, depth + 1, _subdir_len(path_len, path, renamed), directory)
+                         for path in reversed(subdirs))
+    finally:
+        _close_dirs(directory, stack)
+        if report:
+            report(force=True)
+
+def _subdir_len(path_len, path, renamed):
+    """Alt dizinin, varsa önerilen adıyla yol uzunluğu (bütçe yoksa None)."""
+    if path_len is None:
+        return None
+    return path_len + 1 + len(renamed.get(path) or os.path.basename(path))
+
+# --- Paralel tarama ---
+
+# Bekleyen sonuçlar için should_stop'un yoklanma aralığı (saniye)
+STOP_POLL_INTERVAL = 0.1
+
+# İş parçacıklarının aktardığı bulgu parçasının boyutu ve alt ağaç başına
+# kuyrukta bekleyebilecek en fazla parça
+STREAM_CHUNK = 256
+STREAM_DEPTH = 8
+
+_worker_stop_event = None
+
+def _init_process_worker(stop_event):
+    global _worker_stop_event
+    _worker_stop_event = stop_event
+
+def _scan_subtree(path, include_dirs, rules, should_stop, stats=None, cache=None, path_len=None):
+    """Bir alt ağacı seri tarar; (bulgular, ScanStats) döndürür."""
+    if stats is None:
+        stats = ScanStats()
+    items = list(scan_tree(path, include_dirs, should_stop=should_stop, stats=stats, start_depth=1,
+                           cache=cache, start_path_len=path_len, rules=rules))
+    return items, stats
+
+def _stream_subtree(path, include_dirs, rules, should_stop, stats, cache, path_len, out):
+    """
+    Bir alt ağacı seri tarar ve bulgularını STREAM_CHUNK'lık listeler halinde
+    out kuyruğuna koyar; bitince (hata ya da durdurmada da) None koyar.
+    Kuyruk doluysa yer açılmasını ya da should_stop'un True dönmesini bekler.
+    """
+    import queue
+
+    def put(chunk):
+        while True:
+            try:
+                out.put(chunk, timeout=STOP_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                if should_stop():
+                    return False
+
+    try:
+        chunk = []
+        for item in scan_tree(path, include_dirs, should_stop=should_stop, stats=stats,
+                              start_depth=1, cache=cache, start_path_len=path_len, rules=rules):
+            chunk.append(item)
+            if len(chunk) >= STREAM_CHUNK:
+                if not put(chunk):
+                    return
+                chunk = []
+        if chunk:
+            put(chunk)
+    finally:
+        put(None)
+
+def _scan_subtree_in_process(path, include_dirs, rules, path_len):
+    return _scan_subtree(path, include_dirs, rules, _worker_stop_event.is_set, path_len=path_len)
+
+def _scan_parallel(start_path, include_dirs, rules, should_stop, stats, workers, use_processes,
+                   on_progress=None, progress_interval=PROGRESS_INTERVAL, cache=None):
+    """
+    Başlangıç dizinini kendisi tarar, her alt dizini havuza gönderir ve
+    sonuçları alt dizin sırasıyla üretir.
+
+    Havuzdaki görevler ortak bir Event'e bakar; should_stop beklerken
+    yoklanır ve True dönerse Event kurulup bekleyen görevler iptal edilir.
+    İş parçacıklarında her alt ağacın sayaçları canlı okunur, bu yüzden
+    ilerleme bildirimleri bitmemiş alt ağaçları da içerir; süreç havuzunda
+    bir alt ağacın sayaçları ancak o alt ağaç bitince eklenir.
+    """
+    path_len = len(os.path.abspath(start_path)) if rules.max_path is not None else None
+    if stats is not None:
+        stats.current_path = start_path
+    items, subdirs = _read_directory(start_path, 0, rules, include_dirs, stats, cache, path_len)
+
+    renamed = {} if path_len is not None else None
+    for item in items:
+        if should_stop and should_stop():
+            return
+        yield item
+        if renamed is not None and item[3] == TYPE_DIR:
+            renamed[item[0]] = item[2]
+
+    if not subdirs:
+        if on_progress:
+            on_progress(stats.copy())
+        return
+
+    # Havuz modülleri pahalıdır; fixcore'un açılış süresine eklenmesinler
+    # (adlandırma havuzu da böyle yüklenir)
+    import multiprocessing
+    import threading
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+    if use_processes:
+        stop_event = multiprocessing.Event()
+        executor = ProcessPoolExecutor(workers, initializer=_init_process_worker,
+                                       initargs=(stop_event,))
+        futures = [executor.submit(_scan_subtree_in_process, path, include_dirs, rules,
+                                   _subdir_len(path_len, path, renamed))
+                   for path in subdirs]
+        live_stats = []
+        queues = None
+    else:
+        import queue
+        stop_event = threading.Event()
+        executor = ThreadPoolExecutor(workers, thread_name_prefix='fnf-scan')
+        live_stats = [ScanStats() for _ in subdirs]
+        # Görevler sırayla başlar; önündeki alt ağaçlar bittiği için sırası
+        # gelen alt ağacın görevi ya çalışıyordur ya da bitmiştir
+        queues = [queue.Queue(STREAM_DEPTH) for _ in subdirs]
+        futures = [executor.submit(_stream_subtree, path, include_dirs, rules, stop_event.is_set,
+                                   sub_stats, cache, _subdir_len(path_len, path, renamed), out)
+                   for path, sub_stats, out in zip(subdirs, live_stats, queues)]
+
+    # Henüz birleştirilmemiş ilk alt ağacın sırası
+    pending = 0
+
+    def snapshot():
+        # Diğer iş parçacıklarının sayaçlarını okumak güvenlidir, yalnızca
+        # birkaç öğe geriden gelebilirler
+        total = stats.copy()
+        for sub_stats in live_stats[pending:]:
+            total.merge(sub_stats)
+            if sub_stats.current_path and total.current_path == stats.current_path:
+                total.current_path = sub_stats.current_path
+        return total
+
+    report = _ProgressThrottle(on_progress, progress_interval, snapshot) if on_progress else None
+
+    try:
+        for index, future in enumerate(futures):
+            pending = index
+            if stats is not None:
+                stats.current_path = subdirs[index]
+            if queues is not None:
+                out = queues[index]
+                while True:
+                    try:
+                        chunk = out.get(timeout=STOP_POLL_INTERVAL)
+                    except queue.Empty:
+                        if should_stop and should_stop():
+                            return
+                        if report:
+                            report()
+                        continue
+                    if chunk is None:
+                        break
+                    for item in chunk:
+                        if should_stop and should_stop():
+                            return
+                        yield item
+                    if report:
+                        report()
+                # Görevdeki bir hata burada yeniden yükselir
+                future.result()
+                if stats is not None:
+                    stats.merge(live_stats[index])
+                pending = index + 1
+                continue
+            while not wait((future,), timeout=STOP_POLL_INTERVAL).done:
+                if should_stop and should_stop():
+                    return
+                if report:
+                    report()
+            if should_stop and should_stop():
+                return
+            items, sub_stats = future.result()
+            if stats is not None:
+                stats.merge(sub_stats)
+            # Birleştirilen alt ağaç artık canlı sayaçlarda sayılmasın
+            pending = index + 1
+            for item in items:
+                if should_stop and should_stop():
+                    return
+                yield item
+            if report:
+                report()
+    finally:
+        # Normal bitişte etkisizdir; erken çıkışta çalışan görevleri durdurur
+        stop_event.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+        if report:
+            report(force=True)
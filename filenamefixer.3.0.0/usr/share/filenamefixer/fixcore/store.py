@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+Tarama bulgularını satır satır değil sütun sütun tutan sonuç deposu.
+
+Arayüzdeki tablo modeli satırları buradan istendikçe okur; sıralama ve
+süzme de satır numaraları üzerinden yapılır, bulgular kopyalanmaz.
+
+Milyonlarca bulguda bellek için:
+  * üst dizin yolları (ve derinlikleri) bir kez saklanır (her bulgu
+    yalnızca 4 baytlık numarasını tutar), tam yol istendiğinde birleştirilir,
+  * tür bilgisi bulgu başına tek bayttır ('Dizin'/'Dosya' dizgisi değil).
+"""
+
+import os
+from array import array
+
+from .rules import TYPE_DIR, TYPE_FILE
+
+# types sütunundaki bayt değerleri
+_TYPE_CODES = {TYPE_FILE: 0, TYPE_DIR: 1}
+_TYPE_NAMES = (TYPE_FILE, TYPE_DIR)
+
+class ResultStore:
+    """
+    Bulguları (full_path, original_name, proposed_new_name, item_type, depth)
+    sütunları halinde saklar. Aynı dizindeki bulguların derinliği aynı
+    olduğundan derinlik üst dizin başına tutulur.
+
+    Yineleme eski anomalous_items listesiyle aynı demetleri üretir; bu
+    yüzden planner/renamer doğrudan bir ResultStore ile çalışabilir.
+    """
+
+    __slots__ = ('parents', 'parent_depths', 'parent_ids', 'parent_column', 'names',
+                 'proposals', 'types', '_last_parent', '_last_parent_id')
+
+    def __init__(self):
+        self.parents = []                   # üst dizin numarası -> yol
+        self.parent_depths = array('H')     # üst dizin numarası -> bulguların derinliği
+        self.parent_ids = {}                # yol -> üst dizin numarası
+        self.parent_column = array('I')
+        self.names = []
+        self.proposals = []
+        self.types = bytearray()
+        self._last_parent = None
+        self._last_parent_id = 0
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        parents = self.parents
+        depths = self.parent_depths
+        join = os.path.join
+        for parent_id, name, proposal, code in zip(self.parent_column, self.names,
+                                                   self.proposals, self.types):
+            yield join(parents[parent_id], name), name, proposal, _TYPE_NAMES[code], \
+                  depths[parent_id]
+
+    def _parent_id(self, parent, depth):
+        # Bulgular dizin dizin geldiği için çoğu zaman bir önceki üst dizindir
+        if parent == self._last_parent:
+            return self._last_parent_id
+        parent_id = self.parent_ids.get(parent)
+        if parent_id is None:
+            parent_id = len(self.parents)
+            self.parents.append(parent)
+            self.parent_depths.append(depth)
+            self.parent_ids[parent] = parent_id
+        self._last_parent = parent
+        self._last_parent_id = parent_id
+        return parent_id
+
+    def append(self, item):
+        full_path, original_name, proposed_new_name, item_type, depth = item
+        self.parent_column.append(self._parent_id(os.path.dirname(full_path), depth))
+        self.names.append(original_name)
+        self.proposals.append(proposed_new_name)
+        self.types.append(_TYPE_CODES[item_type])
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def clear(self):
+        self.parents.clear()
+        del self.parent_depths[:]
+        self.parent_ids.clear()
+        del self.parent_column[:]
+        self.names.clear()
+        self.proposals.clear()
+        self.types.clear()
+        self._last_parent = None
+        self._last_parent_id = 0
+
+    def row(self, index):
+        return self.full_path(index), self.names[index], self.proposals[index], \
+               _TYPE_NAMES[self.types[index]], self.depth(index)
+
+    def parent(self, index):
+        return self.parents[self.parent_column[index]]
+
+    def full_path(self, index):
+        return os.path.join(self.parents[self.parent_column[index]], self.names[index])
+
+    def name(self, index):
+        return self.names[index]
+
+    def proposal(self, index):
+        return self.proposals[index]
+
+    def item_type(self, index):
+        return _TYPE_NAMES[self.types[index]]
+
+    def depth(self, index):
+        return self.parent_depths[self.parent_column[index]]
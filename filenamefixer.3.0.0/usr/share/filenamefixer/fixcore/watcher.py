@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+"""
+İzleme kipi: Linux inotify ile ağaca yeni gelen adları yakalar.
+
+Ağacın her dizinine bir inotify izlemesi eklenir. Yalnızca oluşturulan
+(IN_CREATE) ve ağaca taşınan (IN_MOVED_TO) öğeler incelenir; ağacın geri
+kalanı yeniden taranmaz. Olaylar dizin başına ad kümelerinde biriktirilir
+ve debounce saniye boyunca yeni olay gelmeyince (ya da ilk olaydan beri
+max_delay geçince) tek bir toplu iş olarak işlenir. Toplu işte her dizin
+bir kez okunur; yeni adlar plan_directory'den geçer, dizindeki diğer adlar
+da kardeş olarak ayrılır, böylece öneriler mevcut adlarla çakışmaz.
+
+Ağaca yeni gelen bir dizinin içeriği olaydan önce oluşmuş olabilir; böyle
+dizinler izlemeye eklendikten sonra scan_tree ile bütünüyle taranır.
+Ağaçtan çıkan dizinlerin izlemeleri kaldırılır. Çekirdeğin olay kuyruğu
+taşarsa (IN_Q_OVERFLOW) bütün ağaç yeniden taranır.
+
+inotify bağlamaları ctypes ile yalnızca izleme başlarken yüklenir.
+"""
+
+import errno
+import os
+import struct
+import time
+
+from .rules import NameRules
+from .scanner import list_dir, scan_tree
+from .planner import plan_directory
+
+# inotify olay maskeleri (<sys/inotify.h>)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# Yazılmakta olan dosyaların kapanışı da etkinlik sayılır; yükleme sürerken
+# toplu iş ertelenir
+WATCH_MASK = (IN_CREATE | IN_MOVED_TO | IN_MOVED_FROM | IN_CLOSE_WRITE | IN_DELETE_SELF
+              | IN_ONLYDIR | IN_DONT_FOLLOW)
+
+# Son olaydan sonra toplu işin beklediği süre (saniye)
+DEBOUNCE = 2.0
+
+# Olaylar hiç kesilmese de toplu işin en geç işleneceği süre (saniye)
+MAX_DELAY = 30.0
+
+# Olay yokken should_stop'un yoklanma aralığı (saniye)
+STOP_POLL_INTERVAL = 0.5
+
+_EVENT_HEADER = struct.Struct('iIII')
+_READ_SIZE = 64 * 1024
+
+class Inotify:
+    """
+    inotify tanımlayıcısının ince ctypes sarmalayıcısı.
+
+    Bağlam yöneticisi olarak kullanılabilir. inotify yoksa (Linux dışı)
+    OSError verir.
+    """
+
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+
+        libc = ctypes.CDLL(ctypes.util.find_library('c') or None, use_errno=True)
+        try:
+            self._add_watch = libc.inotify_add_watch
+            self._rm_watch = libc.inotify_rm_watch
+            init = libc.inotify_init1
+        except AttributeError:
+            raise OSError(errno.ENOSYS, "inotify desteklenmiyor") from None
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self._rm_watch.argtypes = (ctypes.c_int, ctypes.c_int)
+        self._get_errno = ctypes.get_errno
+        self.fd = init(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            self._raise()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _raise(self, path=None):
+        code = self._get_errno()
+        raise OSError(code, os.strerror(code), path)
+
+    def add_watch(self, path, mask=WATCH_MASK):
+        """Dizini izlemeye ekler ve izleme tanımlayıcısını (wd) döndürür."""
+        wd = self._add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            self._raise(path)
+        return wd
+
+    def rm_watch(self, wd):
+        # Dizin silinmişse çekirdek izlemeyi zaten kaldırmıştır
+        self._rm_watch(self.fd, wd)
+
+    def read_events(self, timeout=None):
+        """
+        Olayları (wd, mask, cookie, name) listesi olarak döndürür; timeout
+        saniye içinde olay gelmezse boş liste döner.
+        """
+        import select
+
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return []
+        events = []
+        unpack = _EVENT_HEADER.unpack_from
+        header = _EVENT_HEADER.size
+        while True:
+            try:
+                data = os.read(self.fd, _READ_SIZE)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(data):
+                wd, mask, cookie, length = unpack(data, offset)
+                offset += header
+                name = data[offset:offset + length].rstrip(b'\0')
+                offset += length
+                events.append((wd, mask, cookie, os.fsdecode(name)))
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+class TreeWatcher:
+    """
+    Bir dizin ağacını izler ve yeni gelen sorunlu öğeleri toplu halde
+    on_findings(items) ile bildirir; items scan_tree'deki gibi
+    (full_path, original_name, proposed_new_name, item_type, depth)
+    demetleridir ve apply_renames'e doğrudan verilebilir.
+
+    max_path, max_bytes ve profile scan_tree'deki gibidir; tam yol bütçesinde
+    dizinlerin yol uzunluğu diskteki yollarından alınır.
+
+    run() should_stop True dönene kadar çalışır. Olaylar ve geri çağırmalar
+    run'ı çağıran iş parçacığında işlenir.
+    """
+
+    def __init__(self, root, on_findings, include_dirs=True, max_len=200, debounce=DEBOUNCE,
+                 max_delay=MAX_DELAY, should_stop=None, stats=None, max_path=None, max_bytes=None,
+                 profile=None):
+        self.root = os.path.abspath(root)
+        self.on_findings = on_findings
+        self.include_dirs = include_dirs
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.should_stop = should_stop
+        self.stats = stats
+        self.rules = NameRules(max_len, max_path, max_bytes=max_bytes, profile=profile)
+        self._inotify = None
+        self._paths = {}            # wd -> dizin yolu
+        self._watches = {}          # dizin yolu -> wd
+        self._pending = {}          # dizin yolu -> yeni adlar kümesi
+        self._new_trees = set()     # bütünüyle taranacak dizinler
+        self._first_event = None
+        self._last_event = None
+
+    def run(self):
+        with Inotify() as inotify:
+            self._inotify = inotify
+            try:
+                self._watch_tree(self.root)
+                while not (self.should_stop and self.should_stop()):
+                    events = inotify.read_events(self._timeout())
+                    if events:
+                        self._last_event = time.monotonic()
+                        if self._first_event is None:
+                            self._first_event = self._last_event
+                        for event in events:
+                            self._handle(*event)
+                    if self._due():
+                        self.flush()
+            finally:
+                self._inotify = None
+                self._paths.clear()
+                self._watches.clear()
+
+    def _timeout(self):
+        if self._last_event is None:
+            return STOP_POLL_INTERVAL
+        now = time.monotonic()
+        remaining = min(self._last_event + self.debounce, self._first_event + self.max_delay) - now
+        return min(max(remaining, 0.0), STOP_POLL_INTERVAL)
+
+    def _due(self):
+        if self._last_event is None:
+            return False
+        now = time.monotonic()
+        return now - self._last_event >= self.debounce or now - self._first_event >= self.max_delay
+
+    def _depth(self, directory):
+        """Dizindeki öğelerin kök dizine göre derinliği."""
+        return 0 if directory == self.root else directory[len(self.root):].count(os.sep)
+
+    def _watch_tree(self, top):
+        """top ve altındaki bütün dizinleri izlemeye ekler."""
+        stack = [top]
+        while stack:
+            directory = stack.pop()
+            try:
+                wd = self._inotify.add_watch(directory)
+            except OSError as e:
+                # İzleme sınırı aşıldıysa (fs.inotify.max_user_watches) sessiz geçilmez
+                if e.errno == errno.ENOSPC:
+                    raise
+                continue
+            self._paths[wd] = directory
+            self._watches[directory] = wd
+            dirs, _files = list_dir(directory)
+            stack.extend(entry.path for entry in dirs if not entry.is_symlink())
+
+    def _unwatch_tree(self, top):
+        """top ve altındaki dizinlerin izlemelerini kaldırır."""
+        prefix = top + os.sep
+        for directory in [path for path in self._watches if path == top or path.startswith(prefix)]:
+            wd = self._watches.pop(directory)
+            self._paths.pop(wd, None)
+            self._inotify.rm_watch(wd)
+        for directory in [path for path in self._pending if path == top or path.startswith(prefix)]:
+            del self._pending[directory]
+        self._new_trees = {path for path in self._new_trees
+                           if not (path == top or path.startswith(prefix))}
+
+    def _handle(self, wd, mask, cookie, name):
+        if mask & IN_Q_OVERFLOW:
+            # Olaylar kaybolmuştur; ağaç baştan izlenir ve taranır
+            self._paths.clear()
+            self._watches.clear()
+            self._watch_tree(self.root)
+            self._pending.clear()
+            self._new_trees = {self.root}
+            return
+        directory = self._paths.get(wd)
+        if directory is None:
+            return
+        if mask & (IN_IGNORED | IN_DELETE_SELF):
+            if self._watches.get(directory) == wd:
+                del self._watches[directory]
+            del self._paths[wd]
+            return
+        path = os.path.join(directory, name)
+        if mask & IN_MOVED_FROM:
+            if mask & IN_ISDIR:
+                self._unwatch_tree(path)
+            return
+        # Yeni gelen bir dizin izlemeye alınır ve içeriği olaydan önce
+        # oluşmuş olabileceği için bütünüyle taranır
+        if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+            self._watch_tree(path)
+            self._new_trees.add(path)
+        self._pending.setdefault(directory, set()).add(name)
+
+    def flush(self):
+        """Biriken olayları işler ve bulguları on_findings'e verir."""
+        pending, self._pending = self._pending, {}
+        new_trees, self._new_trees = self._new_trees, set()
+        self._first_event = self._last_event = None
+
+        # Bütünüyle taranacak ağaçların içindeki tek tek adlar atlanır;
+        # iç içe yeni ağaçlardan yalnızca en üsttekiler taranır
+        def covered(directory):
+            return any(directory == top or directory.startswith(top + os.sep) for top in new_trees)
+
+        new_trees = {top for top in new_trees if not any(
+            top != other and top.startswith(other + os.sep) for other in new_trees)}
+        items = []
+        for directory, names in pending.items():
+            if covered(directory):
+                continue
+            dirs, files = list_dir(directory)
+            if self.stats is not None:
+                self.stats.directories += 1
+            items.extend(plan_directory(dirs, files, self.rules.for_parent(len(directory)),
+                                        self.include_dirs, self.stats,
+                                        self._depth(directory), only=names))
+        for top in sorted(new_trees):
+            items.extend(scan_tree(top, self.include_dirs, stats=self.stats,
+                                   start_depth=self._depth(top), start_path_len=len(top),
+                                   rules=self.rules))
+        if items:
+            self.on_findings(items)
+
+def watch_tree(root, on_findings, include_dirs=True, max_len=200, debounce=DEBOUNCE,
+               max_delay=MAX_DELAY, should_stop=None, stats=None, max_path=None, max_bytes=None,
+               profile=None):
+    """
+    root ağacını should_stop True dönene kadar izler; yeni gelen sorunlu
+    öğeleri debounce ile toplayıp on_findings(items) ile bildirir
+    (bkz. TreeWatcher). inotify yoksa OSError verir.
+    """
+    TreeWatcher(root, on_findings, include_dirs, max_len, debounce, max_delay,
+                should_stop, stats, max_path, max_bytes, profile).run()
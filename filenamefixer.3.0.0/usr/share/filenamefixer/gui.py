@@ -0,0 +1,829 @@
+# -*- coding: utf-8 -*-
+"""
+FileName Fixer grafik arayüzü (PyQt6).
+
+Bu modül doğrudan değil, filenamefixer.py üzerinden yüklenir.
+"""
+
+import itertools
+import os
+import time
+from array import array
+
+from PyQt6.QtWidgets import (
+    QApplication, QWidget, QVBoxLayout, QPushButton,
+    QTableView, QHeaderView, QLabel, QFileDialog, QHBoxLayout, QMessageBox, QCheckBox,
+    QLineEdit, QFormLayout, QProgressDialog, QComboBox
+)
+from PyQt6.QtCore import Qt, QThread, QTimer, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QIntValidator, QIcon
+
+from fixcore import (
+    VERSION, TYPE_DIR, NAME_MAX_BYTES, WINDOWS_MAX_PATH, DEFAULT_PROFILE, PROFILES, PROGRESS_INTERVAL, NameRules, ScanStats, ResultBatcher, ResultStore, RenameErrors,
+    count_entries, format_duration, scan_tree, apply_renames
+)
+
+# Hedef profillerinin arayüzdeki adları (Türkçe, İngilizce)
+PROFILE_LABELS = {
+    'default': ("Varsayılan (yalnızca güvenli karakterler)", "Default (safe characters only)"),
+    'ntfs': ("NTFS (Windows diskleri)", "NTFS (Windows drives)"),
+    'exfat': ("exFAT (USB bellek, SD kart)", "exFAT (USB drive, SD card)"),
+    'fat32': ("FAT32 (eski USB bellekler)", "FAT32 (older USB drives)"),
+    'smb': ("SMB ağ paylaşımı", "SMB network share"),
+}
+
+# Üst düzey alt dizinleri paralel tarayan iş parçacığı sayısı
+SCAN_WORKERS = min(8, os.cpu_count() or 1)
+
+# Bulgular arayüze en fazla bu kadarlık gruplar halinde ve bu aralıkla gönderilir
+RESULT_BATCH_SIZE = 1000
+RESULT_BATCH_INTERVAL = 0.1
+
+# Önceden sayım yapıldığında ilerleme çubuğunun çözünürlüğü
+PROGRESS_STEPS = 1000
+
+# Hata raporunun ayrıntı bölümünde gösterilen en fazla kayıt
+ERROR_DETAIL_LIMIT = 500
+
+# Ağ paylaşımlarında her os.rename bir gidiş-dönüştür; adlandırmalar bu kadar
+# iş parçacığında eşzamanlı yapılır
+RENAME_WORKERS = 8
+
+# --- Arka Plan Tarama İş Parçacığı ---
+class FileScannerThread(QThread):
+    # [(full_path, original_name, proposed_new_name, item_type, depth), ...]
+    signal_found_items = pyqtSignal(list)
+    # ScanStats kopyası
+    signal_progress = pyqtSignal(object)
+    signal_scan_finished = pyqtSignal()
+    signal_error = pyqtSignal(str)
+
+    def __init__(self, start_path, include_dirs=True, max_len=200, workers=1, count_first=False,
+                 use_cache=False, max_path=None, max_bytes=None, profile=None):
+        super().__init__()
+        self.start_path = start_path
+        self.include_dirs = include_dirs
+        self.max_len = max_len
+        self.max_path = max_path
+        self.max_bytes = max_bytes
+        self.profile = profile
+        self.workers = workers
+        self.count_first = count_first
+        self.use_cache = use_cache
+        self.stop_scan = False
+        self.stats = ScanStats()
+
+    def run(self):
+        batcher = ResultBatcher(self.signal_found_items.emit,
+                                RESULT_BATCH_SIZE, RESULT_BATCH_INTERVAL)
+
+        def should_stop():
+            # Bulgu gelmeyen uzun dizinlerde de bekleyen grup gecikmesin
+            batcher.poll()
+            return self.stop_scan
+
+        cache = None
+        if self.use_cache:
+            try:
+                from fixcore.cache import ScanCache
+                cache = ScanCache()
+            except Exception:
+                # Önbellek yalnızca hızlandırır; açılamazsa tam tarama yapılır
+                cache = None
+
+        try:
+            if self.count_first:
+                self.stats.total = count_entries(self.start_path, self.include_dirs,
+                                                 lambda: self.stop_scan)
+                # Hız ve kalan süre sayımdan değil taramadan hesaplansın
+                self.stats.started = time.monotonic()
+            for item in scan_tree(self.start_path, self.include_dirs, self.max_len,
+                                  should_stop=should_stop, stats=self.stats,
+                                  workers=self.workers, on_progress=self.signal_progress.emit,
+                                  progress_interval=PROGRESS_INTERVAL, cache=cache,
+                                  max_path=self.max_path, max_bytes=self.max_bytes,
+                                  profile=self.profile):
+                batcher.add(item)
+        except Exception as e:
+            self.signal_error.emit(f"Tarama sırasında bir hata oluştu: {e}")
+        finally:
+            if cache:
+                cache.close()
+            batcher.flush()
+            self.signal_scan_finished.emit()
+
+    def stop(self):
+        self.stop_scan = True
+
+# --- Arka Plan Yeniden Adlandırma İş Parçacığı ---
+class RenameThread(QThread):
+    # (done, total)
+    signal_progress = pyqtSignal(int, int)
+    # (fixed_count, failed_count, interrupted); hatalar self.errors'tadır
+    signal_rename_finished = pyqtSignal(int, int, bool)
+
+    def __init__(self, items, workers=1, journal=None, rules=None):
+        super().__init__()
+        self.items = items
+        self.workers = workers
+        self.journal = journal
+        self.rules = rules
+        self.stop_rename = False
+        self.errors = RenameErrors()
+
+    def run(self):
+        fixed_count = failed_count = 0
+        try:
+            fixed_count, failed_count = apply_renames(
+                self.items, on_error=self.errors.add,
+                workers=self.workers, should_stop=lambda: self.stop_rename,
+                on_progress=self.signal_progress.emit, progress_interval=PROGRESS_INTERVAL,
+                journal=self.journal, rules=self.rules)
+        except OSError as e:
+            # Günlük yazılamazsa adlandırma durur; bu hata raporda görünsün
+            self.errors.add(getattr(self.journal, 'path', ''), e)
+        finally:
+            if self.journal:
+                self.journal.close()
+            self.signal_rename_finished.emit(fixed_count, failed_count, self.stop_rename)
+
+    def stop(self):
+        self.stop_rename = True
+
+# --- Sonuç Tablosu Modeli ---
+class ResultTableModel(QAbstractTableModel):
+    """
+    ResultStore'daki bulguları QTableView'a sunar.
+
+    Satırlar yalnızca görünür oldukça data() ile depodan okunur. Sıralama ve
+    süzme, depodaki satır numaralarını tutan tek bir dizi (_order) üzerinden
+    yapılır; bulgular hiçbir zaman kopyalanmaz.
+    """
+
+    HEADERS = {
+        'tr': ("Türü", "Orijinal", "Önerilen", "Tam Yol"),
+        'en': ("Type", "Original", "Proposed", "Full Path"),
+    }
+
+    def __init__(self, store, parent=None):
+        super().__init__(parent)
+        self.store = store
+        self.lang = 'tr'
+        self._order = None      # None: depo sırası, aksi halde görünür satırların depo indisleri
+        self._filter_text = ''
+        self._sort_column = -1
+        self._sort_order = Qt.SortOrder.AscendingOrder
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.store) if self._order is None else len(self._order)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 4
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ToolTipRole):
+            return None
+        row = index.row() if self._order is None else self._order[index.row()]
+        column = index.column()
+        if column == 0:
+            is_dir = self.store.item_type(row) == TYPE_DIR
+            if self.lang == 'tr':
+                return "Dizin" if is_dir else "Dosya"
+            return "Directory" if is_dir else "File"
+        if column == 1:
+            return self.store.name(row)
+        if column == 2:
+            return self.store.proposal(row)
+        return self.store.full_path(row)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[self.lang][section]
+        return section + 1
+
+    def set_language(self, lang):
+        self.lang = lang
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, 3)
+        rows = self.rowCount()
+        if rows:
+            self.dataChanged.emit(self.index(0, 0), self.index(rows - 1, 0))
+
+    def append_items(self, items):
+        """Yeni bulguları depoya ekler ve görünüme bildirir."""
+        if self._order is None:
+            first = len(self.store)
+            self.beginInsertRows(QModelIndex(), first, first + len(items) - 1)
+            self.store.extend(items)
+            self.endInsertRows()
+            return
+
+        # Süzme/sıralama etkinken yeni satırlar (süzgece uyuyorsa) sona eklenir
+        first = len(self.store)
+        self.store.extend(items)
+        new_rows = [row for row in range(first, len(self.store)) if self._matches(row)]
+        if new_rows:
+            start = len(self._order)
+            self.beginInsertRows(QModelIndex(), start, start + len(new_rows) - 1)
+            self._order.extend(new_rows)
+            self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.store.clear()
+        self._order = None if not self._filter_text and self._sort_column < 0 else array('q')
+        self.endResetModel()
+
+    def sort(self, column, order=Qt.SortOrder.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        self.beginResetModel()
+        self._rebuild_order()
+        self.endResetModel()
+
+    def set_filter(self, text):
+        self._filter_text = text.casefold()
+        self.beginResetModel()
+        self._rebuild_order()
+        self.endResetModel()
+
+    def _matches(self, row):
+        needle = self._filter_text
+        return not needle or needle in self.store.full_path(row).casefold() or \
+               needle in self.store.proposal(row).casefold()
+
+    def _rebuild_order(self):
+        rows = range(len(self.store))
+        if self._filter_text:
+            rows = [row for row in rows if self._matches(row)]
+        if 0 <= self._sort_column < 4:
+            key = (self.store.item_type, self.store.name,
+                   self.store.proposal, self.store.full_path)[self._sort_column]
+            rows = sorted(rows, key=key,
+                          reverse=self._sort_order == Qt.SortOrder.DescendingOrder)
+        elif not self._filter_text:
+            self._order = None
+            return
+        self._order = array('q', rows)
+
+# --- Ana GUI Uygulaması ---
+class LongFileNameFixerApp(QWidget):
+    def __init__(self):
+        super().__init__()
+        QApplication.setStyle("Fusion")
+        self.selected_directory = ""
+        self.results = ResultStore()
+        self.scanned_max_len = None
+        self.scanned_max_path = None
+        self.scanned_max_bytes = None
+        self.scanned_profile = None
+        self.scan_thread = None
+        self.rename_thread = None
+        self.current_lang = 'tr'
+        self.progress_dialog = None
+        self.scanning = False
+        self.init_ui()
+        self.retranslateUi()
+
+    def retranslateUi(self):
+        """Tüm arayüz elemanlarının metinlerini günceller."""
+        if self.current_lang == 'tr':
+            self.setWindowTitle(f"FileName Fixer v{VERSION}")
+            self.path_label.setText("Seçilen Dizin: Henüz Seçilmedi")
+            self.select_dir_button.setText("Dizin Seç")
+            self.max_len_label.setText("Maks. Ad Uzunluğu:")
+            self.max_len_input.setPlaceholderText("Maksimum karakter uzunluğu (varsayılan: 200)")
+            self.max_path_label.setText("Maks. Yol Uzunluğu:")
+            self.max_path_input.setPlaceholderText(f"Boş: sınır yok (Windows için {WINDOWS_MAX_PATH})")
+            self.profile_label.setText("Hedef Dosya Sistemi:")
+            self.include_dirs_checkbox.setText("Klasör Adlarını da Tara")
+            self.max_bytes_checkbox.setText(f"Adları {NAME_MAX_BYTES} Bayta da Sığdır (ext4/SMB sınırı)")
+            self.count_first_checkbox.setText("Kalan Süreyi Tahmin Et (önce öğeleri say)")
+            self.use_cache_checkbox.setText("Değişmeyen Dizinler İçin Önbelleği Kullan")
+            self.scan_button.setText("Tara")
+            self.stop_button.setText("Durdur")
+            self.fix_button.setText("Seçilenleri Düzelt")
+            self.about_button.setText("Hakkında")
+            self.filter_input.setPlaceholderText("Sonuçları süz (ad veya yol)...")
+            if self.selected_directory:
+                if self.scan_thread and self.scan_thread.isRunning():
+                    self.path_label.setText(f"Seçilen Dizin: {self.selected_directory} (Taranıyor...)")
+                else:
+                    self.path_label.setText(f"Seçilen Dizin: {self.selected_directory}")
+
+        elif self.current_lang == 'en':
+            self.setWindowTitle(f"FileName Fixer v{VERSION}")
+            self.path_label.setText("Selected Directory: Not Selected Yet")
+            self.select_dir_button.setText("Select Directory")
+            self.max_len_label.setText("Max. Name Length:")
+            self.max_len_input.setPlaceholderText("Maximum character length (default: 200)")
+            self.max_path_label.setText("Max. Path Length:")
+            self.max_path_input.setPlaceholderText(f"Empty: no limit ({WINDOWS_MAX_PATH} for Windows)")
+            self.profile_label.setText("Target File System:")
+            self.include_dirs_checkbox.setText("Scan Folder Names Too")
+            self.max_bytes_checkbox.setText(f"Also Fit Names into {NAME_MAX_BYTES} Bytes (ext4/SMB limit)")
+            self.count_first_checkbox.setText("Estimate Remaining Time (count entries first)")
+            self.use_cache_checkbox.setText("Use the Cache for Unchanged Directories")
+            self.scan_button.setText("Scan")
+            self.stop_button.setText("Stop")
+            self.fix_button.setText("Fix Selected")
+            self.about_button.setText("About")
+            self.filter_input.setPlaceholderText("Filter results (name or path)...")
+            if self.selected_directory:
+                if self.scan_thread and self.scan_thread.isRunning():
+                    self.path_label.setText(f"Selected Directory: {self.selected_directory} (Scanning...)")
+                else:
+                    self.path_label.setText(f"Selected Directory: {self.selected_directory}")
+
+        for index in range(self.profile_combo.count()):
+            tr_label, en_label = PROFILE_LABELS[self.profile_combo.itemData(index)]
+            self.profile_combo.setItemText(index, tr_label if self.current_lang == 'tr' else en_label)
+        self.stop_button.setStyleSheet("background-color: darkred; color: white;")
+        self.result_model.set_language(self.current_lang)
+
+
+    def init_ui(self):
+        main_layout = QVBoxLayout()
+        form_layout = QFormLayout()
+        self.setGeometry(100, 100, 700, 550)
+        
+        icon_path = "/usr/share/filenamefixer/namefixer.png"
+        if os.path.exists(icon_path):
+            self.setWindowIcon(QIcon(icon_path))
+
+        dir_selection_layout = QHBoxLayout()
+        self.path_label = QLabel()
+        self.select_dir_button = QPushButton()
+        self.select_dir_button.clicked.connect(self.select_directory)
+        dir_selection_layout.addWidget(self.path_label)
+        dir_selection_layout.addWidget(self.select_dir_button)
+        main_layout.addLayout(dir_selection_layout)
+
+        self.max_len_label = QLabel()
+        self.max_len_input = QLineEdit(self)
+        self.max_len_input.setText("200")
+        self.max_len_input.setValidator(QIntValidator(1, 255, self))
+        form_layout.addRow(self.max_len_label, self.max_len_input)
+
+        # Tam yol bütçesi isteğe bağlıdır; boş bırakılırsa yalnızca ad uzunluğuna bakılır
+        self.max_path_label = QLabel()
+        self.max_path_input = QLineEdit(self)
+        self.max_path_input.setValidator(QIntValidator(1, 32767, self))
+        form_layout.addRow(self.max_path_label, self.max_path_input)
+
+        self.profile_label = QLabel()
+        self.profile_combo = QComboBox(self)
+        for name in PROFILES:
+            self.profile_combo.addItem(name, name)
+        self.profile_combo.setCurrentIndex(self.profile_combo.findData(DEFAULT_PROFILE))
+        form_layout.addRow(self.profile_label, self.profile_combo)
+
+        self.include_dirs_checkbox = QCheckBox()
+        self.include_dirs_checkbox.setChecked(True) 
+        form_layout.addRow(self.include_dirs_checkbox)
+
+        self.max_bytes_checkbox = QCheckBox()
+        form_layout.addRow(self.max_bytes_checkbox)
+
+        self.count_first_checkbox = QCheckBox()
+        form_layout.addRow(self.count_first_checkbox)
+
+        self.use_cache_checkbox = QCheckBox()
+        self.use_cache_checkbox.setChecked(True)
+        form_layout.addRow(self.use_cache_checkbox)
+
+        main_layout.addLayout(form_layout)
+        
+        scan_stop_layout = QHBoxLayout()
+        self.scan_button = QPushButton()
+        self.scan_button.clicked.connect(self.start_scan)
+        self.scan_button.setEnabled(False)
+        
+        self.stop_button = QPushButton()
+        self.stop_button.clicked.connect(self.stop_scan)
+        self.stop_button.setEnabled(False)
+        
+        scan_stop_layout.addWidget(self.scan_button)
+        scan_stop_layout.addWidget(self.stop_button)
+        main_layout.addLayout(scan_stop_layout)
+
+        self.filter_input = QLineEdit(self)
+        self.filter_input.setClearButtonEnabled(True)
+        # Her tuşta milyonlarca satırı yeniden süzmemek için kısa bir bekleme
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(250)
+        self.filter_timer.timeout.connect(lambda: self.result_model.set_filter(self.filter_input.text()))
+        self.filter_input.textChanged.connect(self.filter_timer.start)
+        main_layout.addWidget(self.filter_input)
+
+        self.result_model = ResultTableModel(self.results, self)
+        self.result_view = QTableView()
+        self.result_view.setModel(self.result_model)
+        self.result_view.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.result_view.setWordWrap(False)
+        self.result_view.setAlternatingRowColors(True)
+        # Sabit satır yüksekliği: görünüm satırları tek tek ölçmez
+        self.result_view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.result_view.horizontalHeader().setStretchLastSection(True)
+        self.result_view.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.result_view.setSortingEnabled(True)
+        main_layout.addWidget(self.result_view)
+
+        self.fix_button = QPushButton()
+        self.fix_button.clicked.connect(self.fix_selected_items)
+        self.fix_button.setEnabled(False) 
+        main_layout.addWidget(self.fix_button)
+
+        self.language_button = QPushButton("Language")
+        self.language_button.clicked.connect(self.toggle_language)
+        main_layout.addWidget(self.language_button)
+
+        self.about_button = QPushButton()
+        self.about_button.clicked.connect(self.show_about_dialog)
+        main_layout.addWidget(self.about_button)
+
+        self.setLayout(main_layout)
+
+    def toggle_language(self):
+        if self.current_lang == 'tr':
+            self.current_lang = 'en'
+        else:
+            self.current_lang = 'tr'
+        self.retranslateUi()
+
+    def get_max_length_from_input(self):
+        try:
+            max_len_str = self.max_len_input.text()
+            if not max_len_str:
+                return 200
+            max_len = int(max_len_str)
+            if not (1 <= max_len <= 255):
+                title = "Geçersiz Giriş" if self.current_lang == 'tr' else "Invalid Input"
+                text = "Maksimum ad uzunluğu 1 ile 255 arasında bir sayı olmalıdır." if self.current_lang == 'tr' else "Maximum name length must be a number between 1 and 255."
+                QMessageBox.warning(self, title, text)
+                return -1
+            return max_len
+        except ValueError:
+            title = "Geçersiz Giriş" if self.current_lang == 'tr' else "Invalid Input"
+            text = "Maksimum ad uzunluğu için geçerli bir sayı girin." if self.current_lang == 'tr' else "Please enter a valid number for maximum name length."
+            QMessageBox.warning(self, title, text)
+            return -1
+
+    def get_max_path_from_input(self):
+        """Tam yol bütçesi; boşsa None, geçersizse -1."""
+        max_path_str = self.max_path_input.text()
+        if not max_path_str:
+            return None
+        try:
+            max_path = int(max_path_str)
+        except ValueError:
+            max_path = 0
+        if max_path < 1:
+            title = "Geçersiz Giriş" if self.current_lang == 'tr' else "Invalid Input"
+            text = "Maksimum yol uzunluğu pozitif bir sayı olmalıdır." if self.current_lang == 'tr' else "Maximum path length must be a positive number."
+            QMessageBox.warning(self, title, text)
+            return -1
+        return max_path
+
+    def select_directory(self):
+        title = "Dizin Seç" if self.current_lang == 'tr' else "Select Directory"
+        directory = QFileDialog.getExistingDirectory(self, title, os.path.expanduser("~"))
+        if directory:
+            self.selected_directory = directory
+            self.retranslateUi()
+            self.scan_button.setEnabled(True)
+            self.result_model.clear()
+            self.fix_button.setEnabled(False)
+
+    def start_scan(self):
+        if not self.selected_directory:
+            title = "Uyarı" if self.current_lang == 'tr' else "Warning"
+            text = "Lütfen önce bir dizin seçin!" if self.current_lang == 'tr' else "Please select a directory first!"
+            QMessageBox.warning(self, title, text)
+            return
+        
+        max_len = self.get_max_length_from_input()
+        if max_len == -1:
+            return
+        max_path = self.get_max_path_from_input()
+        if max_path == -1:
+            return
+        max_bytes = NAME_MAX_BYTES if self.max_bytes_checkbox.isChecked() else None
+        profile = self.profile_combo.currentData()
+
+        self.result_model.clear()
+        self.scanned_max_len = max_len
+        self.scanned_max_path = max_path
+        self.scanned_max_bytes = max_bytes
+        self.scanned_profile = profile
+        self.fix_button.setEnabled(False)
+        
+        self.scan_button.setEnabled(False)
+        self.stop_button.setEnabled(True)
+        self.select_dir_button.setEnabled(False)
+        self.include_dirs_checkbox.setEnabled(False)
+        self.max_bytes_checkbox.setEnabled(False)
+        self.profile_combo.setEnabled(False)
+        self.count_first_checkbox.setEnabled(False)
+        self.use_cache_checkbox.setEnabled(False)
+        self.max_len_input.setEnabled(False)
+        self.max_path_input.setEnabled(False)
+        self.retranslateUi()
+
+        count_first = self.count_first_checkbox.isChecked()
+        if count_first:
+            label = "Öğeler sayılıyor..." if self.current_lang == 'tr' else "Counting entries..."
+        else:
+            label = "Taranıyor..." if self.current_lang == 'tr' else "Scanning..."
+        self.progress_dialog = QProgressDialog(
+            label, "İptal" if self.current_lang == 'tr' else "Cancel", 0, 0, self
+        )
+        self.progress_dialog.setWindowTitle("Tarama Durumu" if self.current_lang == 'tr' else "Scan Status")
+        self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+        # Çubuk sona ulaştığında pencere kendiliğinden kapanmasın; tarama bitince kapatılır
+        self.progress_dialog.setAutoClose(False)
+        self.progress_dialog.setAutoReset(False)
+        self.progress_dialog.setMinimumWidth(520)
+        self.progress_dialog.canceled.connect(self.cancel_scan)
+        self.progress_dialog.show()
+
+        self.scanning = True
+        self.scan_thread = FileScannerThread(self.selected_directory, 
+                                            include_dirs=self.include_dirs_checkbox.isChecked(),
+                                            max_len=max_len,
+                                            workers=SCAN_WORKERS,
+                                            count_first=count_first,
+                                            use_cache=self.use_cache_checkbox.isChecked(),
+                                            max_path=max_path,
+                                            max_bytes=max_bytes,
+                                            profile=profile)
+        self.scan_thread.signal_found_items.connect(self.add_items)
+        self.scan_thread.signal_progress.connect(self.update_progress)
+        self.scan_thread.signal_scan_finished.connect(self.scan_finished)
+        self.scan_thread.signal_error.connect(self.handle_error)
+        self.scan_thread.start()
+        
+    def stop_scan(self):
+        if self.scan_thread and self.scan_thread.isRunning():
+            self.scan_thread.stop()
+            self.scan_thread.wait()
+            self.scan_finished(interrupted=True)
+
+    def cancel_scan(self):
+        # Pencere tarama bitince kapatılırken de canceled yayılır; onu yok say
+        if self.progress_dialog is not None:
+            self.stop_scan()
+
+    def update_progress(self, stats):
+        if self.progress_dialog is None:
+            return
+        if self.current_lang == 'tr':
+            text = (f"Taranıyor...\n{stats.directories} dizin, {stats.entries} öğe, "
+                    f"{stats.findings} bulgu\n{stats.rate():.0f} öğe/sn")
+        else:
+            text = (f"Scanning...\n{stats.directories} directories, {stats.entries} entries, "
+                    f"{stats.findings} findings\n{stats.rate():.0f} entries/s")
+        fraction = stats.fraction()
+        if fraction is not None:
+            if self.progress_dialog.maximum() != PROGRESS_STEPS:
+                self.progress_dialog.setRange(0, PROGRESS_STEPS)
+            self.progress_dialog.setValue(int(fraction * PROGRESS_STEPS))
+            eta = stats.eta()
+            if eta is not None:
+                text += f", kalan ~{format_duration(eta)}" if self.current_lang == 'tr' else f", ~{format_duration(eta)} left"
+        path = self.progress_dialog.fontMetrics().elidedText(
+            stats.current_path, Qt.TextElideMode.ElideMiddle, 480)
+        self.progress_dialog.setLabelText(f"{text}\n{path}")
+
+    def add_items(self, items):
+        self.result_model.append_items(items)
+        self.fix_button.setEnabled(True) 
+
+    def scan_finished(self, interrupted=False):
+        # Durdurulan taramanın kuyruktaki bitiş sinyali ikinci kez bildirmesin
+        if not self.scanning:
+            return
+        self.scanning = False
+        if self.progress_dialog:
+            dialog = self.progress_dialog
+            self.progress_dialog = None
+            dialog.close()
+
+        self.scan_button.setEnabled(True)
+        self.stop_button.setEnabled(False)
+        self.select_dir_button.setEnabled(True)
+        self.include_dirs_checkbox.setEnabled(True)
+        self.max_bytes_checkbox.setEnabled(True)
+        self.profile_combo.setEnabled(True)
+        self.count_first_checkbox.setEnabled(True)
+        self.use_cache_checkbox.setEnabled(True)
+        self.max_len_input.setEnabled(True)
+        self.max_path_input.setEnabled(True)
+        self.retranslateUi()
+        
+        title = "Bilgi" if self.current_lang == 'tr' else "Info"
+        if not interrupted:
+            stats = self.scan_thread.stats
+            stats_text = f"\n{stats.entries} öğe incelendi, {stats.fast_path} tanesi zaten temizdi ({format_duration(stats.elapsed())})." if self.current_lang == 'tr' else f"\n{stats.entries} entries examined, {stats.fast_path} were already clean ({format_duration(stats.elapsed())})."
+            if stats.cached:
+                stats_text += f"\n{stats.directories} dizinden {stats.cached} tanesi değişmediği için önbellekten okundu." if self.current_lang == 'tr' else f"\n{stats.cached} of {stats.directories} directories were unchanged and read from the cache."
+            if stats.too_long:
+                stats_text += f"\n{stats.too_long} öğe önerilen adıyla da sınırı aşıyor; bunların ya da üst dizinlerinin elle kısaltılması gerekir." if self.current_lang == 'tr' else f"\n{stats.too_long} items still exceed the limit with their proposed names; they or their parent directories need manual shortening."
+            if len(self.results):
+                text = f"Tarama tamamlandı. {len(self.results)} anormal öğe bulundu." if self.current_lang == 'tr' else f"Scan complete. {len(self.results)} anomalous items found."
+                QMessageBox.information(self, title, text + stats_text)
+            else:
+                text = "Tarama tamamlandı. Anormal dosya/dizin adı bulunamadı." if self.current_lang == 'tr' else "Scan complete. No anomalous file/directory names found."
+                QMessageBox.information(self, title, text + stats_text)
+                self.fix_button.setEnabled(False)
+        else:
+            text = "Tarama kullanıcı tarafından durduruldu." if self.current_lang == 'tr' else "Scan interrupted by the user."
+            QMessageBox.information(self, title, text)
+            
+    def handle_error(self, message):
+        title = "Hata" if self.current_lang == 'tr' else "Error"
+        QMessageBox.critical(self, title, message)
+        self.scan_finished() 
+
+    def fix_selected_items(self):
+        if not len(self.results):
+            title = "Uyarı" if self.current_lang == 'tr' else "Warning"
+            text = "Düzeltilecek öğe yok." if self.current_lang == 'tr' else "No items to fix."
+            QMessageBox.warning(self, title, text)
+            return
+
+        max_len = self.get_max_length_from_input()
+        if max_len == -1:
+            return
+        max_path = self.get_max_path_from_input()
+        if max_path == -1:
+            return
+        # Önerilen adlar taramada çakışmasız olarak planlandı; uzunluk sonradan
+        # ya da hedef profil değiştiyse plan geçersizdir ve yeniden tarama gerekir.
+        max_bytes = NAME_MAX_BYTES if self.max_bytes_checkbox.isChecked() else None
+        if max_len != self.scanned_max_len or max_path != self.scanned_max_path or \
+           max_bytes != self.scanned_max_bytes or self.profile_combo.currentData() != self.scanned_profile:
+            title = "Uyarı" if self.current_lang == 'tr' else "Warning"
+            text = "Maksimum ad ya da yol uzunluğu veya hedef dosya sistemi taramadan sonra değişti. Lütfen yeniden tarayın." if self.current_lang == 'tr' else "Maximum name or path length or the target file system changed after the scan. Please scan again."
+            QMessageBox.warning(self, title, text)
+            return
+
+        title = "Onay" if self.current_lang == 'tr' else "Confirmation"
+        text = "Seçili dosya ve dizin adlarını düzeltmek istediğinizden emin misiniz? Yapılan değişiklikler bir günlüğe yazılır ve 'filenamefixer undo' ile geri alınabilir." if self.current_lang == 'tr' else "Are you sure you want to fix the selected file and directory names? The changes are recorded in a journal and can be reverted with 'filenamefixer undo'."
+        reply = QMessageBox.question(self, title, text, QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, QMessageBox.StandardButton.No)
+
+        if reply == QMessageBox.StandardButton.Yes:
+            from fixcore.journal import RenameJournal, default_journal_path
+            try:
+                journal = RenameJournal(default_journal_path())
+            except OSError as e:
+                error_title = "Hata" if self.current_lang == 'tr' else "Error"
+                error_text = f"Geri alma günlüğü açılamadı: {e}" if self.current_lang == 'tr' else f"Could not open the undo journal: {e}"
+                QMessageBox.critical(self, error_title, error_text)
+                return
+
+            self.fix_button.setEnabled(False)
+            self.scan_button.setEnabled(False)
+            self.select_dir_button.setEnabled(False)
+
+            self.progress_dialog = QProgressDialog(
+                "Yeniden adlandırılıyor..." if self.current_lang == 'tr' else "Renaming...",
+                "İptal" if self.current_lang == 'tr' else "Cancel", 0, len(self.results), self
+            )
+            self.progress_dialog.setWindowTitle("Düzeltme Durumu" if self.current_lang == 'tr' else "Fix Status")
+            self.progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
+            self.progress_dialog.setAutoClose(False)
+            self.progress_dialog.setAutoReset(False)
+            self.progress_dialog.canceled.connect(self.cancel_rename)
+            self.progress_dialog.show()
+
+            # Adlandırma sürerken tarama ve dizin seçimi kapalıdır, depo değişmez
+            rules = NameRules(self.scanned_max_len, self.scanned_max_path,
+                              max_bytes=self.scanned_max_bytes, profile=self.scanned_profile)
+            self.rename_thread = RenameThread(self.results, workers=RENAME_WORKERS, journal=journal,
+                                              rules=rules)
+            self.rename_thread.signal_progress.connect(self.update_rename_progress)
+            self.rename_thread.signal_rename_finished.connect(self.rename_finished)
+            self.rename_thread.start()
+
+    def cancel_rename(self):
+        # Pencere adlandırma bitince kapatılırken de canceled yayılır; onu yok say
+        if self.progress_dialog is not None and self.rename_thread:
+            self.rename_thread.stop()
+
+    def update_rename_progress(self, done, total):
+        if self.progress_dialog is None:
+            return
+        # Adı değişmeyen öğeler adlandırılmaz; toplam sonuç sayısından az olabilir
+        self.progress_dialog.setMaximum(total)
+        self.progress_dialog.setValue(done)
+        self.progress_dialog.setLabelText(
+            f"Yeniden adlandırılıyor... {done}/{total}" if self.current_lang == 'tr' else f"Renaming... {done}/{total}")
+
+    def rename_finished(self, fixed_count, failed_count, interrupted):
+        if self.progress_dialog:
+            dialog = self.progress_dialog
+            self.progress_dialog = None
+            dialog.close()
+        self.result_model.clear()
+
+        info_title = "Bilgi" if self.current_lang == 'tr' else "Info"
+        info_text = f"{fixed_count} öğe başarıyla düzeltildi, {failed_count} öğe düzeltilemedi." if self.current_lang == 'tr' else f"{fixed_count} items fixed successfully, {failed_count} items failed to be fixed."
+        if interrupted:
+            info_text += "\nDüzeltme kullanıcı tarafından durduruldu; kalan öğeler için yeniden tarayın." if self.current_lang == 'tr' else "\nFixing was stopped by the user; scan again for the remaining items."
+        journal_path = self.rename_thread.journal.path
+        if fixed_count:
+            info_text += f"\n\nGeri almak için:\nfilenamefixer undo '{journal_path}'" if self.current_lang == 'tr' else f"\n\nTo undo:\nfilenamefixer undo '{journal_path}'"
+        errors = self.rename_thread.errors
+        if errors:
+            self.show_rename_errors(info_title, info_text, errors)
+        else:
+            QMessageBox.information(self, info_title, info_text)
+        self.scan_button.setEnabled(True)
+        self.select_dir_button.setEnabled(True)
+        self.max_len_input.setEnabled(True)
+        self.max_path_input.setEnabled(True)
+
+    def show_rename_errors(self, title, text, errors):
+        """Başarısız adlandırmaları tek pencerede özetler; rapor CSV olarak kaydedilebilir."""
+        lines = []
+        for code, message, count in errors.summary():
+            lines.append(f"{count} × {message}" + (f" (errno {code})" if code is not None else ""))
+        box = QMessageBox(QMessageBox.Icon.Warning, title, text + "\n\n" + "\n".join(lines), parent=self)
+
+        details = [f"{full_path}: {message}" for full_path, _code, message
+                   in itertools.islice(errors, ERROR_DETAIL_LIMIT)]
+        if len(errors) > ERROR_DETAIL_LIMIT:
+            more = len(errors) - ERROR_DETAIL_LIMIT
+            details.append(f"... ve {more} hata daha" if self.current_lang == 'tr' else f"... and {more} more errors")
+        box.setDetailedText("\n".join(details))
+
+        export_button = box.addButton("Raporu Kaydet..." if self.current_lang == 'tr' else "Save Report...",
+                                      QMessageBox.ButtonRole.ActionRole)
+        box.addButton(QMessageBox.StandardButton.Ok)
+        box.exec()
+        if box.clickedButton() is export_button:
+            self.export_rename_errors(errors)
+
+    def export_rename_errors(self, errors):
+        title = "Hata Raporunu Kaydet" if self.current_lang == 'tr' else "Save Error Report"
+        path, _ = QFileDialog.getSaveFileName(self, title,
+                                              os.path.join(os.path.expanduser("~"), "filenamefixer-errors.csv"),
+                                              "CSV (*.csv)")
+        if not path:
+            return
+        try:
+            errors.export(path)
+        except OSError as e:
+            error_title = "Hata" if self.current_lang == 'tr' else "Error"
+            error_text = f"Rapor kaydedilemedi: {e}" if self.current_lang == 'tr' else f"Could not save the report: {e}"
+            QMessageBox.critical(self, error_title, error_text)
+
+    def show_about_dialog(self):
+        copyright_line = "Telif Hakkı © 2025 A. Serhat KILIÇOĞLU"
+        if self.current_lang == 'tr':
+            about_text = f"""
+            <b>FileName Fixer v{VERSION}</b><br><br>
+            Lisans: GNU GPLv3<br>
+            Geliştirici: A. Serhat KILIÇOĞLU<br>
+            Github: <a href="https://www.github.com/shampuan">www.github.com/shampuan</a><br><br>
+            Hatalı ve uzun dosya adlarını Windows'ta sorun çıkmaması için düzeltir.<br>
+            Bu program hiçbir garanti getirmez.<br><br>
+            {copyright_line}
+            """
+            title = "Hakkında: FileName Fixer"
+        else:
+            about_text = f"""
+            <b>FileName Fixer v{VERSION}</b><br><br>
+            License: GNU GPLv3<br>
+            Developer: A. Serhat KILIÇOĞLU<br>
+            Github: <a href="https://www.github.com/shampuan">www.github.com/shampuan</a><br><br>
+            Fixes invalid and long file names to prevent issues on Windows.<br>
+            This program comes with no warranty.<br><br>
+            Copyright © 2025 A. Serhat KILIÇOĞLU
+            """
+            title = "About: FileName Fixer"
+        QMessageBox.about(self, title, about_text)
+
+    def closeEvent(self, event):
+        if self.scan_thread and self.scan_thread.isRunning():
+            self.scan_thread.stop()
+            self.scan_thread.wait()
+        if self.rename_thread and self.rename_thread.isRunning():
+            self.rename_thread.stop()
+            self.rename_thread.wait()
+        if self.progress_dialog:
+            dialog = self.progress_dialog
+            self.progress_dialog = None
+            dialog.close()
+        event.accept()
+
+def run(argv):
+    app = QApplication(argv)
+    window = LongFileNameFixerApp()
+    window.show()
+    return app.exec()
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+Adlandırma ve geri alma günlüğünün uçtan uca sınamaları.
+
+Geçici bir ağaç taranır, apply_renames günlükle uygulanır, undo_renames
+ile geri alınır ve geri alma ikinci kez çalıştırılır. Depo kökünden:
+
+    python3 -m pytest tests
+"""
+
+import errno
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'filenamefixer.3.0.0', 'usr', 'share', 'filenamefixer')
+
+if PACKAGE_DIR not in sys.path:
+    sys.path.insert(0, PACKAGE_DIR)
+
+from fixcore import NameRules, RenameErrors, apply_renames, scan_tree, undo_renames
+from fixcore import journal as journal_module
+from fixcore import renamer
+from fixcore.journal import RenameJournal, read_journal_buckets
+
+def write_file(path, content=''):
+    with open(path, 'w', encoding='utf-8') as stream:
+        stream.write(content)
+
+def read_file(path):
+    with open(path, encoding='utf-8') as stream:
+        return stream.read()
+
+def snapshot(root):
+    """Ağaçtaki her öğenin köke göreli yolu ve (dosyaysa) içeriği."""
+    tree = {}
+    for directory, dirs, files in os.walk(root):
+        for name in dirs:
+            tree[os.path.relpath(os.path.join(directory, name), root)] = None
+        for name in files:
+            path = os.path.join(directory, name)
+            tree[os.path.relpath(path, root)] = read_file(path)
+    return tree
+
+class RenameJournalTest(unittest.TestCase):
+
+    def setUp(self):
+        temp = tempfile.TemporaryDirectory(prefix='fnf_test_')
+        self.addCleanup(temp.cleanup)
+        self.root = os.path.join(temp.name, 'ağaç')
+        self.journal_path = os.path.join(temp.name, 'günlük.jsonl')
+        os.makedirs(os.path.join(self.root, 'klasör?', 'alt:'))
+        write_file(os.path.join(self.root, 'rapor?.txt'), 'rapor')
+        write_file(os.path.join(self.root, 'klasör?', 'not*.txt'), 'not')
+        write_file(os.path.join(self.root, 'klasör?', 'alt:', 'derin|.txt'), 'derin')
+        write_file(os.path.join(self.root, 'temiz.txt'), 'temiz')
+        self.rules = NameRules()
+
+    def scan(self):
+        return list(scan_tree(self.root, rules=self.rules))
+
+    def apply(self, items):
+        errors = RenameErrors()
+        with RenameJournal(self.journal_path) as journal:
+            counts = apply_renames(items, on_error=errors.add, journal=journal, rules=self.rules)
+        return counts, errors
+
+    def undo(self):
+        errors = RenameErrors()
+        return undo_renames(self.journal_path, on_error=errors.add), errors
+
+    def test_apply_undo_and_undo_again(self):
+        original = snapshot(self.root)
+        (fixed, failed), errors = self.apply(self.scan())
+        self.assertEqual((fixed, failed, len(errors)), (5, 0, 0))
+        self.assertEqual(snapshot(self.root), {
+            'klasör': None,
+            'klasör/alt': None,
+            'klasör/alt/derin.txt': 'derin',
+            'klasör/not.txt': 'not',
+            'rapor.txt': 'rapor',
+            'temiz.txt': 'temiz',
+        })
+
+        (restored, failed), errors = self.undo()
+        self.assertEqual((restored, failed, len(errors)), (5, 0, 0))
+        self.assertEqual(snapshot(self.root), original)
+
+        # Zaten geri alınmış adlandırmalar atlanır
+        (restored, failed), errors = self.undo()
+        self.assertEqual((restored, failed, len(errors)), (0, 0, 0))
+        self.assertEqual(snapshot(self.root), original)
+
+    def test_target_taken_after_scan_gets_suffix(self):
+        items = self.scan()
+        # Tarama ile adlandırma arasında hedef ad başkasınca alınır
+        write_file(os.path.join(self.root, 'rapor.txt'), 'başkası')
+        renamed = {}
+        with RenameJournal(self.journal_path) as journal:
+            fixed, failed = apply_renames(items, on_rename=renamed.__setitem__, journal=journal,
+                                          rules=self.rules)
+        self.assertEqual((fixed, failed), (5, 0))
+        self.assertEqual(renamed[os.path.join(self.root, 'rapor?.txt')],
+                         os.path.join(self.root, 'rapor_1.txt'))
+        self.assertEqual(read_file(os.path.join(self.root, 'rapor.txt')), 'başkası')
+        self.assertEqual(read_file(os.path.join(self.root, 'rapor_1.txt')), 'rapor')
+
+        # Günlükte aynı eski yolun iki kaydı var; geri alma sonuncuyu kullanır
+        (restored, failed), errors = self.undo()
+        self.assertEqual((restored, failed, len(errors)), (5, 0, 0))
+        self.assertEqual(read_file(os.path.join(self.root, 'rapor?.txt')), 'rapor')
+        self.assertEqual(read_file(os.path.join(self.root, 'rapor.txt')), 'başkası')
+        self.assertFalse(os.path.exists(os.path.join(self.root, 'rapor_1.txt')))
+
+    def test_undo_does_not_overwrite_existing_old_name(self):
+        original = snapshot(self.root)
+        self.apply(self.scan())
+        # Eski adı bu arada başka bir dosya almıştır
+        blocker = os.path.join(self.root, 'rapor?.txt')
+        write_file(blocker, 'yeni')
+
+        (restored, failed), errors = self.undo()
+        self.assertEqual((restored, failed), (4, 1))
+        self.assertEqual([code for code, _message, _count in errors.summary()], [errno.EEXIST])
+        self.assertEqual(read_file(blocker), 'yeni')
+        self.assertEqual(read_file(os.path.join(self.root, 'rapor.txt')), 'rapor')
+
+        # Engel kalkınca geri alma yeniden çalıştırılıp tamamlanabilir
+        os.remove(blocker)
+        (restored, failed), errors = self.undo()
+        self.assertEqual((restored, failed, len(errors)), (1, 0, 0))
+        self.assertEqual(snapshot(self.root), original)
+
+    def test_reverse_reading_across_blocks(self):
+        pairs = [[(f'/eski/{bucket}/{index}?', f'/yeni/{bucket}/{index}')
+                  for index in range(25)] for bucket in range(3)]
+        with RenameJournal(self.journal_path) as journal:
+            for bucket in pairs:
+                journal.begin_bucket()
+                journal.record(bucket)
+        expected = [[(new, old) for old, new in reversed(bucket)] for bucket in reversed(pairs)]
+        self.assertEqual(list(read_journal_buckets(self.journal_path)), expected)
+
+        # Satırlardan kısa bloklar: her satır birkaç bloğa bölünür
+        for block in (1, 7, 64):
+            with mock.patch.object(journal_module, '_READ_BLOCK', block):
+                self.assertEqual(list(read_journal_buckets(self.journal_path)), expected)
+
+    def test_apply_and_undo_with_small_read_block(self):
+        original = snapshot(self.root)
+        self.apply(self.scan())
+        # Yazılırken kesilmiş son satır (çökme) yok sayılır
+        with open(self.journal_path, 'a', encoding='utf-8') as stream:
+            stream.write(json.dumps(['/yarım', '/kayıt'])[:-3])
+        with mock.patch.object(journal_module, '_READ_BLOCK', 5):
+            (restored, failed), errors = self.undo()
+        self.assertEqual((restored, failed, len(errors)), (5, 0, 0))
+        self.assertEqual(snapshot(self.root), original)
+
+    def test_einval_falls_back_to_probe_and_rename(self):
+        calls = []
+
+        def renameat2(*args):
+            calls.append(args)
+            return -1
+
+        items = self.scan()
+        write_file(os.path.join(self.root, 'rapor.txt'), 'başkası')
+        # Dosya sistemi RENAME_NOREPLACE'i desteklemiyor
+        with mock.patch.object(renamer, '_renameat2', (renameat2, lambda: errno.EINVAL)):
+            (fixed, failed), errors = self.apply(items)
+            self.assertEqual((fixed, failed, len(errors)), (5, 0, 0))
+            # Bayrak reddedilince çalıştırmanın geri kalanında denenmez
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(read_file(os.path.join(self.root, 'rapor.txt')), 'başkası')
+            self.assertEqual(read_file(os.path.join(self.root, 'rapor_1.txt')), 'rapor')
+
+            (restored, failed), errors = self.undo()
+            self.assertEqual((restored, failed, len(errors)), (5, 0, 0))
+            self.assertEqual(len(calls), 2)
+        self.assertEqual(read_file(os.path.join(self.root, 'rapor?.txt')), 'rapor')
+        self.assertEqual(read_file(os.path.join(self.root, 'rapor.txt')), 'başkası')
+
+if __name__ == '__main__':
+    unittest.main()